@@ -6,9 +6,9 @@ from account.domain.account import Account
 class AccountRepositoryPort(ABC):
 
     @abstractmethod
-    def save(self, account: Account):
+    async def save(self, account: Account):
         pass
 
     @abstractmethod
-    def find_by_email(self, email: str):
+    async def find_by_email(self, email: str):
         pass
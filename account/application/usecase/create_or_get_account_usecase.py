@@ -19,8 +19,8 @@ class CreateOrGetAccountUsecase:
             cls.__instance = cls()
         return cls.__instance
 
-    def create_or_get_account(self, email: str, name: str | None):
-        account = self.repo.find_by_email(email)
+    async def create_or_get_account(self, email: str, name: str | None):
+        account = await self.repo.find_by_email(email)
         if account:
             return account
 
@@ -28,6 +28,6 @@ class CreateOrGetAccountUsecase:
             name = "noname"
 
         account = Account(email=email, name=name)
-        return self.repo.save(account)
+        return await self.repo.save(account)
 
 
@@ -2,17 +2,43 @@ import os
 
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI, BackgroundTasks
+from fastapi import FastAPI, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from config.database.session import Base, engine
+from config.database.count_cache import get_count_cache
+from config.database.pool_metrics import get_pool_metrics
+from config.database.query_cache import get_query_cache
+from config.database.session import (
+    Base,
+    engine,
+    ensure_indexes,
+    get_async_engine,
+    get_replica_set,
+    RequestDBScopeMiddleware,
+)
+from config.openai.llm_cache import get_llm_cache
+from config.openai.tts_audio_cache import get_tts_audio_cache
+from config.openai.llm_metrics import (
+    CONTENT_TYPE_LATEST,
+    USAGE_HEADER,
+    end_request_usage,
+    get_llm_metrics,
+    start_request_usage,
+)
 from crawling.adapter.input.web.crawling_router import crawling_router
 from custom_news_summary.adapter.input.web.custom_news_summary_router import custom_news_summary_router
 from login.adapter.input.web.google_oauth_router import login_router
 from login.adapter.input.web.logout_router import logout_router
 from news.adapter.input.web.news_router import news_router
+from news.infrastructure.repository.article_search_repository import (
+    ensure_search_indexes,
+    start_article_search_index,
+    stop_article_search_index,
+)
 from report_mail.infrastructure.scheduler import start_scheduler, job_send_daily_mail
 from weather.adapter.input.web.weather_router import weather_router
+from weather.infrastructure.repository.category_registry import get_category_registry
+from weather.infrastructure.repository.forecast_cache import get_forecast_cache
 
 
 load_dotenv()
@@ -34,8 +60,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[USAGE_HEADER],
 )
 
+
+@app.middleware("http")
+async def llm_usage_header(request: Request, call_next):
+    """요청 하나에서 발생한 LLM 호출 합계를 응답 헤더로 내려준다.
+
+    스트리밍(SSE) 응답은 헤더가 먼저 나가므로 본문 생성 중 호출은 합계에 포함되지 않는다.
+    """
+    usage, token = start_request_usage()
+    try:
+        response = await call_next(request)
+    finally:
+        end_request_usage(token)
+    if usage.calls:
+        response.headers[USAGE_HEADER] = usage.header_value()
+    return response
+
+
+# 요청마다 AsyncSession 하나 (처음 쓸 때 열고 응답 본문/백그라운드 작업이 끝난 뒤 닫음)
+app.add_middleware(RequestDBScopeMiddleware)
+
+
 # Routers
 app.include_router(login_router, prefix="/login")
 app.include_router(logout_router, prefix="/logout")
@@ -50,6 +98,28 @@ def on_startup():
     start_scheduler()
 
 
+@app.on_event("startup")
+async def start_replica_health_checks():
+    # 복제본이 설정된 경우에만 주기적으로 확인 (비정상 복제본은 읽기에서 제외)
+    get_replica_set().start_health_checks()
+
+
+@app.on_event("shutdown")
+async def stop_replica_health_checks():
+    await get_replica_set().stop_health_checks()
+
+
+@app.on_event("startup")
+async def start_search_index():
+    # MySQL FULLTEXT를 못 쓰는 환경이면 메모리 검색 색인을 백그라운드로 만든다 (그동안 /news/search는 503)
+    start_article_search_index(get_async_engine().dialect.name)
+
+
+@app.on_event("shutdown")
+async def stop_search_index():
+    await stop_article_search_index()
+
+
 @app.post("/report-mail/test")
 async def test_report_mail(background_tasks: BackgroundTasks):
     """테스트용: 즉시 메일 전송 트리거"""
@@ -57,9 +127,68 @@ async def test_report_mail(background_tasks: BackgroundTasks):
     return {"message": "Report mail task triggered in background"}
 
 
+@app.get("/llm-cache/stats")
+async def llm_cache_stats():
+    """LLM 응답 캐시 hit/miss 카운터"""
+    return get_llm_cache().stats()
+
+
+@app.get("/db-pool/stats")
+async def db_pool_stats():
+    """커넥션 풀 사용률 / checkout 대기 시간"""
+    return get_pool_metrics().stats()
+
+
+@app.get("/db-replicas/health")
+async def db_replicas_health():
+    """읽기 복제본 상태 (healthy=false면 읽기가 primary로 감)"""
+    return get_replica_set().stats()
+
+
+@app.get("/count-cache/stats")
+async def count_cache_stats():
+    """목록 total 캐시 hit/miss 카운터"""
+    return get_count_cache().stats()
+
+
+@app.get("/query-cache/stats")
+async def query_cache_stats():
+    """기사 목록/카테고리 캐시 tier별 hit, DB로 간 요청 수, 무효화 횟수"""
+    return get_query_cache().stats()
+
+
+@app.get("/category-registry/stats")
+async def category_registry_stats():
+    """메모리에 올린 카테고리 수, DB에서 다시 읽은 횟수"""
+    return get_category_registry().stats()
+
+
+@app.get("/weather-forecast-cache/stats")
+async def weather_forecast_cache_stats():
+    """도시별 예보 캐시 hit/miss (miss = OpenWeather 호출)"""
+    return get_forecast_cache().stats()
+
+
+@app.get("/tts-cache/stats")
+async def tts_cache_stats():
+    """TTS 음성 디스크 캐시 hit/miss, 파일 수/크기, LRU로 지운 수"""
+    return get_tts_audio_cache().stats()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint (LLM 호출 / DB 커넥션 풀 지표)"""
+    body = get_llm_metrics().render()
+    if body is None:
+        return Response("prometheus_client not installed\n", status_code=503, media_type="text/plain")
+    return Response(body, media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     host = os.getenv("APP_HOST", "0.0.0.0")
     port = int(os.getenv("APP_PORT", "33333"))
     # Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    ensure_indexes(bind=engine)
+    ensure_search_indexes(bind=engine)
     uvicorn.run(app, host=host, port=port)
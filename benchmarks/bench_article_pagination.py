@@ -0,0 +1,114 @@
+"""/news/articles OFFSET 페이지네이션 vs keyset(cursor) 페이지네이션 비교
+
+page 1 과 page 10,000 을 두 방식으로 조회해 걸린 시간을 출력한다.
+기본은 임시 SQLite 파일에 기사 N건을 채워서 실행하고, --sync-url/--async-url 로
+MySQL 등 실제 DB(이미 데이터가 있는 경우 --no-seed)를 지정할 수 있다.
+
+실행: python -m benchmarks.bench_article_pagination [--rows 220000] [--size 20] [--page 10000]
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from config.database.session import Base
+from news.infrastructure.orm.news_article_orm import NewsArticleORM
+from news.infrastructure.orm.publisher_orm import PublisherORM  # noqa: F401 (테이블 등록)
+from news.infrastructure.repository.news_repository import NewsRepository, encode_cursor
+from weather.infrastructure.orm.news_category_orm import NewsCategoryORM
+
+DEFAULT_SQLITE = "/tmp/bench_articles.db"
+
+
+def seed(sync_url: str, rows: int, categories: int = 5) -> None:
+    engine = create_engine(sync_url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(delete(NewsArticleORM))
+        conn.execute(delete(NewsCategoryORM))
+        conn.execute(
+            insert(NewsCategoryORM),
+            [{"category_id": i + 1, "category_name": f"category-{i + 1}"} for i in range(categories)],
+        )
+        base = datetime(2024, 1, 1)
+        batch = []
+        for i in range(rows):
+            # 같은 시각 기사가 섞이도록 30초 단위로 겹치게 생성
+            batch.append({
+                "article_id": i + 1,
+                "category_id": i % categories + 1,
+                "title": f"title {i}",
+                "content": "",
+                "url": f"https://example.com/{i}",
+                "published_at": base + timedelta(seconds=(i // 3) * 30),
+                "crawled_at": base,
+            })
+            if len(batch) == 10_000:
+                conn.execute(insert(NewsArticleORM), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(NewsArticleORM), batch)
+    engine.dispose()
+
+
+async def _best_ms(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best
+
+
+async def run(async_url: str, size: int, page: int, category_id, repeat: int) -> None:
+    engine = create_async_engine(async_url)
+    Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+    repo = NewsRepository()
+
+    async with Session() as db:
+        # page번째 페이지 직전 위치의 커서 (측정 대상 아님)
+        prev = await repo.list_articles(db=db, page=page - 1, size=size, category_id=category_id)
+        if not prev["items"]:
+            raise SystemExit(f"not enough rows for page {page}")
+        last = prev["items"][-1]
+        deep_cursor = encode_cursor(datetime.fromisoformat(last["published_at"]), last["article_id"])
+
+        cases = [
+            ("offset page 1", lambda: repo.list_articles(db=db, page=1, size=size, category_id=category_id)),
+            (f"offset page {page}", lambda: repo.list_articles(db=db, page=page, size=size, category_id=category_id)),
+            ("cursor page 1", lambda: repo.list_articles_after(db=db, size=size, category_id=category_id)),
+            (f"cursor page {page}", lambda: repo.list_articles_after(
+                db=db, size=size, cursor=deep_cursor, category_id=category_id)),
+        ]
+        offset_deep = await repo.list_articles(db=db, page=page, size=size, category_id=category_id)
+        cursor_deep = await repo.list_articles_after(db=db, size=size, cursor=deep_cursor, category_id=category_id)
+        same = [i["article_id"] for i in offset_deep["items"]] == [i["article_id"] for i in cursor_deep["items"]]
+        print(f"size={size} category_id={category_id} same rows at page {page}: {same}")
+
+        for name, func in cases:
+            print(f"{name:<20} {await _best_ms(func, repeat):9.2f} ms")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=220_000)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--category-id", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sync-url", default=f"sqlite:///{DEFAULT_SQLITE}")
+    parser.add_argument("--async-url", default=f"sqlite+aiosqlite:///{DEFAULT_SQLITE}")
+    parser.add_argument("--no-seed", action="store_true", help="이미 있는 데이터로 측정")
+    args = parser.parse_args()
+
+    if not args.no_seed:
+        seed(args.sync_url, args.rows)
+    asyncio.run(run(args.async_url, args.size, args.page, args.category_id, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
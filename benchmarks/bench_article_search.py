@@ -0,0 +1,138 @@
+"""/news/search 검색 지연 측정 (합성 한국어 기사 코퍼스, 기본 100만 건)
+
+기본은 임시 SQLite 파일에 기사를 채우고 프로세스 내 n-gram 인덱스로 측정한다
+(색인 시간 / 최대 RSS / 질의별 p50, p95). --sync-url/--async-url 로 MySQL을 주면
+ngram FULLTEXT 인덱스를 만들고 같은 질의를 MATCH ... AGAINST 로 측정한다.
+
+실행: python -m benchmarks.bench_article_search [--rows 1000000] [--repeat 20]
+      python -m benchmarks.bench_article_search --sync-url mysql+pymysql://... --async-url mysql+aiomysql://...
+"""
+import argparse
+import asyncio
+import random
+import resource
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from benchmarks.bench_text_compression import SENTENCES
+from config.database.session import Base
+from news.infrastructure.orm.news_article_orm import NewsArticleORM
+from news.infrastructure.orm.publisher_orm import PublisherORM  # noqa: F401 (테이블 등록)
+from news.infrastructure.repository.article_search_repository import (
+    FulltextArticleSearch,
+    NgramArticleIndex,
+    ensure_search_indexes,
+)
+from weather.infrastructure.orm.news_category_orm import NewsCategoryORM
+
+DEFAULT_SQLITE = "/tmp/bench_search.db"
+TOPICS = ["반도체", "부동산", "기준금리", "태풍", "선거", "배터리", "인공지능", "수출", "저출생", "환율"]
+QUERIES = ["반도체 수출", "기준금리", "인공지능", "태풍 피해", "국무회의 예산안", "저출생 대책"]
+
+
+def seed(sync_url: str, rows: int, categories: int = 5, seed_value: int = 11) -> None:
+    rnd = random.Random(seed_value)
+    engine = create_engine(sync_url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(delete(NewsArticleORM))
+        conn.execute(delete(NewsCategoryORM))
+        conn.execute(
+            insert(NewsCategoryORM),
+            [{"category_id": i + 1, "category_name": f"category-{i + 1}"} for i in range(categories)],
+        )
+        base = datetime(2024, 1, 1)
+        batch = []
+        for i in range(rows):
+            topic = rnd.choice(TOPICS)
+            content = " ".join(
+                rnd.choice(SENTENCES).format(n=rnd.randint(1, 3000), f=round(rnd.uniform(0.1, 9.9), 1))
+                for _ in range(rnd.randint(3, 8))
+            )
+            batch.append({
+                "article_id": i + 1,
+                "category_id": i % categories + 1,
+                "title": f"{topic} 관련 {rnd.choice(['속보', '분석', '전망', '현장'])} {i}",
+                "content": f"{topic} {content}",
+                "url": f"https://example.com/{i}",
+                "published_at": base + timedelta(seconds=i * 30),
+                "crawled_at": base,
+            })
+            if len(batch) == 20_000:
+                conn.execute(insert(NewsArticleORM), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(NewsArticleORM), batch)
+    engine.dispose()
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run(async_url: str, search, size: int, repeat: int) -> None:
+    engine = create_async_engine(async_url)
+    Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    if isinstance(search, NgramArticleIndex):
+        rss_before = _rss_mb()
+        started = time.perf_counter()
+        added = await search.refresh(Session)
+        print(f"indexed {added} articles in {time.perf_counter() - started:.1f}s, "
+              f"{len(search._postings)} tokens, max RSS +{_rss_mb() - rss_before:.0f} MB")
+
+    async with Session() as db:
+        print(f"backend={search.name} size={size} repeat={repeat}")
+        for category_id in (None, 2):
+            for q in QUERIES:
+                latencies = []
+                hits = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    hits = await search.search(db, q, limit=size + 1, category_id=category_id)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                # 2페이지(커서) 한 번
+                started = time.perf_counter()
+                if len(hits) > size:
+                    last = hits[size - 1]
+                    await search.search(db, q, limit=size + 1, category_id=category_id,
+                                        after=(last.score, last.article_id))
+                page2 = (time.perf_counter() - started) * 1000
+                latencies.sort()
+                p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+                print(f"  category={str(category_id):<4} q={q:<12} p50={statistics.median(latencies):8.1f} ms  "
+                      f"p95={p95:8.1f} ms  page2={page2:8.1f} ms  top={hits[0].article_id if hits else '-'}")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--sync-url", default=f"sqlite:///{DEFAULT_SQLITE}")
+    parser.add_argument("--async-url", default=f"sqlite+aiosqlite:///{DEFAULT_SQLITE}")
+    parser.add_argument("--no-seed", action="store_true", help="이미 있는 데이터로 측정")
+    args = parser.parse_args()
+
+    if not args.no_seed:
+        started = time.perf_counter()
+        seed(args.sync_url, args.rows)
+        print(f"seeded {args.rows} articles in {time.perf_counter() - started:.1f}s")
+
+    if args.sync_url.startswith("mysql"):
+        engine = create_engine(args.sync_url)
+        ensure_search_indexes(engine)
+        engine.dispose()
+        search = FulltextArticleSearch()
+    else:
+        search = NgramArticleIndex(batch_size=20_000)
+    asyncio.run(run(args.async_url, search, args.size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
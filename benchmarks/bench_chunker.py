@@ -0,0 +1,117 @@
+"""토큰 기반 청커 vs 기존 글자 수 기반 chunk_text 비교
+
+실행: python -m benchmarks.bench_chunker [--size-mb 1] [--model gpt-4.1]
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from common.token_chunker import chunk_by_tokens, count_tokens, get_encoding
+
+
+# ---------- 기존 구현 (비교용 사본) ----------
+def legacy_news_chunk_text(text: str, chunk_size: int = 3500, overlap: int = 300) -> List[str]:
+    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
+    chunks, cur = [], ""
+
+    for p in paragraphs:
+        if len(cur) + len(p) + 1 <= chunk_size:
+            cur = (cur + "\n" + p).strip() if cur else p
+        else:
+            if cur:
+                chunks.append(cur)
+            cur = p
+
+    if cur:
+        chunks.append(cur)
+
+    if overlap > 0 and len(chunks) > 1:
+        overlapped = []
+        for i, ch in enumerate(chunks):
+            if i == 0:
+                overlapped.append(ch)
+                continue
+            prev_tail = chunks[i - 1][-overlap:]
+            overlapped.append((prev_tail + "\n" + ch).strip())
+        chunks = overlapped
+
+    return chunks
+
+
+def legacy_documents_chunk_text(text: str, chunk_size=3500, overlap=300) -> List[str]:
+    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
+    chunks, cur = [], ""
+    for p in paragraphs:
+        if len(cur) + len(p) <= chunk_size:
+            cur += " " + p
+        else:
+            chunks.append(cur.strip())
+            cur = p
+    if cur:
+        chunks.append(cur.strip())
+    return chunks
+
+
+# ---------- 합성 한국어 뉴스 본문 ----------
+_SUBJECTS = ["정부는", "한국은행은", "서울시는", "전문가들은", "업계 관계자는", "국회는", "기상청은"]
+_OBJECTS = ["새로운 경제 정책을", "기준금리 동결을", "교통 개선안을", "반도체 수출 실적을", "예산안을"]
+_VERBS = ["발표했다.", "검토 중이라고 밝혔다.", "긍정적으로 평가했다.", "우려를 나타냈다.", "추진할 계획이다."]
+
+
+def make_corpus(size_bytes: int, seed: int = 42) -> str:
+    rnd = random.Random(seed)
+    paragraphs, total = [], 0
+    while total < size_bytes:
+        sentences = [
+            f"{rnd.choice(_SUBJECTS)} {rnd.randint(1, 2030)}년 {rnd.choice(_OBJECTS)} {rnd.choice(_VERBS)}"
+            for _ in range(rnd.randint(2, 8))
+        ]
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        total += len(paragraph.encode("utf-8")) + 1
+    return "\n".join(paragraphs)
+
+
+def _measure(name: str, func, text: str, model: str, repeat: int) -> None:
+    best = float("inf")
+    chunks: List[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunks = func(text)
+        best = min(best, time.perf_counter() - started)
+
+    token_counts = [count_tokens(c, model) for c in chunks] or [0]
+    mb = len(text.encode("utf-8")) / (1024 * 1024)
+    print(
+        f"{name:<22} chunks={len(chunks):>5}  time={best * 1000:>8.1f}ms  "
+        f"throughput={mb / best:>6.2f}MB/s  tokens/chunk max={max(token_counts):>5} "
+        f"avg={sum(token_counts) / len(token_counts):>7.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--model", default="gpt-4.1")
+    parser.add_argument("--max-tokens", type=int, default=1500)
+    parser.add_argument("--overlap-tokens", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = make_corpus(int(args.size_mb * 1024 * 1024))
+    print(f"corpus: {len(text.encode('utf-8'))} bytes, {len(text)} chars, encoding={getattr(get_encoding(args.model), 'name', '?')}")
+
+    _measure("legacy news chunk_text", legacy_news_chunk_text, text, args.model, args.repeat)
+    _measure("legacy docs chunk_text", legacy_documents_chunk_text, text, args.model, args.repeat)
+    _measure(
+        "chunk_by_tokens",
+        lambda t: chunk_by_tokens(t, model=args.model, max_tokens=args.max_tokens, overlap_tokens=args.overlap_tokens),
+        text,
+        args.model,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
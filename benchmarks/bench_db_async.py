@@ -0,0 +1,121 @@
+"""동기 Session(이벤트 루프 블로킹) vs AsyncSession 동시 요청 처리량 비교
+
+async 라우트 안에서 동기 Session으로 쿼리하던 기존 방식과 AsyncSession 방식에
+같은 조회를 동시에 N개 흘려보내고 처리량 / 지연 / 이벤트 루프 정지 시간을 출력한다.
+MySQL에서는 --sleep-ms 로 네트워크/쿼리 지연(SELECT SLEEP)을 흉내낼 수 있다.
+
+실행: python -m benchmarks.bench_db_async [--requests 200] [--concurrency 20] [--sleep-ms 20]
+      (기본은 .env의 MySQL, --sync-url/--async-url 로 다른 DB 지정 가능)
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from sqlalchemy import create_engine, desc, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from config.database import session as db_session
+from news.infrastructure.orm.news_article_orm import NewsArticleORM
+
+
+def _list_stmt():
+    return (
+        select(NewsArticleORM.article_id, NewsArticleORM.title, NewsArticleORM.published_at)
+        .order_by(desc(NewsArticleORM.published_at))
+        .limit(20)
+    )
+
+
+async def _loop_lag(stop: asyncio.Event, samples: List[float], interval: float = 0.005) -> None:
+    # 이벤트 루프가 막히면 sleep이 늦게 깨어나므로 그 초과분을 기록
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def _run(name: str, request, total: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def _one():
+        async with semaphore:
+            started = time.perf_counter()
+            await request()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    lag: List[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_loop_lag(stop, lag))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[_one() for _ in range(total)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await lag_task
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{name:<14} {total / elapsed:8.1f} req/s  "
+        f"p50={statistics.median(latencies):7.1f}ms  p95={p95:7.1f}ms  "
+        f"max loop stall={max(lag, default=0):7.1f}ms"
+    )
+
+
+async def main_async(args) -> None:
+    sync_url = args.sync_url or db_session.DATABASE_URL
+    async_url = args.async_url or db_session.ASYNC_DATABASE_URL
+    sleep_sql = text("SELECT SLEEP(:s)") if args.sleep_ms else None
+    params = {"s": args.sleep_ms / 1000}
+
+    sync_engine = create_engine(sync_url, pool_size=args.concurrency, pool_pre_ping=True)
+    SyncSession = sessionmaker(bind=sync_engine)
+    async_engine = create_async_engine(async_url, pool_size=args.concurrency, pool_pre_ping=True)
+    AsyncSession = async_sessionmaker(bind=async_engine)
+
+    async def before():
+        # 기존 async 라우트: 동기 Session 호출이 이벤트 루프를 그대로 막음
+        db = SyncSession()
+        try:
+            if sleep_sql is not None:
+                db.execute(sleep_sql, params)
+            db.execute(_list_stmt()).all()
+        finally:
+            db.close()
+
+    async def after():
+        async with AsyncSession() as db:
+            if sleep_sql is not None:
+                await db.execute(sleep_sql, params)
+            (await db.execute(_list_stmt())).all()
+
+    # 커넥션 풀 워밍업
+    await before()
+    await after()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} sleep_ms={args.sleep_ms}")
+    await _run("sync Session", before, args.requests, args.concurrency)
+    await _run("AsyncSession", after, args.requests, args.concurrency)
+
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--sleep-ms", type=int, default=20, help="쿼리마다 추가할 SELECT SLEEP (MySQL 전용, 0이면 생략)")
+    parser.add_argument("--sync-url", default=None)
+    parser.add_argument("--async-url", default=None)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""NewsArticle.content 압축률 / 압축·해제 비용 비교 (평문 vs zstd vs zstd+사전)
+
+기사 본문 샘플의 80%로 사전을 학습하고, 나머지 20%로 저장 크기와
+행 단위 encode/decode 시간을 측정한다. --sync-url 을 주면 실제 NewsArticle.content를,
+아니면 한국어 뉴스 문장을 조합한 합성 기사를 사용한다.
+
+실행: python -m benchmarks.bench_text_compression [--rows 2000] [--level 6] [--sync-url mysql+pymysql://...]
+"""
+import argparse
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine, desc, literal_column, select
+
+from config.database.compressed_text import DEFAULT_DICT_SIZE, TextCodec, train_dictionary
+
+SENTENCES = [
+    "정부는 {n}일 국무회의에서 내년도 예산안을 의결했다고 밝혔다.",
+    "한국은행은 기준금리를 연 {f}%로 동결하기로 결정했다.",
+    "서울 아파트 매매가격은 {n}주 연속 상승세를 이어갔다.",
+    "코스피는 전 거래일보다 {f}% 오른 {n}선에서 장을 마감했다.",
+    "기상청은 내일 전국에 비가 내리고 기온이 평년보다 {n}도 낮겠다고 예보했다.",
+    "업계 관계자는 \"하반기 수요 회복이 관건\"이라고 말했다.",
+    "이번 조치는 다음 달 {n}일부터 시행될 예정이다.",
+    "여야는 법안 처리를 두고 이견을 좁히지 못한 것으로 알려졌다.",
+    "삼성전자와 SK하이닉스의 반도체 수출이 전년 대비 {f}% 증가했다.",
+    "경찰은 정확한 사고 경위를 조사하고 있다.",
+    "전문가들은 물가 상승 압력이 당분간 이어질 것으로 내다봤다.",
+    "해당 지역에는 {n}명의 주민이 대피한 것으로 집계됐다.",
+]
+
+
+def synthetic_articles(rows: int, seed: int = 7) -> list[str]:
+    rnd = random.Random(seed)
+    articles = []
+    for i in range(rows):
+        body = " ".join(
+            rnd.choice(SENTENCES).format(n=rnd.randint(1, 3000), f=round(rnd.uniform(0.1, 9.9), 1))
+            for _ in range(rnd.randint(15, 60))
+        )
+        articles.append(f"[기자 {i}] {body}\n저작권자 © 무단 전재 및 재배포 금지")
+    return articles
+
+
+def db_articles(sync_url: str, rows: int) -> list[str]:
+    engine = create_engine(sync_url)
+    codec = TextCodec(enabled=False)
+    with engine.connect() as conn:
+        values = conn.execute(
+            select(literal_column("content"))
+            .select_from(literal_column("NewsArticle"))
+            .where(literal_column("content").is_not(None))
+            .order_by(desc(literal_column("article_id")))
+            .limit(rows)
+        ).scalars().all()
+    engine.dispose()
+    return [t for t in (codec.decode(v) for v in values) if t]
+
+
+def measure(name: str, codec: TextCodec, texts: list[str], raw_bytes: int) -> None:
+    started = time.perf_counter()
+    encoded = [codec.encode(t, force=True) for t in texts]
+    encode_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for value in encoded:
+        codec.decode(value)
+    decode_s = time.perf_counter() - started
+
+    stored = sum(len(e) for e in encoded)
+    print(
+        f"{name:<16} stored={stored / 1024:9.1f} KiB  ratio={stored / raw_bytes:6.3f}  "
+        f"encode={encode_s / len(texts) * 1e6:7.1f} us/row  "
+        f"decode={decode_s / len(texts) * 1e6:7.1f} us/row ({raw_bytes / decode_s / 1e6:6.1f} MB/s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--level", type=int, default=6)
+    parser.add_argument("--dict-size", type=int, default=DEFAULT_DICT_SIZE)
+    parser.add_argument("--sync-url", default=None, help="실제 DB의 NewsArticle.content로 측정")
+    args = parser.parse_args()
+
+    texts = db_articles(args.sync_url, args.rows) if args.sync_url else synthetic_articles(args.rows)
+    split = int(len(texts) * 0.8)
+    train, test = texts[:split], texts[split:]
+    raw_bytes = sum(len(t.encode("utf-8")) for t in test)
+    print(f"rows={len(texts)} (train={len(train)}, test={len(test)}) test raw={raw_bytes / 1024:.1f} KiB "
+          f"avg={raw_bytes / len(test):.0f} B/row")
+
+    with tempfile.TemporaryDirectory() as dict_dir:
+        path = train_dictionary(train, dict_size=args.dict_size, dict_dir=dict_dir)
+        dict_name = path.rsplit("/", 1)[-1]
+        measure("zstd", TextCodec(enabled=True, level=args.level, dict_dir=dict_dir, dict_name=""), test, raw_bytes)
+        measure("zstd + dict", TextCodec(enabled=True, level=args.level, dict_dir=dict_dir, dict_name=dict_name),
+                test, raw_bytes)
+
+
+if __name__ == "__main__":
+    main()
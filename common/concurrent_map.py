@@ -0,0 +1,74 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Sequence
+
+DEFAULT_MAP_CONCURRENCY = int(os.getenv("LLM_MAP_CONCURRENCY", "4"))
+
+
+@dataclass
+class MapResult:
+    """map 단계 한 건의 결과 (원래 순서의 index 포함)"""
+    index: int
+    value: Any
+    elapsed_ms: float
+
+
+def resolve_concurrency(concurrency: int | None) -> int:
+    return max(1, concurrency or DEFAULT_MAP_CONCURRENCY)
+
+
+def _spawn(
+    func: Callable[[int, Any], Awaitable[Any]],
+    items: Sequence[Any],
+    concurrency: int | None,
+) -> List[asyncio.Future]:
+    semaphore = asyncio.Semaphore(resolve_concurrency(concurrency))
+
+    async def _run(index: int, item: Any) -> MapResult:
+        async with semaphore:
+            started = time.perf_counter()
+            value = await func(index, item)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        return MapResult(index=index, value=value, elapsed_ms=round(elapsed_ms, 1))
+
+    return [asyncio.ensure_future(_run(i, item)) for i, item in enumerate(items)]
+
+
+async def concurrent_map(
+    func: Callable[[int, Any], Awaitable[Any]],
+    items: Sequence[Any],
+    concurrency: int | None = None,
+) -> List[MapResult]:
+    """items 각각에 func(index, item)을 최대 concurrency개까지 동시에 실행한다.
+
+    결과는 완료 순서와 상관없이 입력 순서대로 반환되며, 하나라도 실패하면
+    남은 작업을 취소하고 예외를 그대로 올린다.
+    """
+    tasks = _spawn(func, items, concurrency)
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def iter_concurrent_map(
+    func: Callable[[int, Any], Awaitable[Any]],
+    items: Sequence[Any],
+    concurrency: int | None = None,
+) -> AsyncIterator[MapResult]:
+    """concurrent_map과 같지만 끝나는 순서대로 결과를 하나씩 내보낸다 (스트리밍용)"""
+    tasks = _spawn(func, items, concurrency)
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def timings_of(results: List[MapResult]) -> List[dict]:
+    return [{"chunk": r.index + 1, "elapsed_ms": r.elapsed_ms} for r in results]
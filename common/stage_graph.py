@@ -0,0 +1,131 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class Stage:
+    """의존 관계가 있는 비동기 단계 하나
+
+    func는 의존 단계들의 결과를 {이름: 값} dict로 받는다.
+    required=False인 단계는 실패/타임아웃 시 fallback 값으로 대체되고 나머지 단계는 계속 진행된다.
+    """
+    name: str
+    func: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Sequence[str] = ()
+    timeout: Optional[float] = None
+    required: bool = True
+    fallback: Any = None
+
+
+@dataclass
+class StageOutcome:
+    name: str
+    value: Any
+    status: str  # ok | failed | timeout
+    elapsed_ms: float
+    error: Optional[str] = None
+
+    def meta(self) -> dict:
+        data = {"status": self.status, "elapsed_ms": self.elapsed_ms}
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+@dataclass
+class StageGraphResult:
+    values: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, dict] = field(default_factory=dict)
+
+
+class StageGraph:
+    """서로 독립인 단계는 동시에 실행하는 작은 DAG 실행기"""
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = self._topological_order(stages)
+
+    @staticmethod
+    def _topological_order(stages: List[Stage]) -> List[Stage]:
+        by_name = {s.name: s for s in stages}
+        if len(by_name) != len(stages):
+            raise ValueError("Duplicate stage name")
+
+        ordered: List[Stage] = []
+        visiting, visited = set(), set()
+
+        def _visit(stage: Stage):
+            if stage.name in visited:
+                return
+            if stage.name in visiting:
+                raise ValueError(f"Stage dependency cycle at '{stage.name}'")
+            visiting.add(stage.name)
+            for dep in stage.depends_on:
+                if dep in by_name:
+                    _visit(by_name[dep])
+            visiting.discard(stage.name)
+            visited.add(stage.name)
+            ordered.append(stage)
+
+        for s in stages:
+            _visit(s)
+        return ordered
+
+    async def iter_run(self, initial: Optional[Dict[str, Any]] = None) -> AsyncIterator[StageOutcome]:
+        """단계가 끝나는 순서대로 StageOutcome을 내보낸다.
+
+        initial에 있는 값은 이미 끝난 단계로 취급한다. required 단계가 실패하면
+        나머지 단계를 취소하고 원래 예외를 그대로 올린다.
+        """
+        initial = dict(initial or {})
+        tasks: Dict[str, asyncio.Task] = {}
+
+        for stage in self.stages:
+            missing = [d for d in stage.depends_on if d not in initial and d not in tasks]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {missing}")
+            tasks[stage.name] = asyncio.ensure_future(self._execute(stage, tasks, initial))
+
+        try:
+            for next_done in asyncio.as_completed(list(tasks.values())):
+                yield await next_done
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def run(self, initial: Optional[Dict[str, Any]] = None) -> StageGraphResult:
+        result = StageGraphResult()
+        async for outcome in self.iter_run(initial):
+            result.values[outcome.name] = outcome.value
+            result.metadata[outcome.name] = outcome.meta()
+        return result
+
+    @staticmethod
+    async def _execute(stage: Stage, tasks: Dict[str, asyncio.Task], initial: Dict[str, Any]) -> StageOutcome:
+        inputs = {}
+        for dep in stage.depends_on:
+            inputs[dep] = (await tasks[dep]).value if dep in tasks else initial[dep]
+
+        started = time.perf_counter()
+
+        def _elapsed() -> float:
+            return round((time.perf_counter() - started) * 1000, 1)
+
+        try:
+            if stage.timeout:
+                value = await asyncio.wait_for(stage.func(inputs), timeout=stage.timeout)
+            else:
+                value = await stage.func(inputs)
+        except asyncio.TimeoutError:
+            if stage.required:
+                raise
+            print(f"[WARN] stage '{stage.name}' timed out after {stage.timeout}s")
+            return StageOutcome(stage.name, stage.fallback, "timeout", _elapsed(), f"timeout after {stage.timeout}s")
+        except Exception as e:
+            if stage.required:
+                raise
+            print(f"[WARN] stage '{stage.name}' failed: {type(e).__name__}: {e}")
+            return StageOutcome(stage.name, stage.fallback, "failed", _elapsed(), f"{type(e).__name__}: {e}")
+
+        return StageOutcome(stage.name, value, "ok", _elapsed())
@@ -0,0 +1,132 @@
+import os
+import re
+from functools import lru_cache
+from typing import List, Sequence
+
+DEFAULT_CHUNK_MAX_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", "1500"))
+DEFAULT_CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", "120"))
+
+# 문장 단위: 종결 부호(+닫는 따옴표/괄호)와 뒤따르는 공백, 또는 줄바꿈까지
+_SENTENCE_RE = re.compile(r"[^.!?。\n]*(?:[.!?。]+[\"'”’)\]]*[ \t]*|\n+|$)")
+
+# tiktoken이 없을 때 쓰는 근사 토큰: 한글/한자 1글자, 영문/숫자 최대 4글자, 공백+기호 1개
+_HEURISTIC_TOKEN_RE = re.compile(r"\s*(?:[가-힣ㄱ-ㅎㅏ-ㅣ一-鿿]|[A-Za-z]{1,4}|[0-9]{1,3}|[^\sA-Za-z0-9가-힣])|\s+")
+
+
+class _HeuristicEncoding:
+    """tiktoken 인코딩과 같은 모양(encode/decode_bytes)의 근사 토크나이저"""
+
+    name = "heuristic"
+
+    def encode_ordinary(self, text: str) -> List[str]:
+        return _HEURISTIC_TOKEN_RE.findall(text)
+
+    def encode_ordinary_batch(self, texts: Sequence[str]) -> List[List[str]]:
+        return [self.encode_ordinary(t) for t in texts]
+
+    def decode_bytes(self, tokens: Sequence[str]) -> bytes:
+        return "".join(tokens).encode("utf-8")
+
+
+def _encoding_name(model: str) -> str:
+    if model.startswith(("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")):
+        return "o200k_base"
+    return "cl100k_base"
+
+
+@lru_cache(maxsize=8)
+def get_encoding(model: str):
+    """모델에 맞는 tiktoken 인코딩. 설치/다운로드가 안 되면 근사 토크나이저로 대체"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(_encoding_name(model))
+    except Exception as e:
+        print(f"[WARN] tiktoken unavailable for {model}, using heuristic token counts: {type(e).__name__}")
+        return _HeuristicEncoding()
+
+
+def count_tokens(text: str, model: str = "gpt-4.1") -> int:
+    return len(get_encoding(model).encode_ordinary(text or ""))
+
+
+def _split_sentences(text: str) -> List[str]:
+    return [m.group(0) for m in _SENTENCE_RE.finditer(text) if m.group(0)]
+
+
+def _decode(encoding, tokens: Sequence, carry: bytes = b"") -> tuple[str, bytes]:
+    """토큰을 문자열로 바꾸고, 토큰 경계에서 잘린 UTF-8 바이트는 carry로 돌려준다."""
+    raw = carry + encoding.decode_bytes(tokens)
+    cut = len(raw)
+    # 끝에서 최대 3바이트 안에 완성되지 않은 멀티바이트 문자가 있는지 확인
+    for i in range(1, min(4, len(raw)) + 1):
+        byte = raw[-i]
+        if byte & 0xC0 == 0x80:
+            continue
+        if byte & 0x80:
+            needed = 2 if byte & 0xE0 == 0xC0 else 3 if byte & 0xF0 == 0xE0 else 4
+            if needed > i:
+                cut = len(raw) - i
+        break
+    return raw[:cut].decode("utf-8", errors="ignore"), raw[cut:]
+
+
+def _decode_tail(encoding, tokens: Sequence) -> str:
+    # 앞쪽이 문자 중간에서 잘렸으면 continuation byte를 버린다
+    raw = encoding.decode_bytes(tokens)
+    start = 0
+    while start < len(raw) and raw[start] & 0xC0 == 0x80:
+        start += 1
+    return raw[start:].decode("utf-8", errors="ignore")
+
+
+def chunk_by_tokens(
+    text: str,
+    model: str = "gpt-4.1",
+    max_tokens: int = DEFAULT_CHUNK_MAX_TOKENS,
+    overlap_tokens: int = DEFAULT_CHUNK_OVERLAP_TOKENS,
+) -> List[str]:
+    """모델 토큰 예산 기준으로 문장 경계를 지키며 텍스트를 나눈다.
+
+    각 청크는 max_tokens 이내이고, 두 번째 청크부터는 앞 청크의 마지막
+    overlap_tokens 토큰을 앞에 붙인다. 예산보다 긴 문장만 토큰 단위로 자른다.
+    """
+    if not (text or "").strip():
+        return []
+    if overlap_tokens >= max_tokens:
+        raise ValueError("overlap_tokens must be smaller than max_tokens")
+
+    encoding = get_encoding(model)
+    budget = max_tokens - overlap_tokens
+
+    sentences = _split_sentences(text)
+    sentence_tokens = encoding.encode_ordinary_batch(sentences)
+
+    bodies: List[List] = []
+    current: List = []
+    for tokens in sentence_tokens:
+        if len(tokens) > budget:
+            # 예산보다 긴 문장은 토큰 단위로 강제 분할
+            if current:
+                bodies.append(current)
+                current = []
+            for start in range(0, len(tokens), budget):
+                bodies.append(list(tokens[start:start + budget]))
+            continue
+        if current and len(current) + len(tokens) > budget:
+            bodies.append(current)
+            current = []
+        current.extend(tokens)
+    if current:
+        bodies.append(current)
+
+    chunks: List[str] = []
+    carry = b""
+    prev_tokens: List = []
+    for body in bodies:
+        body_text, carry = _decode(encoding, body, carry)
+        if prev_tokens and overlap_tokens > 0:
+            body_text = _decode_tail(encoding, prev_tokens[-overlap_tokens:]) + body_text
+        if body_text.strip():
+            chunks.append(body_text.strip())
+        prev_tokens = body
+    return chunks
@@ -0,0 +1,111 @@
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Sequence
+
+from common.concurrent_map import concurrent_map
+from common.token_chunker import count_tokens
+
+DEFAULT_REDUCE_INPUT_TOKENS = int(os.getenv("REDUCE_INPUT_TOKENS", "6000"))
+MAX_REDUCE_LEVELS = 8
+
+
+@dataclass
+class TreeReduceResult:
+    """트리 reduce 결과 (depth = 중간 단계 수 + 최종 1단계)"""
+    value: str
+    depth: int
+    levels: List[dict] = field(default_factory=list)
+
+    def meta(self) -> dict:
+        return {"depth": self.depth, "levels": self.levels}
+
+
+def group_by_budget(texts: Sequence[str], budget: int, model: str = "gpt-4.1") -> List[List[str]]:
+    """순서를 유지하면서 토큰 합이 budget을 넘지 않게 texts를 묶는다.
+
+    단계마다 개수가 반드시 줄어들도록 한 그룹에는 최소 2개를 넣는다
+    (혼자서 budget을 넘는 요약이 있어도 무한 반복하지 않게).
+    """
+    groups: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = count_tokens(text, model=model)
+        if current and current_tokens + tokens > budget and len(current) >= 2:
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        if len(current) == 1 and groups:
+            groups[-1].append(current[0])
+        else:
+            groups.append(current)
+    return groups
+
+
+async def reduce_until_fits(
+    texts: Sequence[str],
+    reduce_group: Callable[[int, List[str]], Awaitable[str]],
+    budget: int | None = None,
+    model: str = "gpt-4.1",
+    concurrency: int | None = None,
+) -> tuple[List[str], List[dict]]:
+    """최종 프롬프트 하나에 들어갈 때까지 그룹 단위 중간 reduce를 반복한다.
+
+    반환값은 (최종 reduce에 넣을 texts, 중간 단계별 timing 목록).
+    최종 호출은 호출 측이 직접 한다 (스트리밍 등).
+    """
+    budget = budget or DEFAULT_REDUCE_INPUT_TOKENS
+    current = list(texts)
+    levels: List[dict] = []
+
+    while len(current) > 1 and count_tokens("\n".join(current), model=model) > budget:
+        if len(levels) >= MAX_REDUCE_LEVELS:
+            print(f"[WARN] tree reduce stopped after {MAX_REDUCE_LEVELS} levels ({len(current)} inputs left)")
+            break
+
+        groups = group_by_budget(current, budget, model=model)
+        started = time.perf_counter()
+        results = await concurrent_map(reduce_group, groups, concurrency=concurrency)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        levels.append({
+            "level": len(levels) + 1,
+            "inputs": len(current),
+            "groups": len(groups),
+            "elapsed_ms": round(elapsed_ms, 1),
+            "max_group_ms": max(r.elapsed_ms for r in results),
+        })
+        current = [r.value for r in results]
+
+    return current, levels
+
+
+async def tree_reduce(
+    texts: Sequence[str],
+    reduce_group: Callable[[int, List[str]], Awaitable[str]],
+    final_reduce: Callable[[List[str]], Awaitable[str]],
+    budget: int | None = None,
+    model: str = "gpt-4.1",
+    concurrency: int | None = None,
+) -> TreeReduceResult:
+    """부분 요약들을 budget 안에 들어가는 그룹으로 묶어 단계별로 동시에 줄이고,
+    하나의 프롬프트에 들어가면 final_reduce로 최종 요약을 만든다.
+    """
+    remaining, levels = await reduce_until_fits(
+        texts, reduce_group, budget=budget, model=model, concurrency=concurrency
+    )
+
+    started = time.perf_counter()
+    value = await final_reduce(remaining)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    levels.append({
+        "level": len(levels) + 1,
+        "inputs": len(remaining),
+        "groups": 1,
+        "elapsed_ms": round(elapsed_ms, 1),
+        "max_group_ms": round(elapsed_ms, 1),
+    })
+    return TreeReduceResult(value=value, depth=len(levels), levels=levels)
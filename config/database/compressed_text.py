@@ -0,0 +1,171 @@
+import glob
+import os
+import threading
+from typing import Dict, Iterable, Optional, Union
+
+from dotenv import load_dotenv
+from sqlalchemy import LargeBinary, Text
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import zstandard
+except ImportError:  # 압축을 켜지 않으면 없어도 동작 (압축된 행 읽기만 불가)
+    zstandard = None
+
+load_dotenv()
+
+# off: 평문 저장 / zstd: 새로 쓰는 값을 zstd로 압축 (읽기는 설정과 관계없이 둘 다 처리)
+TEXT_COMPRESSION = os.getenv("TEXT_COMPRESSION", "off").lower()
+TEXT_ZSTD_LEVEL = int(os.getenv("TEXT_ZSTD_LEVEL", "6"))
+TEXT_ZSTD_DICT_DIR = os.getenv("TEXT_ZSTD_DICT_DIR", "./zstd_dicts")
+# 압축에 쓸 사전 파일 이름 (TEXT_ZSTD_DICT_DIR 기준, 비우면 사전 없이 압축)
+TEXT_ZSTD_DICT = os.getenv("TEXT_ZSTD_DICT", "")
+# 이보다 짧은 값은 압축 이득이 없어 평문(utf-8)으로 둔다
+TEXT_COMPRESS_MIN_BYTES = int(os.getenv("TEXT_COMPRESS_MIN_BYTES", "128"))
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"  # utf-8 텍스트는 이 바이트로 시작할 수 없어 평문과 구분됨
+DEFAULT_DICT_SIZE = 112_640
+
+
+def is_compressed(raw: Union[bytes, str, None]) -> bool:
+    return isinstance(raw, (bytes, bytearray, memoryview)) and bytes(raw[:4]) == ZSTD_MAGIC
+
+
+class TextCodec:
+    """zstd(+학습된 사전) 텍스트 압축/해제
+
+    사전은 frame 헤더의 dict_id로 찾으므로 사전을 새로 학습해도 이전 사전으로
+    압축된 행을 그대로 읽을 수 있다 (사전 파일은 지우지 말 것).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = TEXT_COMPRESSION == "zstd",
+        level: int = TEXT_ZSTD_LEVEL,
+        dict_dir: str = TEXT_ZSTD_DICT_DIR,
+        dict_name: str = TEXT_ZSTD_DICT,
+        min_bytes: int = TEXT_COMPRESS_MIN_BYTES,
+    ):
+        if enabled and zstandard is None:
+            print("[WARN] TEXT_COMPRESSION=zstd but zstandard is not installed, storing plain text")
+            enabled = False
+        self.enabled = enabled
+        self.level = level
+        self.min_bytes = min_bytes
+        self._dicts: Dict[int, "zstandard.ZstdCompressionDict"] = {}
+        self._active_dict = None
+        self._local = threading.local()  # Zstd(De)Compressor는 스레드 간 공유 불가
+
+        if zstandard is None:
+            return
+        for path in sorted(glob.glob(os.path.join(dict_dir, "*.dict"))):
+            d = _load_dict(path)
+            self._dicts[d.dict_id()] = d
+            if dict_name and os.path.basename(path) == dict_name:
+                self._active_dict = d
+        if dict_name and self._active_dict is None:
+            print(f"[WARN] zstd dictionary {dict_name} not found in {dict_dir}, compressing without dictionary")
+
+    @property
+    def dict_id(self) -> int:
+        return self._active_dict.dict_id() if self._active_dict is not None else 0
+
+    def _compressor(self):
+        c = getattr(self._local, "compressor", None)
+        if c is None:
+            c = zstandard.ZstdCompressor(level=self.level, dict_data=self._active_dict)
+            self._local.compressor = c
+        return c
+
+    def _decompressor(self, dict_id: int):
+        cache = getattr(self._local, "decompressors", None)
+        if cache is None:
+            cache = self._local.decompressors = {}
+        d = cache.get(dict_id)
+        if d is None:
+            if dict_id and dict_id not in self._dicts:
+                raise ValueError(f"zstd dictionary {dict_id} is not available in {TEXT_ZSTD_DICT_DIR}")
+            d = zstandard.ZstdDecompressor(dict_data=self._dicts.get(dict_id))
+            cache[dict_id] = d
+        return d
+
+    def encode(self, text: Optional[str], force: bool = False) -> Union[bytes, str, None]:
+        """force=True면 enabled 설정과 관계없이 압축 (migration용)"""
+        if text is None or not (self.enabled or force):
+            return text
+        raw = text.encode("utf-8")
+        if len(raw) < self.min_bytes or zstandard is None:
+            return raw
+        compressed = self._compressor().compress(raw)
+        return compressed if len(compressed) < len(raw) else raw
+
+    def decode(self, value: Union[bytes, str, None]) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if not is_compressed(value):
+            return value.decode("utf-8")
+        if zstandard is None:
+            raise RuntimeError("compressed text column read but zstandard is not installed")
+        dict_id = zstandard.get_frame_parameters(value).dict_id
+        return self._decompressor(dict_id).decompress(value).decode("utf-8")
+
+
+def _load_dict(path: str):
+    with open(path, "rb") as f:
+        return zstandard.ZstdCompressionDict(f.read())
+
+
+def train_dictionary(samples: Iterable[str], dict_size: int = DEFAULT_DICT_SIZE, dict_dir: str = TEXT_ZSTD_DICT_DIR,
+                     prefix: str = "news_ko") -> str:
+    """샘플 텍스트로 zstd 사전을 학습해 dict_dir/<prefix>-<dict_id>.dict 로 저장하고 경로를 반환"""
+    if zstandard is None:
+        raise RuntimeError("zstandard is not installed")
+    data = [s.encode("utf-8") for s in samples if s]
+    trained = zstandard.train_dictionary(dict_size, data)
+    os.makedirs(dict_dir, exist_ok=True)
+    path = os.path.join(dict_dir, f"{prefix}-{trained.dict_id()}.dict")
+    with open(path, "wb") as f:
+        f.write(trained.as_bytes())
+    return path
+
+
+_text_codec_instance: Optional[TextCodec] = None
+_text_codec_lock = threading.Lock()
+
+
+def get_text_codec() -> TextCodec:
+    global _text_codec_instance
+    with _text_codec_lock:
+        if _text_codec_instance is None:
+            _text_codec_instance = TextCodec()
+        return _text_codec_instance
+
+
+class CompressedText(TypeDecorator):
+    """읽을 때 자동으로 풀리는 텍스트 컬럼
+
+    TEXT_COMPRESSION=zstd 이면 쓰기 시 압축한다. 기존 TEXT 컬럼은
+    `python -m news.adapter.input.cli.text_compression_command migrate` 로
+    LONGBLOB으로 바꾸고 기존 행을 압축한 뒤 켠다. 평문/압축 행이 섞여 있어도 읽을 수 있다.
+    always=True면 설정과 관계없이 항상 압축한다 (아카이브 테이블 등).
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def __init__(self, *args, always: bool = False, **kwargs):
+        self.always = always
+        super().__init__(*args, **kwargs)
+
+    def load_dialect_impl(self, dialect):
+        if self.always or get_text_codec().enabled:
+            return dialect.type_descriptor(LONGBLOB() if dialect.name == "mysql" else LargeBinary())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        return get_text_codec().encode(value, force=self.always)
+
+    def process_result_value(self, value, dialect):
+        return get_text_codec().decode(value)
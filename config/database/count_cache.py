@@ -0,0 +1,113 @@
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from config.redis.redis_tier import RedisTier
+
+load_dotenv()
+
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "300"))
+COUNT_CACHE_USE_REDIS = os.getenv("COUNT_CACHE_USE_REDIS", "1") == "1"
+COUNT_CACHE_PREFIX = "count:"
+
+# estimate: 캐시된 개수 (쓰기 시 무효화, 최대 TTL만큼 늦을 수 있음) / exact: 매번 COUNT / none: 세지 않음
+TOTAL_MODES = ("estimate", "exact", "none")
+
+
+def count_key(table: str, **filters) -> str:
+    """필터 조합별 캐시 key (None인 필터는 제외) 예: count:NewsArticle:category_id=3"""
+    parts = [f"{k}={v}" for k, v in sorted(filters.items()) if v is not None]
+    return COUNT_CACHE_PREFIX + ":".join([table, *parts])
+
+
+class CountCache:
+    """목록 API total 값 캐시 (Redis, 실패하면 프로세스 로컬 TTL 캐시)
+
+    쓰기 경로에서 invalidate()로 해당 필터 key를 지운다. 동시에 진행 중인 COUNT가
+    무효화 직전 값을 다시 저장할 수 있으므로 TTL을 안전장치로 둔다.
+    Redis 호출은 RedisTier를 거치므로 Redis가 응답하지 않는 동안에는 로컬 캐시만 쓴다.
+    """
+
+    def __init__(self, ttl_seconds: int = COUNT_CACHE_TTL_SECONDS, use_redis: bool = COUNT_CACHE_USE_REDIS):
+        self.ttl_seconds = ttl_seconds
+        self.redis = RedisTier("count cache", enabled=use_redis)
+        self._local: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def _load(self, key: str) -> Optional[int]:
+        if self.redis.available:
+            value = await self.redis.call("get", lambda r: r.get(key))
+            if self.redis.available:  # 실패했으면 backoff 상태가 되어 로컬로 넘어감
+                return int(value) if value is not None else None
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            return value
+
+    async def _store(self, key: str, value: int) -> None:
+        if await self.redis.call("set", lambda r: r.set(key, value, ex=self.ttl_seconds)):
+            return
+
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    async def get_or_count(self, key: str, count: Callable[[], Awaitable[int]], mode: str = "estimate") -> Optional[int]:
+        if mode == "none":
+            return None
+        if mode == "estimate":
+            cached = await self._load(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        value = await count()
+        if mode == "estimate":
+            # exact는 복제본에서 셀 수 있어 공유 캐시를 덮어쓰지 않는다
+            await self._store(key, value)
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        self.invalidations += 1
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+        if keys:
+            await self.redis.call("delete", lambda r: r.delete(*keys))
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            "local_entries": len(self._local),
+            **self.redis.stats(),
+        }
+
+
+_count_cache_instance: Optional[CountCache] = None
+_count_cache_lock = threading.Lock()
+
+
+def get_count_cache() -> CountCache:
+    global _count_cache_instance
+    with _count_cache_lock:
+        if _count_cache_instance is None:
+            _count_cache_instance = CountCache()
+        return _count_cache_instance
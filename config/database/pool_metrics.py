@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Dict, Optional, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+except ImportError:  # 없으면 /db-pool/stats 만 동작
+    Counter = Gauge = Histogram = None
+
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class PoolMetrics:
+    """커넥션 풀 checkout 대기 시간 / 사용률 지표 (engine 라벨: sync, async)"""
+
+    def __init__(self):
+        self._pools: Dict[str, Pool] = {}
+        self._lock = threading.Lock()
+        self._waits: Dict[str, dict] = {}
+        self.enabled = Counter is not None
+        if not self.enabled:
+            return
+        self.checkout_wait = Histogram(
+            "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection", ("engine",),
+            buckets=CHECKOUT_WAIT_BUCKETS,
+        )
+        self.checkout_timeouts = Counter("db_pool_checkout_timeouts_total", "Pool checkout timeouts", ("engine",))
+        self.checked_out = Gauge("db_pool_checked_out", "Connections currently checked out", ("engine",))
+        self.capacity = Gauge("db_pool_capacity", "pool_size + max_overflow", ("engine",))
+        self.utilization = Gauge("db_pool_utilization", "checked_out / capacity", ("engine",))
+
+    def register(self, name: str, pool: Pool) -> None:
+        with self._lock:
+            self._pools[name] = pool
+            self._waits.setdefault(name, {"checkouts": 0, "timeouts": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0})
+        if self.enabled:
+            self.checked_out.labels(name).set_function(lambda: _checked_out(pool))
+            self.capacity.labels(name).set_function(lambda: _capacity(pool))
+            self.utilization.labels(name).set_function(lambda: _utilization(pool))
+
+    def observe_checkout(self, name: str, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            w = self._waits.setdefault(name, {"checkouts": 0, "timeouts": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0})
+            w["checkouts"] += 1
+            w["timeouts"] += int(timed_out)
+            w["wait_ms_total"] += seconds * 1000
+            w["wait_ms_max"] = max(w["wait_ms_max"], seconds * 1000)
+        if self.enabled:
+            self.checkout_wait.labels(name).observe(seconds)
+            if timed_out:
+                self.checkout_timeouts.labels(name).inc()
+
+    def stats(self) -> dict:
+        with self._lock:
+            result = {}
+            for name, pool in self._pools.items():
+                w = self._waits.get(name, {})
+                checkouts = w.get("checkouts", 0)
+                result[name] = {
+                    "checked_out": _checked_out(pool),
+                    "capacity": _capacity(pool),
+                    "utilization": round(_utilization(pool), 3),
+                    "checkouts": checkouts,
+                    "timeouts": w.get("timeouts", 0),
+                    "avg_wait_ms": round(w.get("wait_ms_total", 0.0) / checkouts, 2) if checkouts else 0.0,
+                    "max_wait_ms": round(w.get("wait_ms_max", 0.0), 2),
+                }
+            return result
+
+
+def _checked_out(pool: Pool) -> int:
+    return pool.checkedout() if hasattr(pool, "checkedout") else 0
+
+
+def _capacity(pool: Pool) -> int:
+    if not hasattr(pool, "size"):
+        return 0
+    return pool.size() + max(0, getattr(pool, "_max_overflow", 0))
+
+
+def _utilization(pool: Pool) -> float:
+    capacity = _capacity(pool)
+    return _checked_out(pool) / capacity if capacity else 0.0
+
+
+_pool_metrics_instance: Optional[PoolMetrics] = None
+_pool_metrics_lock = threading.Lock()
+
+
+def get_pool_metrics() -> PoolMetrics:
+    global _pool_metrics_instance
+    with _pool_metrics_lock:
+        if _pool_metrics_instance is None:
+            _pool_metrics_instance = PoolMetrics()
+        return _pool_metrics_instance
+
+
+def instrumented_pool(name: str, base: Type[Pool]) -> Type[Pool]:
+    """checkout(_do_get) 시간을 재는 풀 클래스를 만든다 (create_engine(poolclass=...)용)"""
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            started = time.perf_counter()
+            timed_out = False
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                timed_out = True
+                raise
+            finally:
+                get_pool_metrics().observe_checkout(name, time.perf_counter() - started, timed_out)
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
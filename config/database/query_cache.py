@@ -0,0 +1,238 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from config.redis.redis_tier import RedisTier
+
+try:
+    from prometheus_client import Counter
+except ImportError:  # 없으면 /query-cache/stats 만 동작
+    Counter = None
+
+load_dotenv()
+
+QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "1") == "1"
+QUERY_CACHE_TTL_SECONDS = int(os.getenv("QUERY_CACHE_TTL_SECONDS", "300"))
+# 프로세스 로컬 tier: 다른 프로세스의 무효화가 이 시간만큼 늦게 보일 수 있음
+QUERY_CACHE_LOCAL_TTL_SECONDS = float(os.getenv("QUERY_CACHE_LOCAL_TTL_SECONDS", "2"))
+QUERY_CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_LOCAL_MAX_ENTRIES", "2048"))
+QUERY_CACHE_USE_REDIS = os.getenv("QUERY_CACHE_USE_REDIS", "1") == "1"
+QUERY_CACHE_PREFIX = "qcache:"
+
+# namespace: 같이 무효화되는 key 묶음
+NS_ARTICLES = "articles"
+
+
+def cache_key(*parts: Any, **filters: Any) -> str:
+    """None이 아닌 값만 이어 붙인 key 예: list:category_id=3:page=2:size=20"""
+    items = [str(p) for p in parts] + [f"{k}={v}" for k, v in sorted(filters.items()) if v is not None]
+    return ":".join(items)
+
+
+class QueryCache:
+    """조회 결과(JSON 직렬화) 캐시 (프로세스 로컬 LRU + Redis 2단 구성)
+
+    namespace마다 generation 번호를 두고 Redis key에 넣는다. 쓰기 경로는
+    invalidate(namespace)로 generation만 올리면 되고, 이전 세대 key는 TTL로 사라진다.
+    같은 key의 miss가 동시에 몰리면 한 번만 DB를 읽고 나머지는 그 결과를 기다린다.
+    Redis 호출은 RedisTier(워커 스레드, 짧은 timeout, 실패 시 backoff)를 거치고,
+    Redis 오류는 miss로 취급해 로컬 tier만 사용한다.
+    miss를 채우는 load()는 primary를 읽어야 한다. 복제본은 무효화 직후에도 옛 값을
+    가지고 있을 수 있고, 그 값이 새 세대 key로 저장되면 TTL 동안 남기 때문이다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = QUERY_CACHE_ENABLED,
+        ttl_seconds: int = QUERY_CACHE_TTL_SECONDS,
+        local_ttl_seconds: float = QUERY_CACHE_LOCAL_TTL_SECONDS,
+        local_max_entries: int = QUERY_CACHE_LOCAL_MAX_ENTRIES,
+        use_redis: bool = QUERY_CACHE_USE_REDIS,
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = local_ttl_seconds
+        self.local_max_entries = local_max_entries
+        self.redis = RedisTier("query cache", enabled=use_redis)
+
+        # (namespace, key) -> (만료 시각, generation, 값)
+        self._local: "OrderedDict[tuple[str, str], tuple[float, int, str]]" = OrderedDict()
+        # namespace -> (만료 시각, generation): Redis generation 조회도 로컬 TTL 동안 재사용
+        self._generations: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        # (namespace, generation, key) -> DB 조회 중인 결과
+        self._inflight: dict[tuple[str, int, str], asyncio.Future] = {}
+
+        self._stats: dict[str, dict[str, int]] = {}
+        self._requests = None
+        if Counter is not None:
+            self._requests = Counter(
+                "query_cache_requests_total", "Query cache lookups by tier (miss = served from DB)",
+                ("namespace", "result"),
+            )
+
+    # ---------- redis ----------
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"{QUERY_CACHE_PREFIX}gen:{namespace}"
+
+    @staticmethod
+    def _redis_key(namespace: str, generation: int, key: str) -> str:
+        return f"{QUERY_CACHE_PREFIX}{namespace}:g{generation}:{key}"
+
+    async def _generation(self, namespace: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._generations.get(namespace)
+            if entry is not None and entry[0] >= now:
+                return entry[1]
+            generation = entry[1] if entry is not None else 0
+
+        if self.redis.available:
+            value = await self.redis.call("get", lambda r: r.get(self._generation_key(namespace)))
+            if self.redis.available:  # 실패했으면 마지막으로 알던 generation 유지
+                generation = int(value or 0)
+        with self._lock:
+            self._generations[namespace] = (now + self.local_ttl_seconds, generation)
+        return generation
+
+    # ---------- local tier ----------
+    def _get_local(self, namespace: str, key: str, generation: int) -> Optional[str]:
+        with self._lock:
+            entry = self._local.get((namespace, key))
+            if entry is None:
+                return None
+            expires_at, entry_generation, value = entry
+            if expires_at < time.monotonic() or entry_generation != generation:
+                del self._local[(namespace, key)]
+                return None
+            self._local.move_to_end((namespace, key))
+            return value
+
+    def _set_local(self, namespace: str, key: str, generation: int, value: str) -> None:
+        with self._lock:
+            self._local[(namespace, key)] = (time.monotonic() + self.local_ttl_seconds, generation, value)
+            self._local.move_to_end((namespace, key))
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    # ---------- get / set ----------
+    def _count(self, namespace: str, result: str) -> None:
+        with self._lock:
+            ns = self._stats.setdefault(namespace, {"local": 0, "redis": 0, "miss": 0, "invalidations": 0})
+            ns[result] += 1
+        if self._requests is not None and result != "invalidations":
+            self._requests.labels(namespace, result).inc()
+
+    async def _lookup(self, namespace: str, key: str, generation: int) -> Optional[str]:
+        value = self._get_local(namespace, key, generation)
+        if value is not None:
+            self._count(namespace, "local")
+            return value
+
+        redis_key = self._redis_key(namespace, generation, key)
+        value = await self.redis.call("get", lambda r: r.get(redis_key))
+        if value is not None:
+            self._count(namespace, "redis")
+            self._set_local(namespace, key, generation, value)
+            return value
+        return None
+
+    async def _store(self, namespace: str, key: str, generation: int, value: str) -> None:
+        self._set_local(namespace, key, generation, value)
+        redis_key = self._redis_key(namespace, generation, key)
+        await self.redis.call("set", lambda r: r.set(redis_key, value, ex=self.ttl_seconds))
+
+    async def get_or_load(self, namespace: str, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시에 있으면 역직렬화해서 반환, 없으면 load() 결과(JSON 직렬화 가능해야 함)를 저장 후 반환"""
+        if not self.enabled:
+            return await load()
+
+        generation = await self._generation(namespace)
+        cached = await self._lookup(namespace, key, generation)
+        if cached is not None:
+            return json.loads(cached)
+
+        # 무효화 뒤 출발한 요청이 옛 세대에서 읽던 결과를 받지 않게 세대까지 key에 넣는다
+        flight_key = (namespace, generation, key)
+        inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            self._count(namespace, "local")  # 먼저 출발한 요청의 DB 조회 결과를 같이 씀
+            return json.loads(await asyncio.shield(inflight))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            self._count(namespace, "miss")
+            value = await load()
+            serialized = json.dumps(value, ensure_ascii=False, default=str)
+            # 읽는 사이 무효화됐으면 새 세대에 옛 값을 넣지 않도록 읽기 시작 시점 세대로 저장
+            await self._store(namespace, key, generation, serialized)
+            future.set_result(serialized)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없을 때 "never retrieved" 경고 방지
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """namespace의 generation을 올려 기존 key를 모두 무효화 (쓰기 경로에서 커밋 후 호출)"""
+        for namespace in namespaces:
+            generation_key = self._generation_key(namespace)
+            self._bump(namespace, await self.redis.call("incr", lambda r: r.incr(generation_key)))
+
+    def invalidate_sync(self, *namespaces: str) -> None:
+        """동기 코드(backfill 스크립트 등)용 invalidate"""
+        for namespace in namespaces:
+            generation_key = self._generation_key(namespace)
+            self._bump(namespace, self.redis.call_sync("incr", lambda r: r.incr(generation_key)))
+
+    def _bump(self, namespace: str, generation: Optional[int]) -> None:
+        # Redis incr에 실패했으면(None) 이 프로세스의 로컬 generation만 올린다
+        self._count(namespace, "invalidations")
+        with self._lock:
+            if generation is None:
+                generation = self._generations.get(namespace, (0.0, 0))[1] + 1
+            self._generations[namespace] = (time.monotonic() + self.local_ttl_seconds, int(generation))
+            for local_key in [k for k in self._local if k[0] == namespace]:
+                del self._local[local_key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            per_namespace = {}
+            for namespace, s in self._stats.items():
+                hits = s["local"] + s["redis"]
+                lookups = hits + s["miss"]
+                per_namespace[namespace] = {
+                    **s,
+                    # 캐시가 대신 처리해 DB까지 가지 않은 요청 비율 / 건수
+                    "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                    "db_queries_saved": hits,
+                    "generation": self._generations.get(namespace, (0.0, 0))[1],
+                }
+            return {
+                "enabled": self.enabled,
+                **self.redis.stats(),
+                "local_entries": len(self._local),
+                "namespaces": per_namespace,
+            }
+
+
+_query_cache_instance: Optional[QueryCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryCache:
+    global _query_cache_instance
+    with _query_cache_lock:
+        if _query_cache_instance is None:
+            _query_cache_instance = QueryCache()
+        return _query_cache_instance
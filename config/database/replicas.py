@@ -0,0 +1,152 @@
+import asyncio
+import itertools
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+try:
+    from prometheus_client import Gauge
+except ImportError:
+    Gauge = None
+
+DB_REPLICA_HEALTH_INTERVAL_SECONDS = float(os.getenv("DB_REPLICA_HEALTH_INTERVAL_SECONDS", "10"))
+DB_REPLICA_HEALTH_TIMEOUT_SECONDS = float(os.getenv("DB_REPLICA_HEALTH_TIMEOUT_SECONDS", "2"))
+# 복제 지연이 이보다 크면 읽기에서 제외 (MySQL에서 REPLICATION CLIENT 권한이 있을 때만 확인)
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5"))
+
+_LAG_QUERIES = (
+    ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),  # MySQL 8.0.22+
+    ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+)
+
+
+@dataclass
+class ReplicaState:
+    name: str
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker
+    healthy: bool = True  # 첫 health check 전에는 정상으로 간주
+    lag_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+    checked_at: Optional[float] = None
+    check_ms: Optional[float] = None
+
+
+class ReplicaSet:
+    """읽기 복제본 목록 + health check + round-robin 선택
+
+    정상 복제본이 하나도 없으면 pick()이 None을 돌려주고 호출한 쪽은 primary를 쓴다.
+    """
+
+    def __init__(
+        self,
+        engines: Dict[str, AsyncEngine],
+        max_lag_seconds: float = DB_REPLICA_MAX_LAG_SECONDS,
+        timeout_seconds: float = DB_REPLICA_HEALTH_TIMEOUT_SECONDS,
+    ):
+        self.max_lag_seconds = max_lag_seconds
+        self.timeout_seconds = timeout_seconds
+        self._replicas = [
+            ReplicaState(
+                name=name,
+                engine=engine,
+                sessionmaker=async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
+            )
+            for name, engine in engines.items()
+        ]
+        self._cycle = itertools.cycle(range(len(self._replicas))) if self._replicas else None
+        self._task: Optional[asyncio.Task] = None
+        self._healthy_gauge = None
+        if Gauge is not None and self._replicas:
+            self._healthy_gauge = Gauge("db_replica_healthy", "1 if replica is used for reads", ("engine",))
+            for r in self._replicas:
+                self._healthy_gauge.labels(r.name).set_function(lambda r=r: 1 if r.healthy else 0)
+
+    def __bool__(self) -> bool:
+        return bool(self._replicas)
+
+    def pick(self) -> Optional[ReplicaState]:
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[next(self._cycle)]
+            if replica.healthy:
+                return replica
+        return None
+
+    def open_session(self) -> Optional[AsyncSession]:
+        replica = self.pick()
+        return replica.sessionmaker() if replica is not None else None
+
+    async def _lag(self, conn) -> Optional[float]:
+        if conn.dialect.name != "mysql":
+            return None
+        for query, column in _LAG_QUERIES:
+            try:
+                row = (await conn.execute(text(query))).mappings().first()
+            except Exception:
+                continue
+            if row is None:
+                return None  # 복제 설정이 없는 서버 (로컬 stand-in 등)
+            value = row.get(column)
+            # NULL이면 SQL 스레드가 멈춘 상태
+            return float(value) if value is not None else float("inf")
+        return None
+
+    async def check(self, replica: ReplicaState) -> None:
+        was_healthy = replica.healthy if replica.checked_at is not None else True
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                async with replica.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    lag = await self._lag(conn)
+            replica.lag_seconds = lag
+            replica.healthy = lag is None or lag <= self.max_lag_seconds
+            replica.last_error = None if replica.healthy else f"replication lag {lag}s"
+        except Exception as e:
+            replica.healthy = False
+            replica.last_error = f"{type(e).__name__}: {e}"
+        replica.checked_at = time.time()
+        replica.check_ms = round((time.perf_counter() - started) * 1000, 1)
+        # 상태가 바뀔 때만 로그
+        if was_healthy and not replica.healthy:
+            print(f"[WARN] replica {replica.name} excluded from reads: {replica.last_error}")
+        elif not was_healthy and replica.healthy:
+            print(f"[INFO] replica {replica.name} is healthy again")
+
+    async def check_all(self) -> None:
+        await asyncio.gather(*(self.check(r) for r in self._replicas))
+
+    async def _health_loop(self, interval: float) -> None:
+        while True:
+            await self.check_all()
+            await asyncio.sleep(interval)
+
+    def start_health_checks(self, interval: float = DB_REPLICA_HEALTH_INTERVAL_SECONDS) -> None:
+        if self._replicas and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._health_loop(interval))
+
+    async def stop_health_checks(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> list[dict]:
+        return [
+            {
+                "engine": r.name,
+                "healthy": r.healthy,
+                "lag_seconds": r.lag_seconds,
+                "last_error": r.last_error,
+                "checked_at": r.checked_at,
+                "check_ms": r.check_ms,
+            }
+            for r in self._replicas
+        ]
@@ -2,31 +2,100 @@
 import aiohttp
 import os
 import urllib.parse
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from config.database.pool_metrics import get_pool_metrics, instrumented_pool
+from config.database.replicas import ReplicaSet
 
 load_dotenv()
 
 password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD"))
 
-DATABASE_URL = (
-    f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{password}"
+_DB_LOCATION = (
+    f"{os.getenv('MYSQL_USER')}:{password}"
     f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
 )
+DATABASE_URL = f"mysql+pymysql://{_DB_LOCATION}"
+# 비동기 드라이버: aiomysql(기본) 또는 asyncmy
+_ASYNC_DRIVER = os.getenv("MYSQL_ASYNC_DRIVER", "aiomysql")
+# ASYNC_DATABASE_URL로 전체 URL을 직접 줄 수도 있음 (로컬 stand-in 등)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or f"mysql+{_ASYNC_DRIVER}://{_DB_LOCATION}"
+
+
+def _replica_urls() -> list[str]:
+    """읽기 복제본 URL 목록
+
+    ASYNC_REPLICA_DATABASE_URLS(콤마 구분 전체 URL)가 있으면 그대로, 아니면
+    MYSQL_REPLICA_HOSTS(host:port 콤마 구분)에 primary와 같은 계정/DB로 접속한다.
+    """
+    urls = os.getenv("ASYNC_REPLICA_DATABASE_URLS", "")
+    if urls.strip():
+        return [u.strip() for u in urls.split(",") if u.strip()]
+    hosts = [h.strip() for h in os.getenv("MYSQL_REPLICA_HOSTS", "").split(",") if h.strip()]
+    return [
+        f"mysql+{_ASYNC_DRIVER}://{os.getenv('MYSQL_USER')}:{password}@{h}/{os.getenv('MYSQL_DATABASE')}"
+        for h in hosts
+    ]
+
+
+DB_ECHO = os.getenv("DB_ECHO", "true").lower() == "true"
+
+# 커넥션 풀 설정 (sync/async 엔진 각각 적용)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+# MySQL wait_timeout / 프록시 idle timeout보다 짧게 재연결
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+
+POOL_OPTIONS = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,
+)
 
+# 동기 엔진: 배치/스크립트(backfill 등)용으로 유지
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True
+    echo=DB_ECHO,
+    poolclass=instrumented_pool("sync", QueuePool),
+    **POOL_OPTIONS,
 )
+get_pool_metrics().register("sync", engine.pool)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+def ensure_indexes(bind=None) -> None:
+    """create_all은 이미 있는 테이블에 새로 선언된 인덱스를 만들지 않으므로 빠진 것만 추가한다
+
+    아직 없는 컬럼에 걸린 인덱스는 건너뛴다 (해당 migration 명령을 먼저 실행해야 함).
+    그 밖의 오류(권한, 중복 값 등)는 그대로 올려 보낸다.
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        columns = {c["name"] for c in inspector.get_columns(table.name)}
+        for index in table.indexes:
+            missing = [c.name for c in index.columns if c.name not in columns]
+            if missing:
+                print(f"[WARN] index {index.name} not created: {table.name} has no column {', '.join(missing)}")
+                continue
+            index.create(bind=bind, checkfirst=True)
+
 def get_db_session():
     return SessionLocal()
 
@@ -37,3 +106,205 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ---------- async ----------
+# 비동기 드라이버가 없어도 동기 스크립트는 import 되도록 처음 사용할 때 생성
+_async_engine: AsyncEngine | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+_replica_set: ReplicaSet | None = None
+
+
+def _create_pooled_async_engine(url: str, name: str) -> AsyncEngine:
+    async_engine = create_async_engine(
+        url,
+        echo=DB_ECHO,
+        poolclass=instrumented_pool(name, AsyncAdaptedQueuePool),
+        **POOL_OPTIONS,
+    )
+    get_pool_metrics().register(name, async_engine.pool)
+    return async_engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """primary (쓰기 + read-your-writes) 엔진"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = _create_pooled_async_engine(ASYNC_DATABASE_URL, "async")
+    return _async_engine
+
+
+def get_replica_set() -> ReplicaSet:
+    """읽기 복제본 엔진들 (설정이 없으면 비어 있고 읽기도 primary로 간다)"""
+    global _replica_set
+    if _replica_set is None:
+        _replica_set = ReplicaSet({
+            f"replica-{i}": _create_pooled_async_engine(url, f"replica-{i}")
+            for i, url in enumerate(_replica_urls())
+        })
+    return _replica_set
+
+
+class _TrackedSession(Session):
+    """커밋되지 않은 쓰기가 있는지 info["writes"]로 표시하는 세션 (_release_if_read_only 용)"""
+
+
+@event.listens_for(_TrackedSession, "do_orm_execute")
+def _mark_dml(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["writes"] = True
+
+
+@event.listens_for(_TrackedSession, "after_flush")
+def _mark_flush(session, flush_context) -> None:
+    session.info["writes"] = True
+
+
+@event.listens_for(_TrackedSession, "after_commit")
+@event.listens_for(_TrackedSession, "after_rollback")
+def _clear_writes(session) -> None:
+    session.info.pop("writes", None)
+
+
+def get_async_session() -> AsyncSession:
+    """짧게 쓰고 닫는 AsyncSession (async with get_async_session() as db: ...)"""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        # commit 후에도 반환한 ORM 객체의 컬럼을 읽을 수 있게 expire 하지 않음
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(), autoflush=False, expire_on_commit=False, sync_session_class=_TrackedSession
+        )
+    return _AsyncSessionLocal()
+
+
+async def _release_if_read_only(session: AsyncSession) -> None:
+    """읽기만 한 트랜잭션이면 끝내서 커넥션을 풀에 돌려준다
+
+    요청 범위 세션은 요청이 끝날 때까지 살아 있으므로, repository 호출이 끝날 때마다
+    이렇게 놓아 주지 않으면 외부 API/LLM 응답을 기다리는 동안에도 커넥션을 잡고 있게 된다.
+    다음 DB 호출에서 세션이 풀에서 커넥션을 다시 빌린다. expire_on_commit=False라
+    이미 읽어 둔 ORM 객체는 그대로 쓸 수 있다.
+    """
+    if not session.in_transaction():
+        return
+    if session.info.get("writes") or session.new or session.dirty or session.deleted:
+        return
+    await session.commit()
+
+
+# ---------- request scope (unit of work) ----------
+class _RequestScope:
+    session: Optional[AsyncSession] = None  # primary
+    read_session: Optional[AsyncSession] = None  # 복제본
+
+
+_request_scope: ContextVar[Optional[_RequestScope]] = ContextVar("db_request_scope", default=None)
+
+
+@asynccontextmanager
+async def request_db_scope() -> AsyncIterator[None]:
+    """HTTP 요청 하나 동안 AsyncSession 하나를 공유한다 (미들웨어에서 사용).
+
+    세션은 처음 DB를 쓸 때 열리고 요청이 끝나면 닫히므로, 커밋되지 않은 작업은
+    롤백되어 다음 요청으로 넘어가지 않는다. 한 요청 안에서 DB 호출을 gather로
+    동시에 실행하면 안 된다 (AsyncSession은 동시 사용 불가).
+    """
+    scope = _RequestScope()
+    token = _request_scope.set(scope)
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+        for session in (scope.session, scope.read_session):
+            if session is not None:
+                await session.close()
+
+
+class RequestDBScopeMiddleware:
+    """요청마다 AsyncSession 하나를 두는 ASGI 미들웨어
+
+    @app.middleware("http")는 call_next가 응답 객체를 돌려주는 시점에 범위를 닫아
+    StreamingResponse 본문이나 BackgroundTasks가 닫힌 세션을 쓰게 된다. 순수 ASGI로
+    감싸 응답 본문 전송과 백그라운드 작업까지 끝난 뒤에 닫는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        async with request_db_scope():
+            await self.app(scope, receive, send)
+
+
+@asynccontextmanager
+async def db_session() -> AsyncIterator[AsyncSession]:
+    """repository용: 요청 범위 세션이 있으면 그것을, 없으면(스케줄러 등) 짧은 세션을 연다"""
+    scope = _request_scope.get()
+    if scope is None:
+        async with get_async_session() as db:
+            yield db
+        return
+
+    if scope.session is None:
+        scope.session = get_async_session()
+    try:
+        yield scope.session
+    except Exception:
+        # 실패한 트랜잭션이 같은 요청의 다음 호출에 남지 않게 정리
+        await scope.session.rollback()
+        raise
+    await _release_if_read_only(scope.session)
+
+
+@asynccontextmanager
+async def db_read_session() -> AsyncIterator[AsyncSession]:
+    """읽기 전용 repository용: 복제본 세션
+
+    복제본이 없거나 모두 비정상이면 primary, 같은 요청에서 이미 primary 세션을 썼으면
+    (쓰기 후 읽기) 복제 지연으로 방금 쓴 값이 안 보일 수 있으므로 primary를 그대로 쓴다.
+    """
+    scope = _request_scope.get()
+    replicas = get_replica_set()
+    if not replicas or (scope is not None and scope.session is not None):
+        async with db_session() as db:
+            yield db
+        return
+
+    if scope is None:
+        session = replicas.open_session()
+        if session is None:
+            async with db_session() as db:
+                yield db
+            return
+        async with session as db:
+            yield db
+        return
+
+    if scope.read_session is None:
+        scope.read_session = replicas.open_session()
+        if scope.read_session is None:
+            async with db_session() as db:
+                yield db
+            return
+    try:
+        yield scope.read_session
+    except Exception:
+        await scope.read_session.rollback()
+        raise
+    # 복제본 세션은 쓰지 않으므로 호출이 끝나면 바로 커넥션을 돌려준다
+    await _release_if_read_only(scope.read_session)
+
+
+async def get_async_db():
+    """FastAPI dependency that yields the request's AsyncSession and ensures closure."""
+    async with db_session() as db:
+        yield db
+
+
+async def get_async_read_db():
+    """읽기 전용 라우트용 dependency (복제본 세션, 없으면 primary)"""
+    async with db_read_session() as db:
+        yield db
@@ -1,14 +1,23 @@
 import os
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # .env 파일 자동 로딩
 load_dotenv()
 
-# 환경변수에서 API 키 읽기
+# 환경변수에서 API 키 읽기 (fake 백엔드에서는 필요 없음)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY environment variable not set!")
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=OPENAI_API_KEY)
+# LLM 게이트웨이 설정
+# LLM_BACKEND: "openai" | "fake" (오프라인 실행/부하 테스트용)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openai")
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "32"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "16"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BASE_SECONDS = float(os.getenv("LLM_RETRY_BASE_SECONDS", "0.5"))
+LLM_RETRY_MAX_SECONDS = float(os.getenv("LLM_RETRY_MAX_SECONDS", "20"))
+# 0이면 제한 없음
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "0"))
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "0"))
+LLM_FAKE_LATENCY_MS = int(os.getenv("LLM_FAKE_LATENCY_MS", "50"))
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from config.redis.redis_tier import RedisTier
+
+load_dotenv()
+
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+LLM_CACHE_USE_REDIS = os.getenv("LLM_CACHE_USE_REDIS", "1") == "1"
+LLM_CACHE_PREFIX = "llm:cache:"
+
+
+class LLMResponseCache:
+    """LLM 응답 캐시 (in-process LRU + Redis 2단 구성)
+
+    key는 model, messages 해시, 샘플링 파라미터로 만든다.
+    로컬 tier는 TTL과 항목 수/바이트 크기 기준으로 오래된 항목부터 내보내고,
+    Redis tier는 TTL(EX)로만 관리한다. Redis 오류는 캐시 miss로 취급하고 잠시 Redis를 건너뛴다.
+    async 경로는 aget/aset을 써야 이벤트 루프가 Redis 호출에 막히지 않는다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        use_redis: bool = LLM_CACHE_USE_REDIS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.redis = RedisTier("LLM cache", enabled=use_redis)
+
+        self._local: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._local_bytes = 0
+        self._lock = threading.Lock()
+
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- key ----------
+    @staticmethod
+    def make_key(model: str, messages: list, **params: Any) -> str:
+        prompt_hash = hashlib.sha256(
+            json.dumps(messages, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        sampling = json.dumps({k: v for k, v in params.items() if v is not None}, sort_keys=True)
+        raw = f"{model}|{prompt_hash}|{sampling}"
+        return LLM_CACHE_PREFIX + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_cacheable(temperature: Optional[float], cache: Optional[bool] = None) -> bool:
+        # 명시값이 우선, 아니면 temperature=0(결정적 호출)만 캐시
+        if cache is not None:
+            return cache
+        return temperature is not None and float(temperature) == 0.0
+
+    # ---------- get / set ----------
+    def _local_hit(self, key: str) -> Optional[str]:
+        value = self._get_local(key)
+        if value is not None:
+            self.local_hits += 1
+        return value
+
+    def _redis_result(self, key: str, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            self.redis_hits += 1
+            self._set_local(key, value)
+        else:
+            self.misses += 1
+        return value
+
+    def get(self, key: str) -> Optional[str]:
+        """동기 코드용 (chat_sync 등)"""
+        value = self._local_hit(key)
+        if value is not None:
+            return value
+        return self._redis_result(key, self.redis.call_sync("get", lambda r: r.get(key)))
+
+    async def aget(self, key: str) -> Optional[str]:
+        value = self._local_hit(key)
+        if value is not None:
+            return value
+        return self._redis_result(key, await self.redis.call("get", lambda r: r.get(key)))
+
+    def set(self, key: str, value: str) -> None:
+        if value is None:
+            return
+        self._set_local(key, value)
+        self.redis.call_sync("set", lambda r: r.set(key, value, ex=self.ttl_seconds))
+
+    async def aset(self, key: str, value: str) -> None:
+        if value is None:
+            return
+        self._set_local(key, value)
+        await self.redis.call("set", lambda r: r.set(key, value, ex=self.ttl_seconds))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._local.clear()
+            self._local_bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        hits = self.local_hits + self.redis_hits
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "local_entries": len(self._local),
+            "local_bytes": self._local_bytes,
+            **self.redis.stats(),
+        }
+
+    # ---------- local LRU tier ----------
+    def _get_local(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._remove_local(key)
+                return None
+            self._local.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._local:
+                self._remove_local(key)
+            self._local[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._local_bytes += size
+            while self._local and (len(self._local) > self.max_entries or self._local_bytes > self.max_bytes):
+                oldest = next(iter(self._local))
+                self._remove_local(oldest)
+                self.evictions += 1
+
+    def _remove_local(self, key: str) -> None:
+        _, value = self._local.pop(key)
+        self._local_bytes -= len(value.encode("utf-8"))
+
+
+_llm_cache_instance: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    global _llm_cache_instance
+    if _llm_cache_instance is None:
+        _llm_cache_instance = LLMResponseCache()
+    return _llm_cache_instance
+
+
+def cached_completion(
+    model: str,
+    messages: list,
+    call: Callable[[], str],
+    cache: Optional[bool] = None,
+    validate: Optional[Callable[[str], bool]] = None,
+    **params: Any,
+) -> str:
+    """동기 호출용: 캐시에 있으면 반환, 없으면 call() 결과를 저장 후 반환
+
+    validate를 주면 통과한 응답만 저장하고, 통과하지 못하는 캐시 값은 miss로 본다.
+    """
+    llm_cache = get_llm_cache()
+    if not llm_cache.is_cacheable(params.get("temperature"), cache):
+        return call()
+
+    key = llm_cache.make_key(model, messages, **params)
+    hit = llm_cache.get(key)
+    if hit is not None and (validate is None or validate(hit)):
+        return hit
+
+    value = call()
+    if validate is None or validate(value):
+        llm_cache.set(key, value)
+    return value
+
+
+async def acached_completion(
+    model: str,
+    messages: list,
+    call: Callable[[], Awaitable[str]],
+    cache: Optional[bool] = None,
+    validate: Optional[Callable[[str], bool]] = None,
+    **params: Any,
+) -> str:
+    """비동기 호출용: cached_completion과 동일한 규칙"""
+    llm_cache = get_llm_cache()
+    if not llm_cache.is_cacheable(params.get("temperature"), cache):
+        return await call()
+
+    key = llm_cache.make_key(model, messages, **params)
+    hit = await llm_cache.aget(key)
+    if hit is not None and (validate is None or validate(hit)):
+        return hit
+
+    value = await call()
+    if validate is None or validate(value):
+        await llm_cache.aset(key, value)
+    return value
@@ -0,0 +1,465 @@
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Optional
+
+import httpx
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+
+from config.openai import config as llm_config
+from config.openai.llm_cache import acached_completion, cached_completion, get_llm_cache
+from config.openai.llm_metrics import CallContext, capture, estimate_speech_cost, get_llm_metrics
+
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+@dataclass
+class LLMResponse:
+    content: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    retries: int = 0
+    elapsed_ms: float = 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    # 한국어 기준 대략 2~3자당 1토큰, rate limit 예약용 보수적 추정치
+    return max(1, len(text or "") // 2)
+
+
+def _messages_text(messages: list) -> str:
+    return "\n".join(str(m.get("content") or "") for m in messages)
+
+
+class TokenBucket:
+    """분당 용량(capacity)을 초 단위로 채우는 token bucket (RPM/TPM 제한용)"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float) -> None:
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, delta: float) -> None:
+        # 실제 사용량과 예약량의 차이를 반영 (음수 잔량 허용)
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+# ---------- backends ----------
+class LLMBackend(ABC):
+
+    @abstractmethod
+    async def chat(self, model: str, messages: list, **params: Any) -> LLMResponse:
+        pass
+
+    @abstractmethod
+    def stream_chat(self, model: str, messages: list, **params: Any) -> AsyncIterator[str]:
+        pass
+
+    @abstractmethod
+    async def speech(self, model: str, voice: str, text: str) -> bytes:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class OpenAIBackend(LLMBackend):
+    """공유 httpx 커넥션 풀을 쓰는 AsyncOpenAI 백엔드 (재시도는 게이트웨이가 담당)"""
+
+    def __init__(self):
+        if not llm_config.OPENAI_API_KEY:
+            raise ValueError("OPENAI_API_KEY environment variable not set!")
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[AsyncOpenAI] = None
+
+    def _get_client(self) -> AsyncOpenAI:
+        # 게이트웨이 이벤트 루프 안에서 처음 호출될 때 생성
+        if self._client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=llm_config.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=llm_config.LLM_MAX_KEEPALIVE,
+                ),
+                timeout=httpx.Timeout(llm_config.LLM_TIMEOUT_SECONDS, connect=5.0),
+            )
+            self._client = AsyncOpenAI(
+                api_key=llm_config.OPENAI_API_KEY,
+                http_client=self._http_client,
+                max_retries=0,
+            )
+        return self._client
+
+    async def chat(self, model: str, messages: list, **params: Any) -> LLMResponse:
+        resp = await self._get_client().chat.completions.create(model=model, messages=messages, **params)
+        usage = getattr(resp, "usage", None)
+        return LLMResponse(
+            content=(resp.choices[0].message.content or ""),
+            model=model,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        )
+
+    async def stream_chat(self, model: str, messages: list, **params: Any) -> AsyncIterator[str]:
+        stream = await self._get_client().chat.completions.create(
+            model=model, messages=messages, stream=True, **params
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def speech(self, model: str, voice: str, text: str) -> bytes:
+        resp = await self._get_client().audio.speech.create(model=model, voice=voice, input=text)
+        return resp.content
+
+    async def close(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+
+class FakeLLMBackend(LLMBackend):
+    """오프라인 실행/부하 테스트용 백엔드: 고정 지연 후 결정적인 응답을 돌려준다."""
+
+    def __init__(self, latency_ms: int = llm_config.LLM_FAKE_LATENCY_MS):
+        self.latency_ms = latency_ms
+
+    def _content(self, model: str, prompt: str, params: dict) -> str:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+        text = f"[fake:{model}:{digest}] " + " ".join(prompt.split())[:200]
+        response_format = params.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            # schema의 문자열 필드를 모두 채워서 돌려준다
+            properties = response_format["json_schema"]["schema"].get("properties", {})
+            return json.dumps({name: text for name in properties}, ensure_ascii=False)
+        if response_format or "JSON" in prompt:
+            return '{"sentiment": "neutral", "key_points": []}'
+        return text
+
+    async def chat(self, model: str, messages: list, **params: Any) -> LLMResponse:
+        await asyncio.sleep(self.latency_ms / 1000)
+        prompt = _messages_text(messages)
+        content = self._content(model, prompt, params)
+        return LLMResponse(
+            content=content,
+            model=model,
+            prompt_tokens=estimate_tokens(prompt),
+            completion_tokens=estimate_tokens(content),
+        )
+
+    async def stream_chat(self, model: str, messages: list, **params: Any) -> AsyncIterator[str]:
+        words = self._content(model, _messages_text(messages), params).split(" ")
+        # 첫 토큰까지 지연의 절반, 나머지는 단어 단위로 나눠서 흘려보낸다
+        await asyncio.sleep(self.latency_ms / 2000)
+        for i, word in enumerate(words):
+            await asyncio.sleep(self.latency_ms / 2000 / len(words))
+            yield word if i == 0 else " " + word
+
+    async def speech(self, model: str, voice: str, text: str) -> bytes:
+        await asyncio.sleep(self.latency_ms / 1000)
+        # 빈 MPEG 프레임 헤더 반복 (재생 가능한 무음 수준의 더미 데이터)
+        return b"\xff\xfb\x90\x00" * max(1, len(text or ""))
+
+
+def create_backend(name: str = llm_config.LLM_BACKEND) -> LLMBackend:
+    if name == "fake":
+        return FakeLLMBackend()
+    return OpenAIBackend()
+
+
+# ---------- gateway ----------
+class LLMGateway:
+    """모든 LLM 호출이 거쳐가는 단일 비동기 게이트웨이
+
+    전용 이벤트 루프 스레드에서 하나의 백엔드(커넥션 풀)를 공유하며
+    전역 동시 실행 수, RPM/TPM token bucket, jitter backoff 재시도를 적용한다.
+    async 핸들러는 await chat(), 스케줄러 같은 동기 코드는 chat_sync()를 쓴다.
+    실제 백엔드 호출은 use_case 라벨과 함께 llm_metrics에 기록된다 (캐시 hit은 제외).
+    """
+
+    def __init__(
+        self,
+        backend: Optional[LLMBackend] = None,
+        max_concurrency: int = llm_config.LLM_MAX_CONCURRENCY,
+        rpm_limit: int = llm_config.LLM_RPM_LIMIT,
+        tpm_limit: int = llm_config.LLM_TPM_LIMIT,
+        max_retries: int = llm_config.LLM_MAX_RETRIES,
+    ):
+        self.backend = backend or create_backend()
+        self.metrics = get_llm_metrics()
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._rpm = TokenBucket(rpm_limit) if rpm_limit > 0 else None
+        self._tpm = TokenBucket(tpm_limit) if tpm_limit > 0 else None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    # ---------- public API ----------
+    async def chat(
+        self, model: str, messages: list, cache: Optional[bool] = None, use_case: Optional[str] = None,
+        validate: Optional[Callable[[str], bool]] = None, **params: Any
+    ) -> str:
+        """validate: 캐시에 넣어도 되는 응답인지 검사 (예: JSON 파싱), 실패한 응답은 캐시하지 않음"""
+        ctx = capture(use_case)
+        return await acached_completion(
+            model,
+            messages,
+            lambda: self._await(self._complete(model, messages, params, ctx)),
+            cache=cache,
+            validate=validate,
+            **params,
+        )
+
+    def chat_sync(
+        self, model: str, messages: list, cache: Optional[bool] = None, use_case: Optional[str] = None,
+        validate: Optional[Callable[[str], bool]] = None, **params: Any
+    ) -> str:
+        ctx = capture(use_case)
+        return cached_completion(
+            model,
+            messages,
+            lambda: self._submit(self._complete(model, messages, params, ctx)).result(),
+            cache=cache,
+            validate=validate,
+            **params,
+        )
+
+    async def stream_chat(
+        self, model: str, messages: list, cache: Optional[bool] = None, use_case: Optional[str] = None, **params: Any
+    ) -> AsyncIterator[str]:
+        """토큰 delta를 도착하는 대로 내보낸다. 캐시 hit이면 전체 응답을 한 번에 내보낸다."""
+        llm_cache = get_llm_cache()
+        key = None
+        if llm_cache.is_cacheable(params.get("temperature"), cache):
+            key = llm_cache.make_key(model, messages, **params)
+            hit = await llm_cache.aget(key)
+            if hit is not None:
+                yield hit
+                return
+
+        # 게이트웨이 루프에서 받은 delta를 호출한 쪽 루프의 queue로 넘긴다
+        ctx = capture(use_case)
+        caller_loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        async def _produce():
+            try:
+                async for delta in self._stream_with_retry(model, messages, params, ctx):
+                    caller_loop.call_soon_threadsafe(queue.put_nowait, delta)
+            except Exception as e:
+                caller_loop.call_soon_threadsafe(queue.put_nowait, e)
+            else:
+                caller_loop.call_soon_threadsafe(queue.put_nowait, finished)
+
+        producer = self._submit(_produce())
+        parts = []
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                parts.append(item)
+                yield item
+        finally:
+            producer.cancel()
+
+        if key is not None:
+            await llm_cache.aset(key, "".join(parts).strip())
+
+    async def speech(self, model: str, voice: str, text: str, use_case: Optional[str] = None) -> bytes:
+        ctx = capture(use_case)
+
+        def _record(_, retries: int, elapsed_ms: float, error: bool) -> None:
+            self.metrics.record(
+                ctx, model, retries=retries, elapsed_ms=elapsed_ms,
+                cost_usd=0.0 if error else estimate_speech_cost(model, len(text or "")), error=error,
+            )
+
+        return await self._await(
+            self._call_with_retry(lambda: self.backend.speech(model, voice, text), 1, record=_record)
+        )
+
+    def close(self) -> None:
+        if self._loop is not None:
+            self._submit(self.backend.close()).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    # ---------- internals ----------
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="llm-gateway", daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    async def _await(self, coro):
+        return await asyncio.wrap_future(self._submit(coro))
+
+    async def _complete(self, model: str, messages: list, params: dict, ctx: CallContext) -> str:
+        reserved = estimate_tokens(_messages_text(messages)) + int(params.get("max_tokens") or 0)
+
+        def _record(response: Optional[LLMResponse], retries: int, elapsed_ms: float, error: bool) -> None:
+            self.metrics.record(
+                ctx,
+                model,
+                prompt_tokens=response.prompt_tokens if response else 0,
+                completion_tokens=response.completion_tokens if response else 0,
+                retries=retries,
+                elapsed_ms=elapsed_ms,
+                error=error,
+            )
+
+        response = await self._call_with_retry(
+            lambda: self.backend.chat(model, messages, **params), reserved, record=_record
+        )
+        if self._tpm is not None and (response.prompt_tokens or response.completion_tokens):
+            self._tpm.adjust(response.prompt_tokens + response.completion_tokens - reserved)
+        return response.content.strip()
+
+    async def _call_with_retry(
+        self,
+        call,
+        reserved_tokens: int,
+        record: Optional[Callable[[Any, int, float, bool], None]] = None,
+    ):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # record(response, retries, elapsed_ms, error): 대기/재시도를 포함한 전체 시간 기준
+        call_started = time.perf_counter()
+
+        def _done(response, attempt: int, error: bool) -> None:
+            if record is not None:
+                record(response, attempt, round((time.perf_counter() - call_started) * 1000, 1), error)
+
+        attempt = 0
+        while True:
+            if self._rpm is not None:
+                await self._rpm.acquire(1)
+            if self._tpm is not None:
+                await self._tpm.acquire(reserved_tokens)
+            try:
+                async with self._semaphore:
+                    started = time.perf_counter()
+                    response = await call()
+                if isinstance(response, LLMResponse):
+                    response.retries = attempt
+                    response.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+                _done(response, attempt, False)
+                return response
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    _done(None, attempt, True)
+                    raise
+                attempt += 1
+                delay = self._backoff(attempt)
+                print(f"[WARN] LLM call failed ({type(e).__name__}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            except Exception:
+                _done(None, attempt, True)
+                raise
+
+    async def _stream_with_retry(
+        self, model: str, messages: list, params: dict, ctx: CallContext
+    ) -> AsyncIterator[str]:
+        # 첫 delta를 받기 전에 난 오류만 재시도한다 (이미 내보낸 토큰은 되돌릴 수 없음)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        prompt_tokens = estimate_tokens(_messages_text(messages))
+        reserved = prompt_tokens + int(params.get("max_tokens") or 0)
+        call_started = time.perf_counter()
+        emitted = []
+
+        # 스트리밍 응답은 usage가 오지 않으므로 토큰 수는 추정치로 기록
+        def _record(error: bool) -> None:
+            self.metrics.record(
+                ctx,
+                model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=estimate_tokens("".join(emitted)) if emitted else 0,
+                retries=attempt,
+                elapsed_ms=round((time.perf_counter() - call_started) * 1000, 1),
+                error=error,
+            )
+
+        attempt = 0
+        while True:
+            if self._rpm is not None:
+                await self._rpm.acquire(1)
+            if self._tpm is not None:
+                await self._tpm.acquire(reserved)
+            started = False
+            try:
+                async with self._semaphore:
+                    async for delta in self.backend.stream_chat(model, messages, **params):
+                        started = True
+                        emitted.append(delta)
+                        yield delta
+                _record(False)
+                return
+            except RETRYABLE_ERRORS as e:
+                if started or attempt >= self.max_retries:
+                    _record(True)
+                    raise
+                attempt += 1
+                delay = self._backoff(attempt)
+                print(f"[WARN] LLM stream failed ({type(e).__name__}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            except Exception:
+                _record(True)
+                raise
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        # full jitter exponential backoff
+        ceiling = min(llm_config.LLM_RETRY_MAX_SECONDS, llm_config.LLM_RETRY_BASE_SECONDS * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+_llm_gateway_instance: Optional[LLMGateway] = None
+_llm_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    global _llm_gateway_instance
+    with _llm_gateway_lock:
+        if _llm_gateway_instance is None:
+            _llm_gateway_instance = LLMGateway()
+        return _llm_gateway_instance
@@ -0,0 +1,159 @@
+import contextvars
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+except ImportError:  # /metrics 없이도 요청별 합계 헤더는 동작하게 둔다
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+    Counter = Histogram = generate_latest = None
+
+USAGE_HEADER = os.getenv("LLM_USAGE_HEADER", "X-LLM-Usage")
+
+# USD / 1M tokens (input, output) - 목록에 없는 모델은 비용 0으로 집계
+MODEL_PRICES_PER_1M = {
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+# TTS는 입력 글자 수 기준 (USD / 1M chars)
+SPEECH_PRICES_PER_1M_CHARS = {
+    "tts-1": 15.00,
+    "tts-1-hd": 30.00,
+}
+
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 15, 30, 60, 120)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    price = MODEL_PRICES_PER_1M.get(model)
+    if price is None:
+        return 0.0
+    return (prompt_tokens * price[0] + completion_tokens * price[1]) / 1_000_000
+
+
+def estimate_speech_cost(model: str, characters: int) -> float:
+    return characters * SPEECH_PRICES_PER_1M_CHARS.get(model, 0.0) / 1_000_000
+
+
+@dataclass
+class RequestUsage:
+    """HTTP 요청 하나에서 발생한 LLM 호출 합계 (응답 헤더용)"""
+    calls: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    retries: int = 0
+    elapsed_ms: float = 0.0
+    cost_usd: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, prompt_tokens: int, completion_tokens: int, retries: int, elapsed_ms: float,
+            cost_usd: float, error: bool) -> None:
+        # 게이트웨이 루프 스레드에서 갱신되므로 lock으로 보호
+        with self._lock:
+            self.calls += 1
+            self.errors += int(error)
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self.retries += retries
+            self.elapsed_ms += elapsed_ms
+            self.cost_usd += cost_usd
+
+    def header_value(self) -> str:
+        return (
+            f"calls={self.calls}; errors={self.errors}; prompt_tokens={self.prompt_tokens}; "
+            f"completion_tokens={self.completion_tokens}; retries={self.retries}; "
+            f"llm_ms={self.elapsed_ms:.1f}; cost_usd={self.cost_usd:.6f}"
+        )
+
+
+_request_usage: contextvars.ContextVar[Optional[RequestUsage]] = contextvars.ContextVar(
+    "llm_request_usage", default=None
+)
+
+
+@dataclass
+class CallContext:
+    """호출한 쪽 컨텍스트에서 잡아 게이트웨이 스레드로 넘기는 집계 대상"""
+    use_case: str
+    usage: Optional[RequestUsage]
+
+
+def start_request_usage() -> tuple[RequestUsage, contextvars.Token]:
+    usage = RequestUsage()
+    return usage, _request_usage.set(usage)
+
+
+def end_request_usage(token: contextvars.Token) -> None:
+    _request_usage.reset(token)
+
+
+def capture(use_case: Optional[str]) -> CallContext:
+    return CallContext(use_case=use_case or "unknown", usage=_request_usage.get())
+
+
+class LLMMetrics:
+    """LLM 호출 단위 Prometheus 지표 (모델 / 호출한 use case 라벨)"""
+
+    def __init__(self):
+        self.enabled = Counter is not None
+        if not self.enabled:
+            print("[WARN] prometheus_client not installed, /metrics disabled (usage header still works)")
+            return
+        labels = ("model", "use_case")
+        self.requests = Counter("llm_requests_total", "LLM calls", labels + ("status",))
+        self.tokens = Counter("llm_tokens_total", "LLM tokens", labels + ("kind",))
+        self.retries = Counter("llm_retries_total", "LLM call retries", labels)
+        self.cost = Counter("llm_cost_usd_total", "Estimated LLM cost in USD", labels)
+        self.latency = Histogram(
+            "llm_request_duration_seconds", "LLM call wall time including retries", labels,
+            buckets=LATENCY_BUCKETS,
+        )
+
+    def record(
+        self,
+        ctx: CallContext,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        retries: int = 0,
+        elapsed_ms: float = 0.0,
+        cost_usd: Optional[float] = None,
+        error: bool = False,
+    ) -> None:
+        if cost_usd is None:
+            cost_usd = estimate_cost(model, prompt_tokens, completion_tokens)
+        if ctx.usage is not None:
+            ctx.usage.add(prompt_tokens, completion_tokens, retries, elapsed_ms, cost_usd, error)
+        if not self.enabled:
+            return
+
+        self.requests.labels(model, ctx.use_case, "error" if error else "ok").inc()
+        self.latency.labels(model, ctx.use_case).observe(elapsed_ms / 1000)
+        if prompt_tokens:
+            self.tokens.labels(model, ctx.use_case, "prompt").inc(prompt_tokens)
+        if completion_tokens:
+            self.tokens.labels(model, ctx.use_case, "completion").inc(completion_tokens)
+        if retries:
+            self.retries.labels(model, ctx.use_case).inc(retries)
+        if cost_usd:
+            self.cost.labels(model, ctx.use_case).inc(cost_usd)
+
+    def render(self) -> Optional[bytes]:
+        return generate_latest() if self.enabled else None
+
+
+_llm_metrics_instance: Optional[LLMMetrics] = None
+_llm_metrics_lock = threading.Lock()
+
+
+def get_llm_metrics() -> LLMMetrics:
+    global _llm_metrics_instance
+    with _llm_metrics_lock:
+        if _llm_metrics_instance is None:
+            _llm_metrics_instance = LLMMetrics()
+        return _llm_metrics_instance
@@ -0,0 +1,170 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "./tts_cache")
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# 경로를 돌려준 뒤 이 시간 동안은 지우지 않음 (FileResponse가 아직 파일을 열기 전일 수 있음)
+TTS_CACHE_EVICT_GRACE_SECONDS = float(os.getenv("TTS_CACHE_EVICT_GRACE_SECONDS", "60"))
+AUDIO_SUFFIX = ".mp3"
+
+
+def tts_key(model: str, voice: str, text: str) -> str:
+    raw = "\0".join((model, voice, text))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTSAudioCache:
+    """TTS 결과 mp3를 디스크에 hash(model, voice, text) 이름으로 저장하는 캐시
+
+    같은 텍스트면 파일 경로를 그대로 돌려주므로 다시 재생할 때 TTS 호출이 없다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 파일부터 지운다. 최근 evict_grace_seconds
+    안에 돌려준 파일은 응답 중일 수 있어 건너뛰므로, 잠시 max_bytes를 넘을 수 있다.
+    사용 순서는 메모리에만 두고 파일 mtime은 건드리지 않는다 (Last-Modified/If-Range가
+    흔들리지 않게). 재시작하면 mtime 순서로 다시 읽는다.
+    """
+
+    def __init__(self, cache_dir: str = TTS_CACHE_DIR, max_bytes: int = TTS_CACHE_MAX_BYTES,
+                 evict_grace_seconds: float = TTS_CACHE_EVICT_GRACE_SECONDS):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.evict_grace_seconds = evict_grace_seconds
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> 파일 크기 (오래 안 쓴 순)
+        self._served_at: dict[str, float] = {}  # key -> 마지막으로 경로를 돌려준 시각
+        self._total_bytes = 0
+        self._scanned = False
+        self._lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_for(self, key: str) -> Path:
+        # 한 디렉터리에 파일이 너무 몰리지 않게 앞 2글자로 나눔
+        return self.cache_dir / key[:2] / f"{key}{AUDIO_SUFFIX}"
+
+    def _scan(self) -> None:
+        if self._scanned:
+            return
+        found = []
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob(f"*/*{AUDIO_SUFFIX}"):
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((st.st_mtime, path.stem, st.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._scanned = True
+
+    def get(self, key: str) -> Optional[Path]:
+        path = self.path_for(key)
+        with self._lock:
+            self._scan()
+            if key not in self._entries:
+                return None
+            if not path.exists():  # 밖에서 지워진 경우
+                self._total_bytes -= self._entries.pop(key)
+                self._served_at.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            self._served_at[key] = time.monotonic()
+            return path
+
+    def put(self, key: str, data: bytes) -> Path:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)  # 읽는 쪽이 반쯤 쓴 파일을 보지 않게 rename으로 교체
+
+        with self._lock:
+            self._scan()
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._served_at[key] = time.monotonic()
+            self._evict(keep=key)
+        return path
+
+    def _evict(self, keep: str) -> None:
+        now = time.monotonic()
+        for key in list(self._entries):  # 오래 안 쓴 순
+            if self._total_bytes <= self.max_bytes:
+                break
+            served_at = self._served_at.get(key)
+            if key == keep or (served_at is not None and now - served_at < self.evict_grace_seconds):
+                continue
+            self._total_bytes -= self._entries.pop(key)
+            self._served_at.pop(key, None)
+            self.evictions += 1
+            try:
+                self.path_for(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    async def get_or_create(self, model: str, voice: str, text: str,
+                            generate: Callable[[], Awaitable[bytes]]) -> Path:
+        """캐시 파일 경로 반환, 없으면 generate()로 만들어 저장 (같은 key 동시 요청은 한 번만 생성)"""
+        key = tts_key(model, voice, text)
+        path = await asyncio.to_thread(self.get, key)
+        if path is not None:
+            self.hits += 1
+            return path
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await generate()
+            path = await asyncio.to_thread(self.put, key, data)
+            future.set_result(path)
+            return path
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없을 때 "never retrieved" 경고 방지
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "files": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_tts_audio_cache_instance: Optional[TTSAudioCache] = None
+_tts_audio_cache_lock = threading.Lock()
+
+
+def get_tts_audio_cache() -> TTSAudioCache:
+    global _tts_audio_cache_instance
+    with _tts_audio_cache_lock:
+        if _tts_audio_cache_instance is None:
+            _tts_audio_cache_instance = TTSAudioCache()
+        return _tts_audio_cache_instance
@@ -2,6 +2,8 @@ import os
 
 import redis
 from dotenv import load_dotenv
+from redis.backoff import NoBackoff
+from redis.retry import Retry
 
 load_dotenv()
 
@@ -9,8 +11,12 @@ REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT"))
 REDIS_DB = int(os.getenv("REDIS_DB"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+# 캐시용 클라이언트: Redis가 느리거나 죽어 있어도 요청이 OS connect timeout만큼 묶이지 않게
+REDIS_CACHE_CONNECT_TIMEOUT_SECONDS = float(os.getenv("REDIS_CACHE_CONNECT_TIMEOUT_SECONDS", "0.5"))
+REDIS_CACHE_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_CACHE_SOCKET_TIMEOUT_SECONDS", "0.5"))
 
 _redis_instance = None
+_cache_redis_instance = None
 
 def get_redis() -> redis.Redis:
     global _redis_instance
@@ -22,4 +28,20 @@ def get_redis() -> redis.Redis:
             password=REDIS_PASSWORD,
             decode_responses=True
         )
-    return _redis_instance
\ No newline at end of file
+    return _redis_instance
+
+def get_cache_redis() -> redis.Redis:
+    """캐시 tier 전용 클라이언트 (짧은 timeout, 재시도 없음 - 실패는 RedisTier가 backoff로 처리)"""
+    global _cache_redis_instance
+    if _cache_redis_instance is None:
+        _cache_redis_instance = redis.Redis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True,
+            socket_connect_timeout=REDIS_CACHE_CONNECT_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_CACHE_SOCKET_TIMEOUT_SECONDS,
+            retry=Retry(NoBackoff(), 0),
+        )
+    return _cache_redis_instance
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Redis 호출이 실패하면 이 시간 동안 Redis tier를 건너뛰고 로컬 tier만 사용
+REDIS_TIER_BACKOFF_SECONDS = float(os.getenv("REDIS_TIER_BACKOFF_SECONDS", "30"))
+
+
+class RedisTier:
+    """캐시들이 공유하는 Redis 접근 계층
+
+    - 클라이언트는 짧은 connect/socket timeout을 가진 get_cache_redis()를 쓴다.
+    - async 경로는 asyncio.to_thread로 호출해 이벤트 루프를 막지 않는다.
+    - 실패하면 backoff_seconds 동안 호출 자체를 하지 않고 None을 돌려준다 (캐시 miss 취급).
+      상태가 바뀔 때만 로그를 남긴다.
+    """
+
+    def __init__(self, name: str, enabled: bool = True, backoff_seconds: float = REDIS_TIER_BACKOFF_SECONDS):
+        self.name = name
+        self.enabled = enabled
+        self.backoff_seconds = backoff_seconds
+        self._client = None
+        self._down_until = 0.0
+        self._lock = threading.Lock()
+        self.failures = 0
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._down_until
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    try:
+                        from config.redis.redis_config import get_cache_redis
+                        self._client = get_cache_redis()
+                    except Exception as e:
+                        # 설정/패키지가 없으면 재시도해도 소용없으므로 끈다
+                        print(f"[WARN] {self.name} redis tier disabled: {e}")
+                        self.enabled = False
+                        return None
+        return self._client
+
+    def _failed(self, op: str, e: Exception) -> None:
+        self.failures += 1
+        was_up = self._down_until <= time.monotonic()
+        self._down_until = time.monotonic() + self.backoff_seconds
+        if was_up:
+            print(f"[WARN] {self.name} redis {op} failed, using local cache for {self.backoff_seconds:.0f}s: {e}")
+
+    def call_sync(self, op: str, fn: Callable[[Any], T]) -> Optional[T]:
+        """동기 코드(스크립트, 스케줄러 스레드)용. timeout이 짧아 오래 막히지 않는다"""
+        if not self.available:
+            return None
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            return fn(client)
+        except Exception as e:
+            self._failed(op, e)
+            return None
+
+    async def call(self, op: str, fn: Callable[[Any], T]) -> Optional[T]:
+        """async 경로용: 워커 스레드에서 실행 (Redis가 꺼져 있으면 스레드도 쓰지 않음)"""
+        if not self.available:
+            return None
+        return await asyncio.to_thread(self.call_sync, op, fn)
+
+    def stats(self) -> dict:
+        return {
+            "redis": self.enabled,
+            "redis_available": self.available,
+            "redis_failures": self.failures,
+        }
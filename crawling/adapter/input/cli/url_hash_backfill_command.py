@@ -0,0 +1,92 @@
+"""NewsArticle.url_hash 컬럼 추가 + 기존 행 채우기 + unique 인덱스 생성
+
+같은 URL(정규화 기준)이 이미 여러 행이면 가장 먼저 저장된 행(article_id 최소)만
+url_hash를 갖고 나머지는 NULL로 남긴 채 목록만 출력한다 (요약 이력이 걸려 있을 수 있어 삭제하지 않음).
+
+실행 예:
+    python -m crawling.adapter.input.cli.url_hash_backfill_command --batch-size 1000
+"""
+import argparse
+
+from dotenv import load_dotenv
+from sqlalchemy import bindparam, inspect, select, text, update
+
+from config.database.session import engine, get_db_session
+from crawling.domain.service.url_canonical import url_hash
+from news.infrastructure.orm.news_article_orm import NewsArticleORM
+
+URL_HASH_INDEX = "ux_news_article_url_hash"
+
+
+def ensure_column(bind) -> None:
+    table = NewsArticleORM.__tablename__
+    columns = {c["name"] for c in inspect(bind).get_columns(table)}
+    if "url_hash" in columns:
+        return
+    print(f"[INFO] ALTER {table} ADD url_hash")
+    with bind.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN url_hash VARCHAR(64) NULL"))
+
+
+def backfill(batch_size: int) -> dict:
+    table = NewsArticleORM.__table__
+    stmt = update(table).where(table.c.article_id == bindparam("b_id")).values(url_hash=bindparam("b_hash"))
+    result = {"filled": 0, "duplicates": []}
+    after_id = 0
+
+    db = get_db_session()
+    try:
+        while True:
+            rows = db.execute(
+                select(NewsArticleORM.article_id, NewsArticleORM.url)
+                .where(NewsArticleORM.article_id > after_id)
+                .where(NewsArticleORM.url_hash.is_(None))
+                .where(NewsArticleORM.url.is_not(None))
+                .order_by(NewsArticleORM.article_id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            after_id = rows[-1].article_id
+
+            hashes = {r.article_id: url_hash(r.url) for r in rows}
+            taken = set(db.execute(
+                select(NewsArticleORM.url_hash).where(NewsArticleORM.url_hash.in_(set(hashes.values())))
+            ).scalars())
+
+            params = []
+            for article_id, h in hashes.items():
+                if h in taken:
+                    result["duplicates"].append(article_id)
+                    continue
+                taken.add(h)
+                params.append({"b_id": article_id, "b_hash": h})
+            if params:
+                db.execute(stmt, params)
+                db.commit()
+                result["filled"] += len(params)
+            print(f"[INFO] up to article_id {after_id}: filled={result['filled']} duplicates={len(result['duplicates'])}")
+    finally:
+        db.close()
+    return result
+
+
+def main():
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Add and backfill NewsArticle.url_hash")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    ensure_column(engine)
+    result = backfill(args.batch_size)
+    if result["duplicates"]:
+        print(f"[WARN] {len(result['duplicates'])} duplicate articles left without url_hash: {result['duplicates'][:50]}")
+
+    index = next(i for i in NewsArticleORM.__table__.indexes if i.name == URL_HASH_INDEX)
+    index.create(bind=engine, checkfirst=True)
+    print(f"[INFO] url_hash backfill finished: filled={result['filled']}, index {URL_HASH_INDEX} ready")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException
 
-from crawling.adapter.input.web.request.crawling_data_request import CrawlingDataRequest
-from crawling.adapter.input.web.response.crawling_data_response import CrawlingDataResponse
+from crawling.adapter.input.web.request.crawling_data_request import CrawlingBulkRequest, CrawlingDataRequest
+from crawling.adapter.input.web.response.crawling_data_response import CrawlingBulkResponse, CrawlingDataResponse
 from crawling.application.usecase.news_crawling_usecase import NewsCrawlingUseCase
 
 crawling_router = APIRouter(tags=["crawling"])
@@ -18,8 +18,20 @@ async def crawling_data(request: CrawlingDataRequest):
             url=request.url,
             title=result.get("title"),
             contents=result.get("content"),
+            updated=result.get("updated", False),
         )
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@crawling_router.post("/copy/bulk", response_model=CrawlingBulkResponse)
+async def crawling_data_bulk(request: CrawlingBulkRequest):
+    try:
+        result = await usecase.execute_many([str(u) for u in request.urls], request.category_name)
+        return CrawlingBulkResponse(**result)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
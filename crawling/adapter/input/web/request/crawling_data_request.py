@@ -3,3 +3,8 @@ from pydantic import BaseModel, HttpUrl, Field
 class CrawlingDataRequest(BaseModel):
     url: HttpUrl
     category_name: str = Field(..., description="뉴스 카테고리 이름 (예: Politics, Sports)")
+
+
+class CrawlingBulkRequest(BaseModel):
+    urls: list[HttpUrl] = Field(..., min_length=1, max_length=100, description="수집할 기사 URL 목록 (최대 100개)")
+    category_name: str = Field(..., description="뉴스 카테고리 이름 (예: Politics, Sports)")
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
@@ -9,6 +9,7 @@ class CrawlingDataResponse(BaseModel):
     url: HttpUrl
     title: str
     contents: str
+    updated: bool = Field(False, description="이미 저장된 URL이라 기존 기사를 갱신했으면 true")
 
     @field_validator("contents")
     def limit_contents_length(cls, v: str) -> str:
@@ -18,3 +19,11 @@ class CrawlingDataResponse(BaseModel):
         if len(v) > max_len:
             return v[:max_len] + "..."  # 잘린 표시
         return v
+
+
+class CrawlingBulkResponse(BaseModel):
+    category_id: int
+    inserted_ids: List[int] = Field(default_factory=list, description="새로 저장된 NewsArticle ID")
+    updated_ids: List[int] = Field(default_factory=list, description="URL이 이미 있어 갱신된 NewsArticle ID")
+    ids_by_url: Dict[str, int] = Field(default_factory=dict)
+    errors: List[Dict[str, str]] = Field(default_factory=list, description="수집 실패한 URL과 사유")
@@ -1,27 +1,36 @@
 import asyncio
+import os
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException
 
+from common.concurrent_map import concurrent_map
 from crawling.domain.service.web_crawling import run_crawling
 from crawling.infrastructure.repository.news_article_repository import NewsArticleRepository
 
 
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))
+
+
 class NewsCrawlingUseCase:
     """Handle crawling flow: validate, crawl, map category, persist."""
 
     def __init__(self, repository: Optional[NewsArticleRepository] = None):
         self.repository = repository or NewsArticleRepository.getInstance()
 
-    async def execute(self, url: str, category_name: str) -> dict:
+    async def _resolve_category(self, category_name: str) -> int:
         category_name = (category_name or "").strip()
         if not category_name:
             raise HTTPException(status_code=400, detail="category_name is required.")
 
-        category_id = self.repository.get_category_id_by_name(category_name)
+        category_id = await self.repository.get_category_id_by_name(category_name)
         if category_id is None:
             raise HTTPException(status_code=404, detail=f"Category '{category_name}' not found.")
+        return category_id
+
+    async def execute(self, url: str, category_name: str) -> dict:
+        category_id = await self._resolve_category(category_name)
 
         title, content = await self._crawl(url)
         if not title:
@@ -29,20 +38,60 @@ class NewsCrawlingUseCase:
         if not content:
             raise HTTPException(status_code=400, detail="Crawled content is empty.")
 
-        article = self.repository.save_article(
-            category_id=category_id,
-            title=title,
-            content=content,
-            url=url,
-            published_at=datetime.utcnow(),
-        )
+        saved = await self.repository.upsert_articles([{
+            "category_id": category_id,
+            "title": title,
+            "content": content,
+            "url": url,
+            "published_at": datetime.utcnow(),
+        }])
 
         return {
-            "article_id": article.article_id,
+            "article_id": saved.ids_by_url.get(url),
             "category_id": category_id,
             "title": title,
             "content": content,
             "url": url,
+            "updated": bool(saved.updated_ids),
+        }
+
+    async def execute_many(self, urls: List[str], category_name: str) -> dict:
+        """여러 URL을 동시에 수집하고 한 번에 upsert (실패한 URL은 errors로 따로 반환)"""
+        category_id = await self._resolve_category(category_name)
+        urls = list(dict.fromkeys(urls))
+
+        async def _one(_, url: str):
+            try:
+                title, content = await self._crawl(url)
+            except HTTPException as e:
+                return url, None, e.detail
+            if not title or not content:
+                return url, None, "Crawled title or content is empty."
+            return url, (title, content), None
+
+        now = datetime.utcnow()
+        articles, errors = [], []
+        for r in await concurrent_map(_one, urls, concurrency=CRAWL_CONCURRENCY):
+            url, crawled, error = r.value
+            if error:
+                errors.append({"url": url, "detail": error})
+                continue
+            title, content = crawled
+            articles.append({
+                "category_id": category_id,
+                "title": title,
+                "content": content,
+                "url": url,
+                "published_at": now,
+            })
+
+        saved = await self.repository.upsert_articles(articles)
+        return {
+            "category_id": category_id,
+            "inserted_ids": saved.inserted_ids,
+            "updated_ids": saved.updated_ids,
+            "ids_by_url": saved.ids_by_url,
+            "errors": errors,
         }
 
     async def _crawl(self, url: str) -> Tuple[str, str]:
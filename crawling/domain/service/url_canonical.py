@@ -0,0 +1,36 @@
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 기사인데 유입 경로만 다른 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src"}
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """중복 판정용 정규화 URL
+
+    scheme/host 소문자, 기본 포트·fragment·추적 파라미터 제거, 쿼리 정렬,
+    경로 끝 '/' 제거 (루트 제외).
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "http"
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def url_hash(url: str) -> str:
+    """NewsArticle.url_hash 값 (canonical_url의 sha256 hex)"""
+    return hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
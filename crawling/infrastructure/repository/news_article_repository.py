@@ -1,11 +1,31 @@
+import os
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from config.database.session import get_db_session
+from config.database.count_cache import get_count_cache
+from config.database.query_cache import NS_ARTICLES, get_query_cache
+from config.database.session import db_session
+from crawling.domain.service.url_canonical import url_hash
 from news.infrastructure.orm.news_article_orm import NewsArticleORM
-from weather.infrastructure.orm.news_category_orm import NewsCategoryORM
+from news.infrastructure.repository.article_search_repository import plain_copy_enabled, plain_copy_upsert_stmt
+from news.infrastructure.repository.news_repository import article_count_key
+from weather.infrastructure.repository.category_registry import get_category_registry
+
+UPSERT_BATCH_SIZE = int(os.getenv("ARTICLE_UPSERT_BATCH_SIZE", "500"))
+# 이미 있는 URL을 다시 수집했을 때 갱신할 컬럼
+UPSERT_UPDATE_COLUMNS = ("title", "content", "image_url", "crawled_at")
+
+
+@dataclass
+class ArticleUpsertResult:
+    inserted_ids: List[int] = field(default_factory=list)
+    updated_ids: List[int] = field(default_factory=list)
+    ids_by_url: dict[str, int] = field(default_factory=dict)
 
 
 class NewsArticleRepository:
@@ -18,47 +38,97 @@ class NewsArticleRepository:
             cls.__instance = super().__new__(cls)
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, "db"):
-            self.db: Session = get_db_session()
-
     @classmethod
     def getInstance(cls):
         if cls.__instance is None:
             cls.__instance = cls()
         return cls.__instance
 
-    def get_category_id_by_name(self, category_name: str) -> Optional[int]:
-        category = (
-            self.db.query(NewsCategoryORM)
-            .filter(NewsCategoryORM.category_name == category_name)
-            .first()
-        )
-        return category.category_id if category else None
-
-    def save_article(
-        self,
-        *,
-        category_id: int,
-        title: str,
-        content: str,
-        url: Optional[str] = None,
-        summary: Optional[str] = None,
-        publisher_id: Optional[int] = None,
-        image_url: Optional[str] = None,
-        published_at: Optional[datetime] = None,
-    ) -> NewsArticleORM:
-        record = NewsArticleORM(
-            category_id=category_id,
-            publisher_id=publisher_id,
-            title=title,
-            content=content,
-            summary=summary,
-            url=url,
-            image_url=image_url,
-            published_at=published_at or datetime.utcnow(),
+    async def get_category_id_by_name(self, category_name: str) -> Optional[int]:
+        return await get_category_registry().id_by_name(category_name)
+
+    async def upsert_articles(self, articles: List[dict]) -> ArticleUpsertResult:
+        """url_hash 기준 bulk upsert (배치당 INSERT ... ON DUPLICATE KEY UPDATE 한 번 + commit 한 번)
+
+        articles: category_id, title, content, url 필수 / summary, publisher_id, image_url, published_at 선택.
+        이미 있는 URL은 제목·본문·이미지·crawled_at만 갱신하고 카테고리/발행일/요약은 유지한다.
+        """
+        now = datetime.utcnow()
+        rows: dict[str, dict] = {}
+        input_hashes = [url_hash(a["url"]) for a in articles]
+        for a, h in zip(articles, input_hashes):
+            # 같은 배치 안의 중복 URL은 마지막 값 사용
+            rows[h] = {
+                "url_hash": h,
+                "category_id": a["category_id"],
+                "publisher_id": a.get("publisher_id"),
+                "title": a["title"],
+                "content": a["content"],
+                "summary": a.get("summary"),
+                "url": a["url"],
+                "image_url": a.get("image_url"),
+                "published_at": a.get("published_at") or now,
+                "crawled_at": now,
+            }
+
+        result = ArticleUpsertResult()
+        hashes = list(rows)
+        id_by_hash: dict[str, int] = {}
+        touched_categories = set()
+        async with db_session() as db:
+            dialect_name = db.get_bind().dialect.name
+            for i in range(0, len(hashes), UPSERT_BATCH_SIZE):
+                batch = [rows[h] for h in hashes[i:i + UPSERT_BATCH_SIZE]]
+                batch_hashes = [r["url_hash"] for r in batch]
+                existing = await self._ids_by_hash(db, batch_hashes)
+
+                await db.execute(self._upsert_stmt(dialect_name, batch))
+                ids = await self._ids_by_hash(db, batch_hashes)
+                if plain_copy_enabled(dialect_name):
+                    # 본문 압축 저장 시 FULLTEXT 검색용 평문 사본도 같은 트랜잭션에서 갱신
+                    await db.execute(plain_copy_upsert_stmt(dialect_name, [
+                        {"article_id": ids[r["url_hash"]], "category_id": r["category_id"],
+                         "title": r["title"], "body": r["content"]}
+                        for r in batch if r["url_hash"] in ids
+                    ]))
+                await db.commit()
+
+                for r in batch:
+                    article_id = ids.get(r["url_hash"])
+                    if article_id is None:
+                        continue
+                    id_by_hash[r["url_hash"]] = article_id
+                    if r["url_hash"] in existing:
+                        result.updated_ids.append(article_id)
+                    else:
+                        result.inserted_ids.append(article_id)
+                        touched_categories.add(r["category_id"])
+        result.ids_by_url = {a["url"]: id_by_hash[h] for a, h in zip(articles, input_hashes) if h in id_by_hash}
+
+        # 새로 들어간 기사가 있는 카테고리 / 전체 목록 total 캐시 무효화
+        if touched_categories:
+            await get_count_cache().invalidate(
+                article_count_key(), *(article_count_key(c) for c in touched_categories)
+            )
+        # 새 기사든 갱신된 제목/이미지든 목록 응답이 바뀌므로 목록 캐시 무효화
+        if result.inserted_ids or result.updated_ids:
+            await get_query_cache().invalidate(NS_ARTICLES)
+        return result
+
+    @staticmethod
+    async def _ids_by_hash(db, hashes: List[str]) -> dict[str, int]:
+        stmt = select(NewsArticleORM.url_hash, NewsArticleORM.article_id).where(NewsArticleORM.url_hash.in_(hashes))
+        return {r.url_hash: r.article_id for r in (await db.execute(stmt)).all()}
+
+    @staticmethod
+    def _upsert_stmt(dialect_name: str, batch: List[dict]):
+        table = NewsArticleORM.__table__
+        if dialect_name == "mysql":
+            stmt = mysql_insert(table).values(batch)
+            return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in UPSERT_UPDATE_COLUMNS})
+        # SQLite(테스트/로컬) 등은 ON CONFLICT
+        stmt = sqlite_insert(table).values(batch)
+        return stmt.on_conflict_do_update(
+            index_elements=["url_hash"],
+            set_={c: stmt.excluded[c] for c in UPSERT_UPDATE_COLUMNS},
         )
-        self.db.add(record)
-        self.db.commit()
-        self.db.refresh(record)
-        return record
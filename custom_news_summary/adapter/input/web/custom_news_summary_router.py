@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import List, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Cookie, Query
 
@@ -28,7 +28,8 @@ custom_news_summary_usecase = CreateNewsSummaryUseCase(
 @custom_news_summary_router.get("/list", response_model=NewsSummaryListResponse)
 async def get_custom_news_history_list(
     session_id: str | None = Cookie(None),
-page: int = Query(1, ge=1), size: int = Query(10, ge=1)
+page: int = Query(1, ge=1), size: int = Query(10, ge=1),
+    total_mode: Literal["estimate", "exact", "none"] = Query("estimate", description="none이면 total을 세지 않음")
 ):
     try:
 
@@ -40,7 +41,7 @@ page: int = Query(1, ge=1), size: int = Query(10, ge=1)
 
         user_id = data.get("email")
 
-        historys, total = custom_news_summary_usecase.get_all_custom_news_history(user_id, page, size)
+        historys, total = await custom_news_summary_usecase.get_all_custom_news_history(user_id, page, size, total_mode)
 
         print("[INFO] history ", historys)
         return NewsSummaryListResponse.from_news_summary_history(historys, page, size, total)
@@ -63,7 +64,7 @@ async def create_summary_from_url(
 
         user_id = data.get("email")
 
-        summary = custom_news_summary_usecase.execute_from_url(user_id, str(request.url))
+        summary = await custom_news_summary_usecase.execute_from_url(user_id, str(request.url))
 
         return NewsSummaryResponse(
             summary_id=summary.summary_id,
@@ -104,7 +105,7 @@ async def create_summary_from_pdf(
         # 파일 읽기
         file_content = await file.read()
 
-        summary = custom_news_summary_usecase.execute_from_pdf(user_id, file_content, file.filename)
+        summary = await custom_news_summary_usecase.execute_from_pdf(user_id, file_content, file.filename)
 
         return NewsSummaryResponse(
             summary_id=summary.summary_id,
@@ -135,7 +136,7 @@ async def get_custom_news_history_detail(
 
         user_id = data.get("email")
 
-        summary = custom_news_summary_usecase.get_custom_new_history_detail(summary_id, user_id)
+        summary = await custom_news_summary_usecase.get_custom_new_history_detail(summary_id, user_id)
 
         return NewsSummaryResponse(
             summary_id=summary.summary_id,
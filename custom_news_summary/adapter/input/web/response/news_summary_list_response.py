@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 from custom_news_summary.adapter.input.web.response.news_summary_response import NewsSummaryResponse
 from custom_news_summary.domain.custom_news import NewsSummary
@@ -7,12 +7,12 @@ from custom_news_summary.domain.custom_news import NewsSummary
 
 class NewsSummaryListResponse(BaseModel):
     customNewsList: List[NewsSummaryResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
 
     @classmethod
-    def from_news_summary_history(cls, history: list[NewsSummary], page: int, size: int, total: int):
+    def from_news_summary_history(cls, history: list[NewsSummary], page: int, size: int, total: Optional[int]):
 
         return cls(
             customNewsList=[NewsSummaryResponse.from_news_summary(n) for n in history],
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
 from sqlalchemy import String
 
@@ -9,17 +9,17 @@ from custom_news_summary.domain.custom_news import NewsSummary
 class CustomNewsSummaryRepositoryPort(ABC):
 
     @abstractmethod
-    def save(self, news_summary: NewsSummary) -> NewsSummary:
+    async def save(self, news_summary: NewsSummary) -> NewsSummary:
         pass
 
     @abstractmethod
-    def find_all(self, user_id: String, page: int, size: int) -> list[NewsSummary]:
+    async def find_all(self, user_id: String, page: int, size: int, total_mode: str = "estimate") -> tuple[list[NewsSummary], Optional[int]]:
         pass
 
     @abstractmethod
-    def find_by_user_id(self, user_id: str) -> list[NewsSummary]:
+    async def find_by_user_id(self, user_id: str) -> list[NewsSummary]:
         pass
 
     @abstractmethod
-    def get_custom_new_history_detail(self, summary_id: int, user_id: str) -> NewsSummary:
+    async def get_custom_new_history_detail(self, summary_id: int, user_id: str) -> NewsSummary:
         pass
@@ -5,6 +5,6 @@ class TextSummarizerPort(ABC):
     """Summarizer Port - 인터페이스"""
 
     @abstractmethod
-    def summarize(self, content: str) -> tuple[str, str]:
+    async def summarize(self, content: str) -> tuple[str, str]:
         """Returns (title, summary_text)"""
-        pass
\ No newline at end of file
+        pass
@@ -1,4 +1,5 @@
-from typing import Tuple, List
+import asyncio
+from typing import Tuple, List, Optional
 
 from sqlalchemy import String
 
@@ -22,14 +23,15 @@ class CreateNewsSummaryUseCase:
         self.summarizer = summarizer
         self.file_storage = file_storage
 
-    def execute_from_url(self, user_id: str, url: str) -> NewsSummary:
-        content = self.crawler.crawl(url)
+    async def execute_from_url(self, user_id: str, url: str) -> NewsSummary:
+        # 크롤러는 blocking HTTP 호출이라 스레드에서 실행
+        content = await asyncio.to_thread(self.crawler.crawl, url)
 
         print("[INFO] content", content)
         if not content:
             raise ValueError("크롤링이 불가능한 url입니다.")
 
-        title, summary_text = self.summarizer.summarize(content)
+        title, summary_text = await self.summarizer.summarize(content)
 
         # 3. 도메인 엔티티 생성
         news_summary = NewsSummary(
@@ -46,14 +48,14 @@ class CreateNewsSummaryUseCase:
         )
 
         # 4. 저장
-        return self.repository.save(news_summary)
+        return await self.repository.save(news_summary)
 
-    def execute_from_pdf(self, user_id: str, file_content: bytes, file_name: str) -> NewsSummary:
+    async def execute_from_pdf(self, user_id: str, file_content: bytes, file_name: str) -> NewsSummary:
         file_path = self.file_storage.save_file(file_content, file_name)
 
         content = "PDF에서 추출한 텍스트"
 
-        title, summary_text = self.summarizer.summarize(content)
+        title, summary_text = await self.summarizer.summarize(content)
 
         # 4. 도메인 엔티티 생성
         news_summary = NewsSummary(
@@ -68,13 +70,15 @@ class CreateNewsSummaryUseCase:
         )
 
         # 5. 저장
-        return self.repository.save(news_summary)
+        return await self.repository.save(news_summary)
 
 
-    def get_all_custom_news_history(self, user_id: str, page: int = 1, size: int = 10) -> Tuple[List[NewsSummary], int]:
-        custom_news_history, total = self.repository.find_all(user_id, page, size)
+    async def get_all_custom_news_history(
+            self, user_id: str, page: int = 1, size: int = 10, total_mode: str = "estimate"
+    ) -> Tuple[List[NewsSummary], Optional[int]]:
+        custom_news_history, total = await self.repository.find_all(user_id, page, size, total_mode)
         return custom_news_history, total
 
-    def get_custom_new_history_detail(self, summary_id: int, user_id: str) -> NewsSummary:
-        summary = self.repository.get_custom_new_history_detail(summary_id, user_id)
+    async def get_custom_new_history_detail(self, summary_id: int, user_id: str) -> NewsSummary:
+        summary = await self.repository.get_custom_new_history_detail(summary_id, user_id)
         return summary
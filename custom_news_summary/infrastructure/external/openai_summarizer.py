@@ -1,39 +1,90 @@
+import json
 import os
+from typing import Optional
 
-from openai import OpenAI
-
+from config.openai.llm_gateway import get_llm_gateway
 from custom_news_summary.application.port.summarizer_port import TextSummarizerPort
 
+SUMMARY_MODEL = "gpt-4o-mini"
+LLM_USE_CASE = "custom_news_summary"
+STRUCTURED_OUTPUT = os.getenv("SUMMARY_STRUCTURED_OUTPUT", "1") != "0"
+
+# 제목+요약을 한 번의 호출로 받기 위한 JSON schema (structured outputs)
+TITLE_SUMMARY_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "news_title_summary",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "요약문에 맞는 짧은 제목"},
+                "summary": {"type": "string", "description": "뉴스 기사의 간결한 요약"},
+            },
+            "required": ["title", "summary"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def parse_title_summary(raw: str) -> Optional[tuple[str, str]]:
+    """structured 응답에서 (title, summary) 추출, 형식이 맞지 않으면 None"""
+    try:
+        data = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    title = str(data.get("title") or "").strip()
+    summary_text = str(data.get("summary") or "").strip()
+    if not title or not summary_text:
+        return None
+    return title, summary_text
+
 
 class OpenAISummarizer(TextSummarizerPort):
 
     def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is not set")
-        self.client = OpenAI(api_key=api_key)
-
-    def summarize(self, content: str) -> tuple[str, str]:
-        # 요약 생성
-        summary_response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "뉴스 기사를 간결하게 요약해주세요."},
-                {"role": "user", "content": content}
-            ]
-        )
-
-        summary_text = summary_response.choices[0].message.content
+        self.llm = get_llm_gateway()
 
-        # 제목 생성
-        title_response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "요약문에 맞는 짧은 제목을 생성하세요."},
-                {"role": "user", "content": summary_text}
-            ]
-        )
+    async def summarize(self, content: str) -> tuple[str, str]:
+        if STRUCTURED_OUTPUT:
+            result = await self._summarize_structured(content)
+            if result is not None:
+                return result
+            print("[WARN] structured title/summary failed, falling back to two calls")
+        return await self._summarize_two_calls(content)
+
+    async def _summarize_structured(self, content: str) -> Optional[tuple[str, str]]:
+        messages = [
+            {"role": "system", "content": "뉴스 기사를 간결하게 요약하고, 요약문에 맞는 짧은 제목을 생성하세요."},
+            {"role": "user", "content": content}
+        ]
+        try:
+            # 파싱되는 응답만 캐시 (잘린/깨진 JSON이 캐시에 남아 계속 fallback 되지 않게)
+            raw = await self.llm.chat(
+                SUMMARY_MODEL, messages, cache=True, use_case=LLM_USE_CASE, response_format=TITLE_SUMMARY_FORMAT,
+                validate=lambda r: parse_title_summary(r) is not None,
+            )
+        except Exception as e:
+            print(f"[WARN] structured summary call failed: {type(e).__name__}: {e}")
+            return None
+        return parse_title_summary(raw)
 
-        title = title_response.choices[0].message.content.strip()
+    async def _summarize_two_calls(self, content: str) -> tuple[str, str]:
+        # 요약 생성 (같은 본문은 캐시된 요약 재사용)
+        summary_messages = [
+            {"role": "system", "content": "뉴스 기사를 간결하게 요약해주세요."},
+            {"role": "user", "content": content}
+        ]
+        summary_text = await self.llm.chat(SUMMARY_MODEL, summary_messages, cache=True, use_case=LLM_USE_CASE)
+
+        # 제목 생성
+        title_messages = [
+            {"role": "system", "content": "요약문에 맞는 짧은 제목을 생성하세요."},
+            {"role": "user", "content": summary_text}
+        ]
+        title = (await self.llm.chat(SUMMARY_MODEL, title_messages, cache=True, use_case=LLM_USE_CASE)).strip()
 
-        return title, summary_text
\ No newline at end of file
+        return title, summary_text
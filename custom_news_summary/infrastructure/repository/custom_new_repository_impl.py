@@ -1,37 +1,42 @@
-from sqlalchemy import String, desc
+from typing import Optional
 
-from config.database.session import get_db_session
-from sqlalchemy.orm import Session
+from sqlalchemy import String, desc, func, select
+
+from config.database.count_cache import count_key, get_count_cache
+from config.database.session import db_read_session, db_session
 
 from custom_news_summary.application.port.custom_new_repository_port import CustomNewsSummaryRepositoryPort
 from custom_news_summary.domain.custom_news import NewsSummary
 from custom_news_summary.infrastructure.orm.custom_news_summary_orm import CustomNewsSummaryORM, SourceType
 
 
-class CustomNewsSummaryRepositoryImpl(CustomNewsSummaryRepositoryPort):
-    def __init__(self):
-        self.db: Session = get_db_session()
+def history_count_key(user_id: str) -> str:
+    return count_key(CustomNewsSummaryORM.__tablename__, user_id=user_id)
+
 
-    def save(self, news_summary: NewsSummary) -> NewsSummary:
+class CustomNewsSummaryRepositoryImpl(CustomNewsSummaryRepositoryPort):
+    async def save(self, news_summary: NewsSummary) -> NewsSummary:
         """도메인 → ORM 변환 후 저장"""
 
         # 1. 도메인 엔티티 → ORM 엔티티 변환
         orm_entity = self._to_orm(news_summary)
 
         # 2. DB 저장
-        self.db.add(orm_entity)
-        self.db.commit()
-        self.db.refresh(orm_entity)
+        async with db_session() as db:
+            db.add(orm_entity)
+            await db.commit()
+            await db.refresh(orm_entity)
+        await get_count_cache().invalidate(history_count_key(orm_entity.user_id))
 
         # 3. ORM → 도메인 엔티티 변환 후 반환
         return self._to_domain(orm_entity)
 
-    def find_by_user_id(self, user_id: str) -> list[NewsSummary]:
+    async def find_by_user_id(self, user_id: str) -> list[NewsSummary]:
 
         # 1. ORM으로 조회
-        orm_results = self.session.query(CustomNewsSummaryORM) \
-            .filter_by(user_id=user_id) \
-            .all()
+        async with db_read_session() as db:
+            result = await db.execute(select(CustomNewsSummaryORM).filter_by(user_id=user_id))
+            orm_results = result.scalars().all()
 
         # 2. ORM → 도메인 엔티티 변환
         return [self._to_domain(orm) for orm in orm_results]
@@ -62,21 +67,33 @@ class CustomNewsSummaryRepositoryImpl(CustomNewsSummaryRepositoryPort):
             created_at=orm.created_at
         )
 
-    def find_all(self, user_id: str, page: int, size: int) -> tuple[list[NewsSummary], int]:
-        query = (self.db.query(CustomNewsSummaryORM)
-                 .filter(CustomNewsSummaryORM.user_id == user_id)
+    async def find_all(
+            self, user_id: str, page: int, size: int, total_mode: str = "estimate"
+    ) -> tuple[list[NewsSummary], Optional[int]]:
+        where = CustomNewsSummaryORM.user_id == user_id
+        query = (select(CustomNewsSummaryORM)
+                 .where(where)
                  .order_by(desc(CustomNewsSummaryORM.created_at))
                  )
 
-        total = query.count()
+        # 페이지를 먼저 읽는다: primary 세션을 연 뒤에는 같은 요청의 읽기도 primary로 간다
+        async with db_read_session() as db:
+            orms = (await db.execute(query.offset((page - 1) * size).limit(size))).scalars().all()
+
+        async def _count() -> int:
+            # 캐시에 남는 값이라 복제 지연으로 옛 COUNT가 박히지 않게 primary에서 센다
+            async with db_session() as primary:
+                return (await primary.execute(select(func.count()).select_from(CustomNewsSummaryORM).where(where))).scalar_one()
+
+        total = await get_count_cache().get_or_count(history_count_key(user_id), _count, mode=total_mode)
 
         print(total)
-        orms = query.offset((page - 1) * size).limit(size).all()
         print(orms)
         return [NewsSummary.from_orm(orm) for orm in orms], total
 
-    def get_custom_new_history_detail(self, summary_id:int, user_id: str) -> NewsSummary:
-        query = self.db.query(CustomNewsSummaryORM).filter(CustomNewsSummaryORM.summary_id == summary_id).filter(CustomNewsSummaryORM.user_id == user_id)
+    async def get_custom_new_history_detail(self, summary_id:int, user_id: str) -> NewsSummary:
+        query = select(CustomNewsSummaryORM).where(CustomNewsSummaryORM.summary_id == summary_id).where(CustomNewsSummaryORM.user_id == user_id)
 
-        result = query.first()
+        async with db_read_session() as db:
+            result = (await db.execute(query)).scalars().first()
         return result
\ No newline at end of file
@@ -1,13 +1,20 @@
 from fastapi import UploadFile, Form, HTTPException
 from fastapi.responses import JSONResponse
-from openai import OpenAI
 from pypdf import PdfReader
-import asyncio
 import io
+import os
 import re
-from typing import List
+from typing import List, Optional
 
-client = OpenAI()
+from common.concurrent_map import concurrent_map, timings_of
+from common.stage_graph import Stage, StageGraph
+from common.token_chunker import chunk_by_tokens
+from common.tree_reduce import tree_reduce
+from config.openai.llm_gateway import get_llm_gateway
+
+llm = get_llm_gateway()
+DOCUMENT_MODEL = "gpt-4.1"
+STAGE_TIMEOUT_SECONDS = float(os.getenv("ANALYZE_STAGE_TIMEOUT_SECONDS", "60"))
 
 # PDF 텍스트 추출
 def extract_text_from_pdf_clean(file_bytes: bytes) -> str:
@@ -24,50 +31,46 @@ def extract_text_from_pdf_clean(file_bytes: bytes) -> str:
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
 
-# 텍스트 청킹
-def chunk_text(text: str, chunk_size=3500, overlap=300) -> List[str]:
-    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    chunks, cur = [], ""
-    for p in paragraphs:
-        if len(cur) + len(p) <= chunk_size:
-            cur += " " + p
-        else:
-            chunks.append(cur.strip())
-            cur = p
-    if cur:
-        chunks.append(cur.strip())
-    return chunks
-
 # GPT 호출 래퍼
 async def ask_gpt(prompt: str, max_tokens=500):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda:
-        client.chat.completions.create(
-            model="gpt-4.1",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
-            temperature=0
-        ).choices[0].message.content
+    return await llm.chat(
+        model=DOCUMENT_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=0,
+        use_case="documents"
     )
 
 # 문서 요약 에이전트 (섹션 요약 후 전체 요약)
-async def summarize_document(chunks: List[str]) -> str:
-    partial_summaries = []
-
-    for idx, chunk in enumerate(chunks):
+async def summarize_document(chunks: List[str], concurrency: Optional[int] = None) -> dict:
+    async def _summarize_chunk(idx: int, chunk: str) -> str:
         prompt = f"""
 다음은 문서의 일부이다. 이 문단을 핵심 내용만 유지하며 간결하게 요약해라.
 
 문단({idx+1}):
 {chunk}
 """
-        summary = await ask_gpt(prompt, max_tokens=400)
-        partial_summaries.append(summary)
+        return await ask_gpt(prompt, max_tokens=400)
 
-    merged = "\n".join(partial_summaries)
+    # 섹션 요약은 동시에 실행하되 원래 순서대로 합친다
+    results = await concurrent_map(_summarize_chunk, chunks, concurrency=concurrency)
+    partial_summaries = [r.value for r in results]
+
+    # 중간 통합 (요약문이 한 프롬프트에 안 들어갈 때만, 인접한 요약끼리 묶어서)
+    async def _merge_group(_: int, group: List[str]) -> str:
+        merged = "\n".join(group)
+        prompt = f"""
+다음은 문서의 연속된 구간 요약문들이다. 중복을 제거하고 핵심만 유지하며 하나로 합쳐라.
+
+내용:
+{merged}
+"""
+        return await ask_gpt(prompt, max_tokens=500)
 
     # 전체 요약
-    final_prompt = f"""
+    async def _final(texts: List[str]) -> str:
+        merged = "\n".join(texts)
+        final_prompt = f"""
 다음은 여러 요약문을 결합한 것이다. 이 내용을 다시 한 번 전체 핵심만 유지하며 통합 요약해라.
 
 내용:
@@ -76,8 +79,16 @@ async def summarize_document(chunks: List[str]) -> str:
 출력 형식:
 - 전체 요약 1개 문단
 """
-    final_summary = await ask_gpt(final_prompt, max_tokens=500)
-    return final_summary.strip()
+        return await ask_gpt(final_prompt, max_tokens=500)
+
+    reduced = await tree_reduce(
+        partial_summaries, _merge_group, _final, model=DOCUMENT_MODEL, concurrency=concurrency
+    )
+    return {
+        "summary": reduced.value.strip(),
+        "chunk_timings": timings_of(results),
+        "reduce": reduced.meta(),
+    }
 
 # QA 에이전트
 async def qa_on_document(summary: str, question: str) -> str:
@@ -128,24 +139,40 @@ async def analyze_document(file: UploadFile, question: str = Form(...)):
         if not text:
             raise HTTPException(400, "No text extracted")
 
-        chunks = chunk_text(text)
+        chunks = chunk_by_tokens(text, model=DOCUMENT_MODEL)
         if not chunks:
             raise HTTPException(500, "Chunking failed")
 
-        # 1. 요약
-        summary = await summarize_document(chunks)
-
-        # 2. QA
-        answer = await qa_on_document(summary, question)
-
-        # 3. 감성 분석 + 키포인트
-        analysis = await analyze_opinions(summary)
+        # 1. 요약 -> 2. QA, 3. 감성 분석 + 키포인트 (2, 3은 요약만 있으면 동시에 실행)
+        graph = StageGraph([
+            Stage("summary", lambda _: summarize_document(chunks)),
+            Stage(
+                "answer",
+                lambda deps: qa_on_document(deps["summary"]["summary"], question),
+                depends_on=("summary",),
+                timeout=STAGE_TIMEOUT_SECONDS,
+                required=False,
+            ),
+            Stage(
+                "analysis",
+                lambda deps: analyze_opinions(deps["summary"]["summary"]),
+                depends_on=("summary",),
+                timeout=STAGE_TIMEOUT_SECONDS,
+                required=False,
+                fallback={"sentiment": "unknown", "key_points": []},
+            ),
+        ])
+        result = await graph.run()
+        summarized = result.values["summary"]
 
         return JSONResponse({
             "parsed_text": text,
-            "summary": summary,
-            "answer": answer,
-            "analysis": analysis
+            "summary": summarized["summary"],
+            "answer": result.values["answer"],
+            "analysis": result.values["analysis"],
+            "chunk_timings": summarized["chunk_timings"],
+            "reduce": summarized["reduce"],
+            "stages": result.metadata
         })
 
     except Exception as e:
@@ -33,7 +33,7 @@ async def process_google_redirect(
     print("profile:", profile)
 
     # 계정 생성/조회
-    account = account_usecase.create_or_get_account(
+    account = await account_usecase.create_or_get_account(
         profile.get("email"),
         profile.get("name")
     )
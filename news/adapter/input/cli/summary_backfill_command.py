@@ -0,0 +1,52 @@
+"""NewsArticle.summary 일괄 backfill
+
+실행 예:
+    python -m news.adapter.input.cli.summary_backfill_command --page-size 500
+    python -m news.adapter.input.cli.summary_backfill_command --local   # Batch API 대신 로컬 처리
+    python -m news.adapter.input.cli.summary_backfill_command --reset   # 처음부터 다시
+    python -m news.adapter.input.cli.summary_backfill_command --retry-failed   # 실패한 기사 다시 요청
+"""
+import argparse
+
+from dotenv import load_dotenv
+
+from config.database.session import get_db_session
+from news.application.usecase.summary_backfill_usecase import SummaryBackfillUseCase
+
+
+def main():
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Backfill NULL NewsArticle.summary via the OpenAI Batch API")
+    parser.add_argument("--page-size", type=int, default=500, help="배치 하나에 넣을 기사 수")
+    parser.add_argument("--max-pages", type=int, default=None, help="이번 실행에서 처리할 최대 배치 수")
+    parser.add_argument("--poll-interval", type=float, default=30.0, help="배치 상태 조회 간격(초)")
+    parser.add_argument("--work-dir", default="./backfill", help="요청 파일과 진행 상태를 저장할 디렉터리")
+    parser.add_argument("--local", action="store_true", help="Batch API 대신 로컬 게이트웨이로 처리")
+    parser.add_argument("--reset", action="store_true", help="저장된 진행 상태를 지우고 처음부터 시작")
+    parser.add_argument("--retry-failed", action="store_true", help="이전 실행에서 실패한 기사를 먼저 다시 요청")
+    args = parser.parse_args()
+
+    if args.local:
+        from news.infrastructure.external.local_batch_client import LocalBatchClient
+        batch_client = LocalBatchClient(base_path=f"{args.work_dir}/local_batches")
+    else:
+        from news.infrastructure.external.openai_batch_client import OpenAIBatchClient
+        batch_client = OpenAIBatchClient()
+
+    usecase = SummaryBackfillUseCase(
+        db_factory=get_db_session,
+        batch_client=batch_client,
+        work_dir=args.work_dir,
+        page_size=args.page_size,
+        poll_interval_seconds=args.poll_interval,
+    )
+    if args.reset:
+        usecase.reset()
+
+    result = usecase.run(max_pages=args.max_pages, retry_failed=args.retry_failed)
+    print(f"[INFO] backfill finished: {result}")
+
+
+if __name__ == "__main__":
+    main()
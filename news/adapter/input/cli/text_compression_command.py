@@ -0,0 +1,195 @@
+"""NewsArticle.content / SummaryHistory.summary_text 압축 저장 전환
+
+1) 사전 학습 (한국어 뉴스 샘플로 zstd 사전 생성):
+    python -m news.adapter.input.cli.text_compression_command train --samples 5000
+2) 기존 행 압축 (MySQL은 컬럼을 LONGBLOB으로 바꾼 뒤 배치 단위로 압축, 중단 후 재실행 가능):
+    TEXT_ZSTD_DICT=news_ko-<id>.dict python -m news.adapter.input.cli.text_compression_command migrate
+3) MySQL FULLTEXT 검색용 평문 사본(NewsArticleSearch) 채우기 (재실행 시 이어서/갱신):
+    python -m news.adapter.input.cli.text_compression_command search-copy
+4) 서버에 TEXT_COMPRESSION=zstd, TEXT_ZSTD_DICT=news_ko-<id>.dict 설정 후 재시작
+   (재시작 시 NewsArticleSearch에 FULLTEXT 인덱스를 만들고 검색이 그쪽으로 바뀜)
+"""
+import argparse
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import LargeBinary, bindparam, desc, literal_column, select, text, update
+
+from config.database.compressed_text import DEFAULT_DICT_SIZE, TextCodec, is_compressed, train_dictionary
+from config.database.session import get_db_session
+from news.infrastructure.orm.news_article_orm import NewsArticleORM
+from news.infrastructure.orm.news_article_search_orm import NewsArticleSearchORM
+from news.infrastructure.repository.article_search_repository import plain_copy_upsert_stmt
+from weather.infrastructure.orm.summary_history_orm import SummaryHistoryORM
+
+# 이름 -> (테이블, PK 컬럼, 대상 컬럼)
+TARGETS = {
+    "NewsArticle.content": (NewsArticleORM.__table__, "article_id", "content"),
+    "SummaryHistory.summary_text": (SummaryHistoryORM.__table__, "summary_id", "summary_text"),
+}
+
+
+def _raw(column_name: str):
+    # 타입 처리 없이 드라이버 값을 그대로 (압축 여부 판단용)
+    return literal_column(column_name).label("raw")
+
+
+def ensure_blob_column(db, table, column_name: str) -> None:
+    """MySQL TEXT 컬럼을 LONGBLOB으로 변경 (기존 값은 utf-8 바이트로 유지됨)"""
+    if db.bind.dialect.name != "mysql":
+        return
+    data_type = db.execute(
+        text(
+            "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND COLUMN_NAME = :c"
+        ),
+        {"t": table.name, "c": column_name},
+    ).scalar()
+    if data_type and data_type.lower() != "longblob":
+        null = "NULL" if table.c[column_name].nullable else "NOT NULL"
+        print(f"[INFO] ALTER {table.name}.{column_name} {data_type} -> LONGBLOB")
+        db.execute(text(f"ALTER TABLE `{table.name}` MODIFY `{column_name}` LONGBLOB {null}"))
+        db.commit()
+
+
+def migrate(name: str, codec: TextCodec, batch_size: int, after_id: int = 0) -> dict:
+    table, pk_name, column_name = TARGETS[name]
+    pk = table.c[pk_name]
+    stmt = update(table).where(pk == bindparam("b_pk")).values(
+        {column_name: bindparam("b_value", type_=LargeBinary)}
+    )
+    result = {"scanned": 0, "compressed": 0, "bytes_before": 0, "bytes_after": 0}
+
+    db = get_db_session()
+    try:
+        ensure_blob_column(db, table, column_name)
+        while True:
+            rows = db.execute(
+                select(pk, _raw(column_name))
+                .select_from(table)
+                .where(pk > after_id)
+                .order_by(pk)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            after_id = rows[-1][0]
+            result["scanned"] += len(rows)
+
+            params = []
+            for row_id, raw in rows:
+                if raw is None or is_compressed(raw):
+                    continue
+                plain = raw if isinstance(raw, str) else bytes(raw).decode("utf-8")
+                encoded = codec.encode(plain, force=True)
+                result["bytes_before"] += len(plain.encode("utf-8"))
+                result["bytes_after"] += len(encoded)
+                if is_compressed(encoded):
+                    params.append({"b_pk": row_id, "b_value": encoded})
+            if params:
+                db.execute(stmt, params)
+                db.commit()
+                result["compressed"] += len(params)
+            print(f"[INFO] {name}: up to id {after_id}, scanned={result['scanned']} compressed={result['compressed']}")
+    finally:
+        db.close()
+
+    if result["bytes_before"]:
+        result["ratio"] = round(result["bytes_after"] / result["bytes_before"], 3)
+    return result
+
+
+def fill_search_copy(batch_size: int, after_id: int = 0) -> dict:
+    """NewsArticle 제목/본문을 NewsArticleSearch에 평문으로 복사 (압축된 본문은 풀어서)"""
+    result = {"copied": 0}
+    db = get_db_session()
+    try:
+        dialect_name = db.bind.dialect.name
+        NewsArticleSearchORM.__table__.create(bind=db.bind, checkfirst=True)
+        while True:
+            rows = db.execute(
+                select(NewsArticleORM.article_id, NewsArticleORM.category_id,
+                       NewsArticleORM.title, NewsArticleORM.content)
+                .where(NewsArticleORM.article_id > after_id)
+                .order_by(NewsArticleORM.article_id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            after_id = rows[-1].article_id
+            db.execute(plain_copy_upsert_stmt(dialect_name, [
+                {"article_id": r.article_id, "category_id": r.category_id, "title": r.title, "body": r.content}
+                for r in rows
+            ]))
+            db.commit()
+            result["copied"] += len(rows)
+            print(f"[INFO] NewsArticleSearch: up to id {after_id}, copied={result['copied']}")
+    finally:
+        db.close()
+    return result
+
+
+def sample_texts(name: str, limit: int) -> list[str]:
+    table, pk_name, column_name = TARGETS[name]
+    codec = TextCodec(enabled=False)
+    db = get_db_session()
+    try:
+        rows = db.execute(
+            select(_raw(column_name))
+            .select_from(table)
+            .where(literal_column(column_name).is_not(None))
+            .order_by(desc(table.c[pk_name]))
+            .limit(limit)
+        ).all()
+    finally:
+        db.close()
+    return [t for t in (codec.decode(r.raw) for r in rows) if t]
+
+
+def main():
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Compress long text columns with zstd")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_train = sub.add_parser("train", help="최근 행으로 zstd 사전 학습")
+    p_train.add_argument("--samples", type=int, default=5000, help="대상별 샘플 행 수")
+    p_train.add_argument("--dict-size", type=int, default=DEFAULT_DICT_SIZE)
+
+    p_migrate = sub.add_parser("migrate", help="기존 평문 행을 배치 단위로 압축")
+    p_migrate.add_argument("--target", choices=sorted(TARGETS), action="append", help="기본: 전부")
+    p_migrate.add_argument("--batch-size", type=int, default=500)
+    p_migrate.add_argument("--after-id", type=int, default=0, help="이 PK 다음부터 시작 (재개용)")
+
+    p_copy = sub.add_parser("search-copy", help="FULLTEXT 검색용 평문 사본(NewsArticleSearch) 채우기")
+    p_copy.add_argument("--batch-size", type=int, default=500)
+    p_copy.add_argument("--after-id", type=int, default=0, help="이 article_id 다음부터 시작 (재개용)")
+    args = parser.parse_args()
+
+    if args.command == "search-copy":
+        started = time.perf_counter()
+        result = fill_search_copy(args.batch_size, args.after_id)
+        print(f"[INFO] search copy done in {time.perf_counter() - started:.1f}s: {result}")
+        return
+
+    if args.command == "train":
+        samples = []
+        for name in TARGETS:
+            samples.extend(sample_texts(name, args.samples))
+        if not samples:
+            raise SystemExit("no text rows to train on")
+        path = train_dictionary(samples, dict_size=args.dict_size)
+        print(f"[INFO] trained on {len(samples)} samples -> {path}")
+        print(f"[INFO] set TEXT_ZSTD_DICT={path.rsplit('/', 1)[-1]}")
+        return
+
+    codec = TextCodec(enabled=True)
+    print(f"[INFO] compressing with dict_id={codec.dict_id or 'none'} level={codec.level}")
+    for name in args.target or sorted(TARGETS):
+        started = time.perf_counter()
+        result = migrate(name, codec, args.batch_size, args.after_id)
+        print(f"[INFO] {name} done in {time.perf_counter() - started:.1f}s: {result}")
+
+
+if __name__ == "__main__":
+    main()
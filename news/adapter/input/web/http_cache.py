@@ -0,0 +1,42 @@
+import hashlib
+import os
+from typing import Optional
+
+from fastapi import Response
+
+# 브라우저/CDN이 재검증 없이 쓰는 시간, 그 뒤 백그라운드 재검증 동안 옛 응답을 쓸 수 있는 시간
+NEWS_HTTP_MAX_AGE = int(os.getenv("NEWS_HTTP_MAX_AGE", "30"))
+NEWS_HTTP_STALE_WHILE_REVALIDATE = int(os.getenv("NEWS_HTTP_STALE_WHILE_REVALIDATE", "60"))
+
+
+def strong_etag(version: str) -> str:
+    return '"' + hashlib.sha256(version.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110: weak 비교라 W/ 접두어는 무시, '*'는 항상 일치)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def cache_headers(etag: str) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={NEWS_HTTP_MAX_AGE}, stale-while-revalidate={NEWS_HTTP_STALE_WHILE_REVALIDATE}"
+        ),
+        "Vary": "Accept-Encoding",
+    }
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
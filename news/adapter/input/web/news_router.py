@@ -1,12 +1,15 @@
-﻿from datetime import datetime
+﻿import json
+from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from urllib.parse import quote
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.database.session import get_db
+from config.database.session import get_async_db, get_async_read_db
 
+from news.adapter.input.web.http_cache import cache_headers, etag_matches, not_modified, strong_etag
 from news.adapter.input.web.request.news_analyze_request import NewsTextAnalyzeRequest
 from news.adapter.input.web.request.news_summary_request import NewsSummarizeRequest
 from news.adapter.input.web.response.news_detail_response import NewsSummaryResponse, ArticleDetailResponse
@@ -16,13 +19,13 @@ news_router = APIRouter(tags=["news"])
 news_usecase = NewsUseCase()
 
 @news_router.post("/summarize", response_model=NewsSummaryResponse)
-async def summarize_news(request: NewsSummarizeRequest, db: Session = Depends(get_db)):
+async def summarize_news(request: NewsSummarizeRequest, db: AsyncSession = Depends(get_async_db)):
     result = await news_usecase.summarize_news(request.text)
 
     # 요약을 기사와 연결해야 하는 경우 SummaryHistory에 저장
     if request.article_id:
         try:
-            news_usecase.save_summary_history(db=db, article_id=request.article_id, summary_text=result.get("summary"))
+            await news_usecase.save_summary_history(db=db, article_id=request.article_id, summary_text=result.get("summary"))
         except HTTPException as e:
             # 연결 실패해도 요약 응답은 반환
             print(f"[WARN] failed to save summary history: {e.detail}")
@@ -36,10 +39,39 @@ async def analyze_news(req: NewsTextAnalyzeRequest):
         question=req.question,
         max_bullets=req.max_summary_bullets,
         model=req.model,
+        map_concurrency=req.map_concurrency,
+    )
+
+
+def _sse(event: dict) -> str:
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+
+@news_router.post("/analyze/stream")
+async def analyze_news_stream(req: NewsTextAnalyzeRequest):
+    # 입력 검증 실패는 스트림 시작 전에 4xx로 응답
+    events = news_usecase.analyze_stream(
+        text=req.text,
+        question=req.question,
+        max_bullets=req.max_summary_bullets,
+        model=req.model,
+        map_concurrency=req.map_concurrency,
+    )
+
+    async def event_source():
+        try:
+            async for event in events:
+                yield _sse(event)
+        except HTTPException as e:
+            yield _sse({"event": "error", "data": {"status_code": e.status_code, "detail": e.detail}})
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 @news_router.post("/summarize/pdf")
-async def summarize_news_pdf(request: NewsSummarizeRequest, db: Session = Depends(get_db)):
+async def summarize_news_pdf(request: NewsSummarizeRequest):
     result = await news_usecase.summarize_news(request.text)
     summary = (result.get("summary") or "").strip()
     if not summary:
@@ -57,28 +89,79 @@ async def summarize_news_pdf(request: NewsSummarizeRequest, db: Session = Depend
     )
 
 @news_router.get("/categories")
-def list_categories(db: Session = Depends(get_db)):
-    return news_usecase.list_categories(db=db)
+async def list_categories(db: AsyncSession = Depends(get_async_read_db)):
+    return await news_usecase.list_categories(db=db)
 
 
 def _parse_date(s: str) -> datetime:
     return datetime.strptime(s, "%Y-%m-%d")
 
 @news_router.get("/articles")
-def list_articles(
-    db: Session = Depends(get_db),
+async def list_articles(
+    db: AsyncSession = Depends(get_async_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     category_id: int | None = Query(None),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (빈 값이면 첫 페이지, page/total 없이 조회)"),
+    total_mode: Literal["estimate", "exact", "none"] = Query(
+        "estimate", description="estimate: 캐시된 개수, exact: 매번 COUNT, none: 세지 않음 (무한 스크롤용)"
+    ),
+):
+    return await news_usecase.list_articles(
+        db=db, page=page, size=size, category_id=category_id, cursor=cursor, total_mode=total_mode
+    )
+
+@news_router.get("/search")
+async def search_articles(
+    q: str = Query(..., min_length=2, max_length=100, description="검색어 (제목/본문, 2글자 이상)"),
+    size: int = Query(20, ge=1, le=100),
+    category_id: int | None = Query(None),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    return news_usecase.list_articles(db=db, page=page, size=size, category_id=category_id)
+    return await news_usecase.search_articles(db=db, q=q, size=size, cursor=cursor, category_id=category_id)
 
 # 2) 뉴스 상세(본문 + 최신 요약)
+# /articles/{article_id} 보다 먼저 등록해야 "summaries"가 article_id로 매칭되지 않음
+@news_router.get("/articles/summaries")
+async def get_latest_summaries(
+    ids: list[int] = Query(..., max_length=100, description="기사 id 목록 (?ids=1&ids=2, 최대 100개)"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    return await news_usecase.get_latest_summaries(db=db, article_ids=ids)
+
+
+# 조건부 GET: If-None-Match가 맞으면 본문 컬럼을 읽기 전에 304
 @news_router.get("/articles/{article_id}", response_model=ArticleDetailResponse)
-def get_article_detail(article_id: int, db: Session = Depends(get_db)):
-    return news_usecase.get_article_detail(db=db, article_id=article_id)
+async def get_article_detail(
+    article_id: int,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    if if_none_match:
+        etag = strong_etag(await news_usecase.get_article_version(db=db, article_id=article_id))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    data = await news_usecase.get_article_detail(db=db, article_id=article_id)
+    # 버전 조회와 본문 조회 사이에 바뀌었을 수 있으므로 ETag는 실제로 보낸 본문 기준
+    response.headers.update(cache_headers(strong_etag(data.pop("version"))))
+    return data
 
 
 @news_router.get("/articles/{article_id}/summary")
-def get_article_summary(article_id: int, db: Session = Depends(get_db)):
-    return news_usecase.get_article_summary(db=db, article_id=article_id)
+async def get_article_summary(
+    article_id: int,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    if if_none_match:
+        etag = strong_etag(await news_usecase.get_article_summary_version(db=db, article_id=article_id))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    data = await news_usecase.get_article_summary(db=db, article_id=article_id)
+    response.headers.update(cache_headers(strong_etag(data.pop("version"))))
+    return data
@@ -6,3 +6,4 @@ class NewsTextAnalyzeRequest(BaseModel):
     question: Optional[str] = Field(None, description="요약 기반으로 답할 질문(선택)")
     max_summary_bullets: int = Field(6, ge=3, le=12, description="요약 불릿 개수(3~12)")
     model: str = Field("gpt-4.1", description="사용 모델명")
+    map_concurrency: Optional[int] = Field(None, ge=1, le=16, description="청크 요약 동시 실행 수(미지정 시 LLM_MAP_CONCURRENCY)")
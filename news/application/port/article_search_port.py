@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass
+class SearchHit:
+    article_id: int
+    score: float
+
+
+class ArticleSearchPort(ABC):
+    """기사 검색 Port - 관련도(score) 내림차순, 동점은 article_id 내림차순"""
+
+    name: str = ""
+
+    @abstractmethod
+    async def search(
+        self,
+        db: AsyncSession,
+        query: str,
+        limit: int,
+        category_id: Optional[int] = None,
+        after: Optional[tuple[float, int]] = None,
+    ) -> list[SearchHit]:
+        """after=(score, article_id) 이면 그 다음 순위부터 limit개"""
+        pass
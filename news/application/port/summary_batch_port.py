@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass
+class BatchStatus:
+    batch_id: str
+    status: str  # validating | in_progress | finalizing | completed | failed | expired | cancelled
+    output_ref: Optional[str] = None
+    error_ref: Optional[str] = None  # 실패한 요청 결과 (OpenAI는 output과 별도 파일)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in BATCH_TERMINAL_STATUSES
+
+
+class SummaryBatchPort(ABC):
+    """Batch API Port - 요청 파일(JSONL) 제출/상태 조회/결과 다운로드"""
+
+    @abstractmethod
+    def submit(self, request_file_path: str) -> str:
+        """Returns batch_id"""
+        pass
+
+    @abstractmethod
+    def get_status(self, batch_id: str) -> BatchStatus:
+        pass
+
+    @abstractmethod
+    def download_results(self, status: BatchStatus) -> list[dict]:
+        """Batch API 출력 형식의 결과 라인 목록 (성공 + 실패 요청 모두)"""
+        pass
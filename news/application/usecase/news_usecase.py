@@ -1,23 +1,38 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from datetime import datetime, date
 from io import BytesIO
-from typing import List, Optional
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
 from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException
-from openai import AsyncOpenAI
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 from reportlab.pdfgen import canvas
-from sqlalchemy.orm import Session
-
-from news.infrastructure.repository.news_repository import NewsRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.concurrent_map import concurrent_map, iter_concurrent_map, timings_of
+from common.stage_graph import Stage, StageGraph
+from common.token_chunker import chunk_by_tokens
+from common.tree_reduce import reduce_until_fits, tree_reduce
+from config.database.query_cache import NS_ARTICLES, cache_key, get_query_cache
+from config.database.session import db_session
+from config.openai.llm_gateway import LLMGateway, get_llm_gateway
+from news.infrastructure.repository.article_search_repository import article_search_for
+from news.infrastructure.repository.news_repository import (
+    NewsRepository,
+    decode_score_cursor,
+    encode_score_cursor,
+)
 
 KST = ZoneInfo("Asia/Seoul")
+SUMMARY_MODEL = "gpt-4.1"
+SUMMARY_MAX_TOKENS = 400
+STAGE_TIMEOUT_SECONDS = float(os.getenv("ANALYZE_STAGE_TIMEOUT_SECONDS", "60"))
 
 
 # ---------- helpers ----------
@@ -29,32 +44,12 @@ def clean_news_text(text: str) -> str:
     return t
 
 
-def chunk_text(text: str, chunk_size: int = 3500, overlap: int = 300) -> List[str]:
-    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    chunks, cur = [], ""
-
-    for p in paragraphs:
-        if len(cur) + len(p) + 1 <= chunk_size:
-            cur = (cur + "\n" + p).strip() if cur else p
-        else:
-            if cur:
-                chunks.append(cur)
-            cur = p
-
-    if cur:
-        chunks.append(cur)
-
-    if overlap > 0 and len(chunks) > 1:
-        overlapped = []
-        for i, ch in enumerate(chunks):
-            if i == 0:
-                overlapped.append(ch)
-                continue
-            prev_tail = chunks[i - 1][-overlap:]
-            overlapped.append((prev_tail + "\n" + ch).strip())
-        chunks = overlapped
-
-    return chunks
+def summary_prompt(text: str) -> str:
+    """/news/summarize 와 요약 backfill 이 같이 쓰는 단건 요약 프롬프트 (빈 본문이면 "")"""
+    cleaned = re.sub(r"\s+", " ", (text or "")).strip()
+    if not cleaned:
+        return ""
+    return f"다음 뉴스 핵심을 5줄로 요약해줘:\n\n{cleaned}"
 
 
 def make_pdf_bytes(title: str, body: str) -> bytes:
@@ -88,51 +83,63 @@ def make_pdf_bytes(title: str, body: str) -> bytes:
 
 
 class NewsUseCase:
-    def __init__(self):
-        self.client = AsyncOpenAI()
+    def __init__(self, llm_gateway: Optional[LLMGateway] = None):
+        self.llm = llm_gateway or get_llm_gateway()
         self.repo = NewsRepository()
 
     async def _ask_gpt(self, model: str, prompt: str, max_tokens: int, temperature: float = 0.0) -> str:
         try:
-            resp = await self.client.chat.completions.create(
+            return await self.llm.chat(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
                 temperature=temperature,
+                use_case="news",
             )
-            return resp.choices[0].message.content.strip()
         except Exception as e:
             raise HTTPException(status_code=502, detail=f"OpenAI call failed: {type(e).__name__}: {str(e)}")
 
     async def summarize_news(self, text: str) -> dict:
-        cleaned = re.sub(r"\s+", " ", (text or "")).strip()
-        if not cleaned:
+        prompt = summary_prompt(text)
+        if not prompt:
             return {"summary": ""}
 
-        prompt = f"다음 뉴스 핵심을 5줄로 요약해줘:\n\n{cleaned}"
-        summary = await self._ask_gpt(model="gpt-4.1", prompt=prompt, max_tokens=400, temperature=0)
+        summary = await self._ask_gpt(
+            model=SUMMARY_MODEL, prompt=prompt, max_tokens=SUMMARY_MAX_TOKENS, temperature=0
+        )
         return {"summary": summary}
 
-    async def summarize_news_chunks(self, model: str, chunks: List[str], max_bullets: int) -> str:
-        partial_summaries = []
-        for idx, chunk in enumerate(chunks):
-            prompt = f"""
+    def _chunk_prompt(self, idx: int, total: int, chunk: str) -> str:
+        return f"""
 너는 뉴스 요약 에이전트다.
 다음은 뉴스 기사 일부다. 사실 중심으로 핵심만 간결하게 요약해라.
 - 과장/추론 금지, 기사에 있는 내용만.
 - 숫자/날짜/고유명사(인물, 기관, 장소)는 가능하면 보존.
 
-[기사 일부 {idx+1}/{len(chunks)}]
+[기사 일부 {idx+1}/{total}]
 {chunk}
 
 [출력]
 - 3~5줄 요약(문장형)
 """
-            s = await self._ask_gpt(model=model, prompt=prompt, max_tokens=320, temperature=0)
-            partial_summaries.append(s)
 
+    def _merge_prompt(self, partial_summaries: List[str]) -> str:
         merged = "\n".join(partial_summaries)
-        final_prompt = f"""
+        return f"""
+너는 뉴스 요약 에이전트다.
+아래는 긴 기사의 연속된 부분 요약들이다. 중복을 제거하고 하나의 요약으로 합쳐라.
+- 기사에 있는 내용만, 숫자/날짜/고유명사는 보존.
+
+[부분 요약들]
+{merged}
+
+[출력]
+- 5~8줄 요약(문장형)
+"""
+
+    def _reduce_prompt(self, partial_summaries: List[str], max_bullets: int) -> str:
+        merged = "\n".join(partial_summaries)
+        return f"""
 너는 뉴스 통합 요약 에이전트다.
 아래는 부분 요약들을 합친 내용이다. 중복을 제거하고 핵심만 남겨 통합 요약해라.
 
@@ -144,7 +151,32 @@ class NewsUseCase:
 2) 핵심 불릿 {max_bullets}개 (각 1문장, 사실 중심)
 3) 키워드 8개 (쉼표로 구분)
 """
-        return await self._ask_gpt(model=model, prompt=final_prompt, max_tokens=600, temperature=0)
+
+    async def summarize_news_chunks(
+        self, model: str, chunks: List[str], max_bullets: int, concurrency: Optional[int] = None
+    ) -> dict:
+        async def _summarize_chunk(idx: int, chunk: str) -> str:
+            prompt = self._chunk_prompt(idx, len(chunks), chunk)
+            return await self._ask_gpt(model=model, prompt=prompt, max_tokens=320, temperature=0)
+
+        # map: 청크별 부분 요약을 동시에 실행 (순서는 유지)
+        results = await concurrent_map(_summarize_chunk, chunks, concurrency=concurrency)
+        partial_summaries = [r.value for r in results]
+
+        # reduce: 부분 요약이 한 프롬프트에 안 들어가면 그룹 단위로 단계별 통합
+        async def _final(texts: List[str]) -> str:
+            final_prompt = self._reduce_prompt(texts, max_bullets)
+            return await self._ask_gpt(model=model, prompt=final_prompt, max_tokens=600, temperature=0)
+
+        reduced = await tree_reduce(
+            partial_summaries, self._merge_group(model), _final, model=model, concurrency=concurrency
+        )
+        return {"summary": reduced.value, "chunk_timings": timings_of(results), "reduce": reduced.meta()}
+
+    def _merge_group(self, model: str) -> Callable[[int, List[str]], Awaitable[str]]:
+        async def _merge(_: int, group: List[str]) -> str:
+            return await self._ask_gpt(model=model, prompt=self._merge_prompt(group), max_tokens=500, temperature=0)
+        return _merge
 
     async def qa_on_summary(self, model: str, summary: str, question: str) -> str:
         prompt = f"""
@@ -184,7 +216,7 @@ class NewsUseCase:
         except Exception:
             return {"sentiment": "unknown", "key_points": []}
 
-    async def analyze(self, text: str, question: Optional[str], max_bullets: int, model: str) -> dict:
+    def _prepare_text(self, text: str, model: str) -> tuple[str, List[str]]:
         if not (text or "").strip():
             raise HTTPException(status_code=400, detail="Empty text")
 
@@ -192,46 +224,238 @@ class NewsUseCase:
         if not cleaned:
             raise HTTPException(status_code=400, detail="No usable text after cleaning")
 
-        chunks = chunk_text(cleaned)
+        # 모델 토큰 예산 기준 문장 단위 청킹 (overlap도 토큰 단위)
+        chunks = chunk_by_tokens(cleaned, model=model)
         if not chunks:
             raise HTTPException(status_code=500, detail="Chunking failed")
+        return cleaned, chunks
+
+    async def analyze(
+        self,
+        text: str,
+        question: Optional[str],
+        max_bullets: int,
+        model: str,
+        map_concurrency: Optional[int] = None,
+    ) -> dict:
+        cleaned, chunks = self._prepare_text(text, model)
+
+        async def _summarize(_: dict) -> dict:
+            return await self.summarize_news_chunks(
+                model=model, chunks=chunks, max_bullets=max_bullets, concurrency=map_concurrency
+            )
 
-        summary = await self.summarize_news_chunks(model=model, chunks=chunks, max_bullets=max_bullets)
-
-        answer = None
-        if question and question.strip():
-            answer = await self.qa_on_summary(model=model, summary=summary, question=question.strip())
-
-        analysis = await self.analyze_opinions(model=model, summary=summary)
+        # 요약 이후의 QA / 의견 분석은 요약에만 의존하므로 동시에 실행
+        graph = StageGraph([
+            Stage("summary", _summarize),
+            *self._post_summary_stages(model, question, summary_of=lambda deps: deps["summary"]["summary"]),
+        ])
+        result = await graph.run()
+        summarized = result.values["summary"]
 
         return {
             "cleaned_text": cleaned,
             "chunk_count": len(chunks),
-            "summary": summary,
-            "answer": answer,
-            "analysis": analysis,
+            "summary": summarized["summary"],
+            "answer": result.values.get("answer"),
+            "analysis": result.values["analysis"],
+            "chunk_timings": summarized["chunk_timings"],
+            "reduce": summarized["reduce"],
+            "stages": result.metadata,
         }
 
+    def _post_summary_stages(
+        self, model: str, question: Optional[str], summary_of: Callable[[dict], str]
+    ) -> List[Stage]:
+        async def _answer(deps: dict) -> str:
+            return await self.qa_on_summary(model=model, summary=summary_of(deps), question=question.strip())
+
+        async def _analysis(deps: dict) -> dict:
+            return await self.analyze_opinions(model=model, summary=summary_of(deps))
+
+        stages = [
+            Stage(
+                "analysis",
+                _analysis,
+                depends_on=("summary",),
+                timeout=STAGE_TIMEOUT_SECONDS,
+                required=False,
+                fallback={"sentiment": "unknown", "key_points": []},
+            ),
+        ]
+        if question and question.strip():
+            stages.append(
+                Stage("answer", _answer, depends_on=("summary",), timeout=STAGE_TIMEOUT_SECONDS, required=False)
+            )
+        return stages
+
+    def analyze_stream(
+        self,
+        text: str,
+        question: Optional[str],
+        max_bullets: int,
+        model: str,
+        map_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """analyze와 같은 단계를 SSE 이벤트 단위로 내보낸다.
+
+        입력 검증은 여기서 바로 수행해 스트림 시작 전에 4xx로 응답할 수 있게 하고,
+        실제 단계 실행은 반환된 async generator를 소비할 때 시작된다.
+        """
+        cleaned, chunks = self._prepare_text(text, model)
+        return self._analyze_events(cleaned, chunks, question, max_bullets, model, map_concurrency)
+
+    async def _analyze_events(
+        self,
+        cleaned: str,
+        chunks: List[str],
+        question: Optional[str],
+        max_bullets: int,
+        model: str,
+        map_concurrency: Optional[int],
+    ) -> AsyncIterator[dict]:
+        yield {"event": "meta", "data": {"chunk_count": len(chunks)}}
+
+        async def _summarize_chunk(idx: int, chunk: str) -> str:
+            prompt = self._chunk_prompt(idx, len(chunks), chunk)
+            return await self._ask_gpt(model=model, prompt=prompt, max_tokens=320, temperature=0)
+
+        # 1) map: 끝나는 순서대로 부분 요약 전송
+        partial_summaries: List[Optional[str]] = [None] * len(chunks)
+        async for r in iter_concurrent_map(_summarize_chunk, chunks, concurrency=map_concurrency):
+            partial_summaries[r.index] = r.value
+            yield {
+                "event": "chunk",
+                "data": {"chunk": r.index + 1, "elapsed_ms": r.elapsed_ms, "summary": r.value},
+            }
+
+        # 2) reduce: 중간 단계가 필요하면 먼저 줄이고, 최종 요약은 토큰 단위로 전송
+        remaining, levels = await reduce_until_fits(
+            partial_summaries, self._merge_group(model), model=model, concurrency=map_concurrency
+        )
+        if levels:
+            yield {"event": "reduce", "data": {"levels": levels}}
+
+        final_prompt = self._reduce_prompt(remaining, max_bullets)
+        parts = []
+        try:
+            async for delta in self.llm.stream_chat(
+                model=model,
+                messages=[{"role": "user", "content": final_prompt}],
+                max_tokens=600,
+                temperature=0,
+                use_case="news",
+            ):
+                parts.append(delta)
+                yield {"event": "summary_delta", "data": {"delta": delta}}
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"OpenAI call failed: {type(e).__name__}: {str(e)}")
+        summary = "".join(parts).strip()
+        yield {"event": "summary", "data": {"summary": summary, "reduce_depth": len(levels) + 1}}
+
+        # 3) QA / 의견 분석: 동시에 실행하고 끝나는 순서대로 전송
+        graph = StageGraph(self._post_summary_stages(model, question, summary_of=lambda deps: deps["summary"]))
+        stages = {}
+        async for outcome in graph.iter_run(initial={"summary": summary}):
+            stages[outcome.name] = outcome.meta()
+            data = {"answer": outcome.value} if outcome.name == "answer" else outcome.value
+            yield {"event": outcome.name, "data": data}
+        yield {"event": "done", "data": {"stages": stages}}
+
     # ---------- DB ----------
-    def list_articles(self, db: Session, page: int, size: int, category_id: int | None = None):
-        return self.repo.list_articles(db=db, page=page, size=size, category_id=category_id)
+    async def list_articles(
+        self,
+        db: AsyncSession,
+        page: int,
+        size: int,
+        category_id: int | None = None,
+        cursor: str | None = None,
+        total_mode: str = "estimate",
+    ):
+        # 캐시 miss는 primary에서 채운다: 지연된 복제본이 무효화 전 페이지를 돌려주면
+        # 그 값이 새 generation key로 TTL 동안 남는다 (db는 복제본 세션일 수 있음)
+        # cursor가 주어지면(빈 문자열 = 첫 페이지) OFFSET/COUNT 없는 keyset 모드
+        if cursor is not None:
+            async def _load_after():
+                async with db_session() as primary:
+                    return await self.repo.list_articles_after(
+                        db=primary, size=size, cursor=cursor, category_id=category_id
+                    )
+
+            key = cache_key("after", category_id=category_id, cursor=cursor or "-", size=size)
+            return await get_query_cache().get_or_load(NS_ARTICLES, key, _load_after)
+
+        # exact는 매번 COUNT 하라는 요청이므로 캐시를 거치지 않음 (복제본에서 읽어도 됨)
+        if total_mode == "exact":
+            return await self.repo.list_articles(
+                db=db, page=page, size=size, category_id=category_id, total_mode=total_mode
+            )
 
-    def get_article_detail(self, db: Session, article_id: int):
-        data = self.repo.get_article_detail(db=db, article_id=article_id)
+        async def _load():
+            async with db_session() as primary:
+                return await self.repo.list_articles(
+                    db=primary, page=page, size=size, category_id=category_id, total_mode=total_mode
+                )
+
+        key = cache_key("page", category_id=category_id, page=page, size=size, total=total_mode)
+        return await get_query_cache().get_or_load(NS_ARTICLES, key, _load)
+
+    async def search_articles(
+        self,
+        db: AsyncSession,
+        q: str,
+        size: int,
+        cursor: str | None = None,
+        category_id: int | None = None,
+    ):
+        q = q.strip()
+        if not q:
+            raise HTTPException(status_code=400, detail="Query is empty")
+        search = article_search_for(db)
+        after = decode_score_cursor(cursor) if cursor else None
+
+        hits = await search.search(db, q, limit=size + 1, category_id=category_id, after=after)
+        has_more = len(hits) > size
+        hits = hits[:size]
+
+        rows = await self.repo.get_list_items(db=db, article_ids=[h.article_id for h in hits])
+        items = [{**rows[h.article_id], "score": h.score} for h in hits if h.article_id in rows]
+        next_cursor = encode_score_cursor(hits[-1].score, hits[-1].article_id) if hits and has_more else None
+        return {"q": q, "size": size, "backend": search.name, "items": items, "next_cursor": next_cursor}
+
+    async def get_article_detail(self, db: AsyncSession, article_id: int):
+        data = await self.repo.get_article_detail(db=db, article_id=article_id)
         if not data:
             raise HTTPException(status_code=404, detail="Article not found")
         return data
 
-    def get_article_summary(self, db: Session, article_id: int):
-        summary = self.repo.get_latest_summary(db=db, article_id=article_id)
+    async def get_article_version(self, db: AsyncSession, article_id: int) -> str:
+        version = await self.repo.get_article_version(db=db, article_id=article_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        return version
+
+    async def get_article_summary_version(self, db: AsyncSession, article_id: int) -> str:
+        version = await self.repo.get_latest_summary_version(db=db, article_id=article_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Summary not found")
+        return version
+
+    async def get_article_summary(self, db: AsyncSession, article_id: int):
+        summary = await self.repo.get_latest_summary(db=db, article_id=article_id)
         if not summary:
             raise HTTPException(status_code=404, detail="Summary not found")
         return summary
 
-    def list_categories(self, db: Session):
-        return self.repo.list_categories(db=db)
+    async def get_latest_summaries(self, db: AsyncSession, article_ids: list[int]):
+        summaries = await self.repo.get_latest_summaries(db=db, article_ids=article_ids)
+        return {"items": [summaries[i] for i in dict.fromkeys(article_ids) if i in summaries]}
+
+    async def list_categories(self, db: AsyncSession):
+        # 프로세스 내 카테고리 registry에서 바로 응답 (DB 조회 없음)
+        return await self.repo.list_categories(db=db)
 
-    def save_summary_history(self, db: Session, article_id: int, summary_text: str):
+    async def save_summary_history(self, db: AsyncSession, article_id: int, summary_text: str):
         if not summary_text:
             raise HTTPException(status_code=400, detail="Summary text is empty")
-        return self.repo.save_article_summary(db=db, article_id=article_id, summary_text=summary_text)
+        return await self.repo.save_article_summary(db=db, article_id=article_id, summary_text=summary_text)
@@ -0,0 +1,227 @@
+import json
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from news.application.port.summary_batch_port import BatchStatus, SummaryBatchPort
+from news.application.usecase.news_usecase import SUMMARY_MAX_TOKENS, SUMMARY_MODEL, summary_prompt
+from news.infrastructure.repository.news_repository import NewsRepository
+
+CUSTOM_ID_PREFIX = "article-"
+
+
+class SummaryBackfillUseCase:
+    """summary가 NULL인 기사를 Batch API로 일괄 요약해 채우는 backfill
+
+    페이지 단위(article_id 오름차순)로 요청 파일을 만들어 제출하고, 진행 상태는
+    state 파일에 남긴다. 중간에 멈춰도 다시 실행하면 제출해 둔 배치부터 이어서 처리한다.
+    요약에 실패한 기사는 failed_ids에 남고 run(retry_failed=True)로 다시 제출한다.
+    """
+
+    def __init__(
+        self,
+        db_factory: Callable[[], Session],
+        batch_client: SummaryBatchPort,
+        repository: Optional[NewsRepository] = None,
+        work_dir: str = "./backfill",
+        page_size: int = 500,
+        poll_interval_seconds: float = 30.0,
+    ):
+        self.db_factory = db_factory
+        self.batch_client = batch_client
+        self.repo = repository or NewsRepository()
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.work_dir / "summary_backfill_state.json"
+        self.page_size = page_size
+        self.poll_interval_seconds = poll_interval_seconds
+
+    # ---------- state ----------
+    def _load_state(self) -> dict:
+        if self.state_path.exists():
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        return {"last_article_id": 0, "in_flight": None, "written": 0, "failed_ids": []}
+
+    def _save_state(self, state: dict) -> None:
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+    def reset(self) -> None:
+        if self.state_path.exists():
+            self.state_path.unlink()
+
+    # ---------- run ----------
+    def run(self, max_pages: Optional[int] = None, retry_failed: bool = False) -> dict:
+        state = self._load_state()
+
+        if state.get("in_flight"):
+            print(f"[INFO] resuming batch {state['in_flight']['batch_id']}")
+            self._finish_batch(state)
+
+        pages = 0
+        if retry_failed:
+            pages = self._retry_failed(state, max_pages)
+
+        while max_pages is None or pages < max_pages:
+            db = self.db_factory()
+            try:
+                articles = self.repo.find_unsummarized_articles(
+                    db=db, after_id=state["last_article_id"], limit=self.page_size
+                )
+            finally:
+                db.close()
+            if not articles:
+                break
+
+            request_path, article_ids = self._write_request_file(articles, state["last_article_id"])
+            if not article_ids:
+                # 본문이 모두 비어 있는 페이지는 건너뜀
+                state["last_article_id"] = articles[-1].article_id
+                self._save_state(state)
+                continue
+
+            self._submit(state, request_path, article_ids, max_article_id=articles[-1].article_id)
+            self._finish_batch(state)
+            pages += 1
+
+        return {
+            "last_article_id": state["last_article_id"],
+            "written": state["written"],
+            "failed": len(state["failed_ids"]),
+        }
+
+    def _retry_failed(self, state: dict, max_pages: Optional[int]) -> int:
+        """failed_ids에 남은 기사를 한 번씩 다시 제출 (그 사이 summary가 채워진 기사는 빠진다)
+
+        이번 실행에서 또 실패한 기사는 다음 --retry-failed 실행으로 넘긴다.
+        """
+        pending = sorted(set(state["failed_ids"]))
+        pages = 0
+        while pending and (max_pages is None or pages < max_pages):
+            chunk, pending = pending[:self.page_size], pending[self.page_size:]
+            db = self.db_factory()
+            try:
+                articles = self.repo.find_unsummarized_articles(
+                    db=db, after_id=0, limit=self.page_size, article_ids=chunk
+                )
+            finally:
+                db.close()
+
+            # 이번에 다시 보내는 기사는 목록에서 빼고, 또 실패하면 _finish_batch가 다시 넣는다
+            retried = set(chunk)
+            state["failed_ids"] = [i for i in state["failed_ids"] if i not in retried]
+            request_path, article_ids = self._write_request_file(articles, chunk[0], name="retry")
+            if not article_ids:
+                self._save_state(state)
+                continue
+
+            # 재시도 배치는 페이지 커서(last_article_id)를 움직이지 않는다
+            self._submit(state, request_path, article_ids, max_article_id=0)
+            self._finish_batch(state)
+            pages += 1
+        return pages
+
+    def _submit(self, state: dict, request_path: Path, article_ids: list[int], max_article_id: int) -> None:
+        batch_id = self.batch_client.submit(str(request_path))
+        state["in_flight"] = {
+            "batch_id": batch_id,
+            "request_file": str(request_path),
+            "max_article_id": max_article_id,
+            "article_count": len(article_ids),
+            "article_ids": article_ids,
+        }
+        self._save_state(state)
+        print(f"[INFO] submitted batch {batch_id} ({len(article_ids)} articles)")
+
+    def _write_request_file(self, articles, after_id: int, name: str = "requests") -> tuple[Path, list[int]]:
+        path = self.work_dir / f"{name}_after_{after_id}.jsonl"
+        article_ids = []
+        with open(path, "w", encoding="utf-8") as f:
+            for a in articles:
+                prompt = summary_prompt(a.content)
+                if not prompt:
+                    continue
+                line = {
+                    "custom_id": f"{CUSTOM_ID_PREFIX}{a.article_id}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": SUMMARY_MODEL,
+                        "messages": [{"role": "user", "content": prompt}],
+                        "max_tokens": SUMMARY_MAX_TOKENS,
+                        "temperature": 0,
+                    },
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+                article_ids.append(a.article_id)
+        return path, article_ids
+
+    def _wait(self, batch_id: str) -> BatchStatus:
+        while True:
+            status = self.batch_client.get_status(batch_id)
+            if status.is_terminal:
+                return status
+            print(f"[INFO] batch {batch_id} is {status.status}, polling again in {self.poll_interval_seconds}s")
+            time.sleep(self.poll_interval_seconds)
+
+    def _finish_batch(self, state: dict) -> None:
+        """배치 결과 반영 후 in_flight를 비운다
+
+        completed가 아니어도(failed/expired/cancelled) 나온 결과는 저장하고, 결과가 없는
+        기사는 모두 failed_ids에 넣어 --retry-failed로 다시 보낼 수 있게 한 뒤 예외를 낸다.
+        """
+        in_flight = state["in_flight"]
+        status = self._wait(in_flight["batch_id"])
+
+        summaries, failed = self._parse_results(self.batch_client.download_results(status))
+        # 성공 결과가 없는 제출 기사는 실패로 본다 (error 파일 누락, 만료, 취소 등)
+        failed_set = set(failed)
+        failed.extend(
+            i for i in in_flight.get("article_ids", []) if i not in summaries and i not in failed_set
+        )
+
+        db = self.db_factory()
+        try:
+            written = self.repo.save_article_summaries_bulk(db=db, summaries=summaries)
+        finally:
+            db.close()
+
+        state["written"] += len(written)
+        state["failed_ids"].extend(i for i in failed if i not in state["failed_ids"])
+        state["last_article_id"] = max(state["last_article_id"], in_flight["max_article_id"])
+        state["in_flight"] = None
+        self._save_state(state)
+        print(f"[INFO] batch {status.batch_id}: wrote {len(written)} summaries, {len(failed)} failed")
+        if status.status != "completed":
+            raise RuntimeError(
+                f"Batch {status.batch_id} ended with status '{status.status}' "
+                f"({len(failed)} articles recorded in failed_ids)"
+            )
+
+    @staticmethod
+    def _parse_results(lines: list[dict]) -> tuple[dict[int, str], list[int]]:
+        summaries: dict[int, str] = {}
+        failed: list[int] = []
+        for line in lines:
+            custom_id = line.get("custom_id") or ""
+            if not custom_id.startswith(CUSTOM_ID_PREFIX):
+                continue
+            article_id = int(custom_id[len(CUSTOM_ID_PREFIX):])
+
+            response = line.get("response") or {}
+            if line.get("error") or response.get("status_code") != 200:
+                failed.append(article_id)
+                continue
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                failed.append(article_id)
+                continue
+            if content and content.strip():
+                summaries[article_id] = content.strip()
+            else:
+                failed.append(article_id)
+        return summaries, failed
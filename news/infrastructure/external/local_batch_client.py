@@ -0,0 +1,74 @@
+import asyncio
+import json
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from common.concurrent_map import concurrent_map
+from config.openai.llm_gateway import LLMGateway, get_llm_gateway
+from news.application.port.summary_batch_port import BatchStatus, SummaryBatchPort
+
+
+class LocalBatchClient(SummaryBatchPort):
+    """Batch API 로컬 대체 구현
+
+    제출 시 요청 파일을 LLM 게이트웨이(LLM_BACKEND=fake면 오프라인)로 바로 처리하고
+    OpenAI Batch 출력과 같은 형식의 JSONL을 base_path에 남긴다.
+    """
+
+    def __init__(
+        self,
+        base_path: str = "./backfill/local_batches",
+        llm_gateway: Optional[LLMGateway] = None,
+        concurrency: int = 8,
+    ):
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.llm = llm_gateway or get_llm_gateway()
+        self.concurrency = concurrency
+
+    def _output_path(self, batch_id: str) -> Path:
+        return self.base_path / f"{batch_id}_output.jsonl"
+
+    def submit(self, request_file_path: str) -> str:
+        with open(request_file_path, encoding="utf-8") as f:
+            requests = [json.loads(line) for line in f if line.strip()]
+
+        batch_id = f"local_batch_{uuid.uuid4().hex[:12]}"
+        results = asyncio.run(concurrent_map(self._process, requests, concurrency=self.concurrency))
+
+        tmp_path = self._output_path(batch_id).with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for r in results:
+                f.write(json.dumps(r.value, ensure_ascii=False) + "\n")
+        tmp_path.rename(self._output_path(batch_id))
+        return batch_id
+
+    async def _process(self, _: int, request: dict) -> dict:
+        body = dict(request["body"])
+        model = body.pop("model")
+        messages = body.pop("messages")
+        try:
+            content = await self.llm.chat(model=model, messages=messages, use_case="summary_backfill", **body)
+        except Exception as e:
+            return {"custom_id": request["custom_id"], "response": None, "error": {"message": f"{type(e).__name__}: {e}"}}
+        return {
+            "custom_id": request["custom_id"],
+            "response": {
+                "status_code": 200,
+                "body": {"model": model, "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]},
+            },
+            "error": None,
+        }
+
+    def get_status(self, batch_id: str) -> BatchStatus:
+        output = self._output_path(batch_id)
+        if output.exists():
+            return BatchStatus(batch_id=batch_id, status="completed", output_ref=str(output))
+        return BatchStatus(batch_id=batch_id, status="failed")
+
+    def download_results(self, status: BatchStatus) -> list[dict]:
+        if not status.output_ref:
+            return []
+        with open(status.output_ref, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,45 @@
+import json
+
+from openai import OpenAI
+
+from config.openai import config as llm_config
+from news.application.port.summary_batch_port import BatchStatus, SummaryBatchPort
+
+
+class OpenAIBatchClient(SummaryBatchPort):
+    """OpenAI Batch API 구현체 (오프라인 backfill 전용, 요청 경로에서는 쓰지 않음)"""
+
+    def __init__(self, completion_window: str = "24h"):
+        if not llm_config.OPENAI_API_KEY:
+            raise ValueError("OPENAI_API_KEY environment variable not set!")
+        self.client = OpenAI(api_key=llm_config.OPENAI_API_KEY)
+        self.completion_window = completion_window
+
+    def submit(self, request_file_path: str) -> str:
+        with open(request_file_path, "rb") as f:
+            uploaded = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def get_status(self, batch_id: str) -> BatchStatus:
+        batch = self.client.batches.retrieve(batch_id)
+        return BatchStatus(
+            batch_id=batch.id,
+            status=batch.status,
+            output_ref=batch.output_file_id,
+            error_ref=batch.error_file_id,
+        )
+
+    def download_results(self, status: BatchStatus) -> list[dict]:
+        # 실패한 요청은 output이 아니라 error 파일에만 기록됨 (전부 실패하면 output_file_id는 None)
+        lines = []
+        for file_id in (status.output_ref, status.error_ref):
+            if not file_id:
+                continue
+            content = self.client.files.content(file_id).text
+            lines.extend(json.loads(line) for line in content.splitlines() if line.strip())
+        return lines
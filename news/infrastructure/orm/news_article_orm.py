@@ -1,9 +1,17 @@
 from datetime import datetime
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, String, Text
+from config.database.compressed_text import CompressedText
 from config.database.session import Base
 
 class NewsArticleORM(Base):
     __tablename__ = "NewsArticle"
+    __table_args__ = (
+        # 목록 / 커서 페이지네이션: (카테고리,) 최신순 + 동순위 article_id
+        Index("ix_news_article_category_published_id", "category_id", "published_at", "article_id"),
+        Index("ix_news_article_published_id", "published_at", "article_id"),
+        # 재수집 시 같은 기사 판별 (crawling.domain.service.url_canonical.url_hash)
+        Index("ux_news_article_url_hash", "url_hash", unique=True),
+    )
 
     article_id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
 
@@ -11,10 +19,11 @@ class NewsArticleORM(Base):
     publisher_id = Column(BigInteger, ForeignKey("Publisher.publisher_id"))
 
     title = Column(String(500), nullable=False)
-    content = Column(Text)        # MEDIUMTEXT도 Text로 OK
+    content = Column(CompressedText)  # TEXT_COMPRESSION=zstd면 압축 저장 (읽을 때 자동 해제)
     summary = Column(Text)        # NewsArticle.summary 컬럼도 존재
 
     url = Column(String(500))
+    url_hash = Column(String(64))  # 정규화 URL sha256, 기존 행은 url_hash_backfill_command로 채움
     image_url = Column(String(500))
     published_at = Column(DateTime, nullable=False)
     crawled_at = Column(DateTime, default=datetime.utcnow, nullable=False)
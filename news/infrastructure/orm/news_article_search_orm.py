@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, String, Text
+from config.database.session import Base
+
+class NewsArticleSearchORM(Base):
+    """FULLTEXT 검색용 평문 사본 (TEXT_COMPRESSION=zstd일 때만 채움)
+
+    압축 저장한 NewsArticle.content(LONGBLOB)에는 FULLTEXT 인덱스를 만들 수 없으므로
+    제목/본문 평문을 여기에 두고 ngram FULLTEXT 인덱스를 건다.
+    """
+    __tablename__ = "NewsArticleSearch"
+    __table_args__ = (
+        Index("ix_news_article_search_category", "category_id"),
+    )
+
+    article_id = Column(BigInteger, ForeignKey("NewsArticle.article_id", ondelete="CASCADE"), primary_key=True)
+    category_id = Column(BigInteger, nullable=False)
+    title = Column(String(500), nullable=False)
+    body = Column(Text)  # 압축하지 않은 본문
@@ -0,0 +1,346 @@
+import asyncio
+import heapq
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import and_, desc, or_, select, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database.compressed_text import get_text_codec
+from config.database.session import db_read_session
+from news.application.port.article_search_port import ArticleSearchPort, SearchHit
+from news.infrastructure.orm.news_article_orm import NewsArticleORM
+from news.infrastructure.orm.news_article_search_orm import NewsArticleSearchORM
+
+# auto: MySQL이면 FULLTEXT(ngram), 아니면(SQLite 등) 프로세스 내 n-gram 인덱스 / fulltext / memory
+NEWS_SEARCH_BACKEND = os.getenv("NEWS_SEARCH_BACKEND", "auto").lower()
+# 제목 일치를 본문보다 얼마나 더 쳐줄지
+SEARCH_TITLE_WEIGHT = float(os.getenv("SEARCH_TITLE_WEIGHT", "3"))
+# 메모리 인덱스가 새 기사(article_id > 마지막 색인)를 다시 읽는 간격 (백그라운드 task)
+SEARCH_INDEX_REFRESH_SECONDS = float(os.getenv("SEARCH_INDEX_REFRESH_SECONDS", "30"))
+
+NGRAM_SIZE = 2  # MySQL ngram_token_size 기본값과 동일
+_WORD = re.compile(r"\w+")
+
+# 테이블 -> {인덱스 이름: 컬럼}
+FULLTEXT_INDEXES = {
+    NewsArticleORM.__tablename__: {
+        "ft_news_article_title": ("title",),
+        "ft_news_article_title_content": ("title", "content"),
+    },
+    # 본문을 압축 저장할 때 쓰는 평문 사본
+    NewsArticleSearchORM.__tablename__: {
+        "ft_news_article_search_title": ("title",),
+        "ft_news_article_search_title_body": ("title", "body"),
+    },
+}
+
+
+def ngram_tokens(text: str) -> list[str]:
+    """단어(공백/문장부호 기준)마다 글자 bigram (NGRAM_SIZE보다 짧은 단어는 버림)"""
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        tokens.extend(word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1))
+    return tokens
+
+
+def _after_cursor(score, article_id, after: Optional[tuple[float, int]]):
+    if after is None:
+        return None
+    s, aid = after
+    return or_(score < s, and_(score == s, article_id < aid))
+
+
+class FulltextArticleSearch(ArticleSearchPort):
+    """MySQL FULLTEXT(ngram parser) 검색 (ensure_search_indexes로 인덱스 생성)
+
+    기본은 NewsArticle(title, content)를, plain_copy=True면 압축 저장 시 채우는
+    NewsArticleSearch(title, body)를 검색한다.
+    """
+
+    def __init__(self, plain_copy: bool = False):
+        self.orm = NewsArticleSearchORM if plain_copy else NewsArticleORM
+        self.body = NewsArticleSearchORM.body if plain_copy else NewsArticleORM.content
+        self.name = "mysql-fulltext-plain-copy" if plain_copy else "mysql-fulltext"
+
+    async def search(self, db, query, limit, category_id=None, after=None):
+        orm = self.orm
+        title_match = match(orm.title, against=query).in_natural_language_mode()
+        all_match = match(orm.title, self.body, against=query).in_natural_language_mode()
+
+        ranked = select(
+            orm.article_id,
+            (title_match * SEARCH_TITLE_WEIGHT + all_match).label("score"),
+        ).where(all_match > 0)
+        if category_id is not None:
+            ranked = ranked.where(orm.category_id == category_id)
+        ranked = ranked.subquery()
+
+        stmt = select(ranked.c.article_id, ranked.c.score)
+        cond = _after_cursor(ranked.c.score, ranked.c.article_id, after)
+        if cond is not None:
+            stmt = stmt.where(cond)
+        stmt = stmt.order_by(desc(ranked.c.score), desc(ranked.c.article_id)).limit(limit)
+
+        rows = (await db.execute(stmt)).all()
+        return [SearchHit(article_id=r.article_id, score=float(r.score)) for r in rows]
+
+
+class NgramArticleIndex(ArticleSearchPort):
+    """프로세스 내 bigram 역색인 + BM25 (SQLite 테스트/개발용, MySQL FULLTEXT를 못 쓸 때 대체)
+
+    article_id가 증가하는 순서로 새 기사만 추가한다 (이미 색인한 기사의 수정/삭제는 반영 안 됨).
+    posting은 array로 보관해 100만 건 규모에서도 dict-of-dict보다 메모리를 훨씬 적게 쓴다.
+    색인은 start_background_refresh()의 task가 만들고 갱신한다. 첫 색인이 끝나기 전의
+    검색은 503으로 응답한다 (요청 안에서 전체를 색인하지 않음).
+    """
+
+    name = "ngram-memory"
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, refresh_seconds: float = SEARCH_INDEX_REFRESH_SECONDS, batch_size: int = 5000):
+        self.refresh_seconds = refresh_seconds
+        self.batch_size = batch_size
+        self._article_ids = array("q")
+        self._categories = array("q")
+        self._lengths = array("I")
+        self._postings: dict[str, tuple[array, array]] = {}  # token -> (doc 번호들, 가중 tf)
+        self._total_length = 0
+        self._last_article_id = 0
+        self._refreshed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._write_lock = threading.Lock()
+        self._norms = array("d")  # 문서별 BM25 길이 보정값 (문서 수가 바뀌면 다시 계산)
+
+    def __len__(self) -> int:
+        return len(self._article_ids)
+
+    @property
+    def ready(self) -> bool:
+        """첫 전체 색인이 끝났는지"""
+        return self._refreshed_at is not None
+
+    def add(self, article_id: int, category_id: int, title: str, content: str) -> None:
+        weights: dict[str, float] = {}
+        for token in ngram_tokens(title):
+            weights[token] = weights.get(token, 0) + SEARCH_TITLE_WEIGHT
+        length = 0
+        for token in ngram_tokens(content):
+            weights[token] = weights.get(token, 0) + 1
+            length += 1
+
+        with self._write_lock:
+            doc = len(self._article_ids)
+            # 메타데이터를 먼저 넣어야 동시에 도는 검색이 새 doc 번호를 만나도 안전
+            self._article_ids.append(article_id)
+            self._categories.append(category_id or 0)
+            self._lengths.append(length)
+            self._total_length += length
+            for token, tf in weights.items():
+                posting = self._postings.get(token)
+                if posting is None:
+                    posting = self._postings[token] = (array("I"), array("H"))
+                posting[1].append(min(int(tf), 65535))
+                posting[0].append(doc)
+            self._last_article_id = max(self._last_article_id, article_id)
+
+    async def refresh(self, open_session=db_read_session) -> int:
+        """마지막으로 색인한 article_id 이후 기사를 읽어 추가, 추가한 건수 반환
+
+        배치마다 세션을 새로 열고 닫으므로 색인하는 동안 커넥션을 계속 잡고 있지 않는다.
+        """
+        added = 0
+        while True:
+            stmt = (
+                select(
+                    NewsArticleORM.article_id,
+                    NewsArticleORM.category_id,
+                    NewsArticleORM.title,
+                    NewsArticleORM.content,
+                )
+                .where(NewsArticleORM.article_id > self._last_article_id)
+                .order_by(NewsArticleORM.article_id)
+                .limit(self.batch_size)
+            )
+            async with open_session() as db:
+                rows = (await db.execute(stmt)).all()
+            if not rows:
+                break
+            await asyncio.to_thread(self._add_rows, rows)
+            added += len(rows)
+        self._refreshed_at = time.monotonic()
+        return added
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                added = await self.refresh()
+                if added:
+                    print(f"[INFO] search index: +{added} articles ({len(self)} total) "
+                          f"in {time.perf_counter() - started:.1f}s")
+            except Exception as e:
+                print(f"[WARN] search index refresh failed: {type(e).__name__}: {e}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start_background_refresh(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _add_rows(self, rows) -> None:
+        for r in rows:
+            self.add(r.article_id, r.category_id, r.title, r.content)
+
+    def _length_norms(self, n_docs: int) -> array:
+        norms = self._norms
+        if len(norms) != n_docs:
+            avg_length = max(self._total_length / n_docs, 1.0)
+            k1, b = self.K1, self.B
+            norms = array("d", (k1 * (1 - b + b * length / avg_length) for length in self._lengths[:n_docs]))
+            self._norms = norms
+        return norms
+
+    def score(self, query: str, limit: int, category_id: Optional[int] = None,
+              after: Optional[tuple[float, int]] = None) -> list[SearchHit]:
+        n_docs = len(self._lengths)
+        if not n_docs:
+            return []
+        norms = self._length_norms(n_docs)
+        categories = self._categories
+
+        scores: dict[int, float] = {}
+        get = scores.get
+        for token in set(ngram_tokens(query)):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            docs, tfs = posting
+            df = len(docs)
+            weight = math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) * (self.K1 + 1)
+            for doc, tf in zip(docs, tfs):
+                if doc >= n_docs or (category_id is not None and categories[doc] != category_id):
+                    continue
+                scores[doc] = get(doc, 0.0) + weight * tf / (tf + norms[doc])
+
+        hits = ((round(s, 6), self._article_ids[doc]) for doc, s in scores.items())
+        if after is not None:
+            hits = (h for h in hits if h < after)
+        top = heapq.nlargest(limit, hits)
+        return [SearchHit(article_id=aid, score=s) for s, aid in top]
+
+    async def search(self, db, query, limit, category_id=None, after=None):
+        if not self.ready:
+            # startup에서 시작하지 않은 경우(스크립트 등)에도 요청 밖에서 만들도록 task만 띄움
+            self.start_background_refresh()
+            raise HTTPException(
+                status_code=503,
+                detail="Search index is being built, try again shortly",
+                headers={"Retry-After": "10"},
+            )
+        return await asyncio.to_thread(self.score, query, limit, category_id, after)
+
+
+_fulltext_search = FulltextArticleSearch()
+_fulltext_plain_copy_search = FulltextArticleSearch(plain_copy=True)
+_ngram_index: Optional[NgramArticleIndex] = None
+_ngram_index_lock = threading.Lock()
+
+
+def get_ngram_article_index() -> NgramArticleIndex:
+    global _ngram_index
+    with _ngram_index_lock:
+        if _ngram_index is None:
+            _ngram_index = NgramArticleIndex()
+        return _ngram_index
+
+
+def fulltext_available(dialect_name: str) -> bool:
+    return dialect_name == "mysql"
+
+
+def plain_copy_enabled(dialect_name: str) -> bool:
+    """본문을 압축 저장(LONGBLOB)하면 FULLTEXT는 NewsArticleSearch 평문 사본으로 검색"""
+    return fulltext_available(dialect_name) and get_text_codec().enabled
+
+
+def article_search_for_dialect(dialect_name: str) -> ArticleSearchPort:
+    if NEWS_SEARCH_BACKEND == "memory":
+        return get_ngram_article_index()
+    if NEWS_SEARCH_BACKEND == "fulltext" or fulltext_available(dialect_name):
+        return _fulltext_plain_copy_search if get_text_codec().enabled else _fulltext_search
+    return get_ngram_article_index()
+
+
+def article_search_for(db: AsyncSession) -> ArticleSearchPort:
+    return article_search_for_dialect(db.get_bind().dialect.name)
+
+
+def start_article_search_index(dialect_name: str) -> None:
+    """메모리 색인을 쓰는 환경이면 백그라운드 색인 시작 (app startup에서 호출)"""
+    search = article_search_for_dialect(dialect_name)
+    if isinstance(search, NgramArticleIndex):
+        search.start_background_refresh()
+
+
+async def stop_article_search_index() -> None:
+    if _ngram_index is not None:
+        await _ngram_index.stop_background_refresh()
+
+
+def plain_copy_upsert_stmt(dialect_name: str, rows: list[dict]):
+    """NewsArticleSearch upsert (rows: article_id, category_id, title, body)
+
+    이미 있는 기사는 제목/본문만 갱신한다 (NewsArticle upsert와 같은 규칙).
+    """
+    table = NewsArticleSearchORM.__table__
+    if dialect_name == "mysql":
+        stmt = mysql_insert(table).values(rows)
+        return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in ("title", "body")})
+    stmt = sqlite_insert(table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["article_id"], set_={c: stmt.excluded[c] for c in ("title", "body")}
+    )
+
+
+def ensure_search_indexes(bind) -> None:
+    """MySQL에 ngram FULLTEXT 인덱스가 없으면 생성 (다른 DB면 건너뜀)
+
+    TEXT_COMPRESSION=zstd면 NewsArticle.content가 LONGBLOB이라 평문 사본 테이블에 만든다.
+    """
+    if not fulltext_available(bind.dialect.name):
+        return
+    orm = NewsArticleSearchORM if plain_copy_enabled(bind.dialect.name) else NewsArticleORM
+    table = orm.__tablename__
+    with bind.begin() as conn:
+        existing = set(conn.execute(
+            text(
+                "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t"
+            ),
+            {"t": table},
+        ).scalars())
+        for name, columns in FULLTEXT_INDEXES[table].items():
+            if name in existing:
+                continue
+            cols = ", ".join(f"`{c}`" for c in columns)
+            print(f"[INFO] creating FULLTEXT index {name} on {table}({cols})")
+            conn.execute(text(f"ALTER TABLE `{table}` ADD FULLTEXT INDEX `{name}` ({cols}) WITH PARSER ngram"))
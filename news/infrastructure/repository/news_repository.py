@@ -1,26 +1,87 @@
 from __future__ import annotations
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, desc, insert, update, or_
+from sqlalchemy.orm import aliased
 
+from config.database.count_cache import count_key, get_count_cache
+from config.database.query_cache import NS_ARTICLES, get_query_cache
 from config.database.session import get_db_session
 from fastapi import HTTPException
+import base64
 from datetime import datetime
 from news.infrastructure.orm.news_article_orm import NewsArticleORM
 from weather.infrastructure.orm.news_category_orm import NewsCategoryORM
 from news.infrastructure.orm.publisher_orm import PublisherORM
 from weather.infrastructure.orm.summary_history_orm import SummaryHistoryORM
+from weather.infrastructure.repository.category_registry import get_category_registry
+
+def article_count_key(category_id: int | None = None) -> str:
+    return count_key(NewsArticleORM.__tablename__, category_id=category_id)
+
+
+def latest_summary_id_subquery():
+    """NewsArticle 행마다 최신 SummaryHistory.summary_id (없으면 NULL)
+
+    (article_id, created_at) 인덱스를 역순으로 한 칸만 읽으므로 JOIN 조건에 넣어도
+    기사당 인덱스 lookup 한 번으로 끝난다.
+    """
+    latest = aliased(SummaryHistoryORM)
+    return (
+        select(latest.summary_id)
+        .where(latest.article_id == NewsArticleORM.article_id)
+        .order_by(desc(latest.created_at), desc(latest.summary_id))
+        .limit(1)
+        .correlate(NewsArticleORM)
+        .scalar_subquery()
+    )
+
+
+def article_version(article_id: int, crawled_at, summary_id, summary_created_at) -> str:
+    """기사 상세 응답 버전 (ETag 재료)
+
+    upsert로 제목/본문이 바뀌면 crawled_at이, 요약이 추가되면 최신 summary_id가 바뀐다.
+    """
+    parts = (article_id, crawled_at.isoformat() if crawled_at else "", summary_id or 0,
+             summary_created_at.isoformat() if summary_created_at else "")
+    return ":".join(str(p) for p in parts)
+
+
+def summary_version(article_id: int, summary_id: int, created_at) -> str:
+    return f"{article_id}:{summary_id}:{created_at.isoformat() if created_at else ''}"
+
+
+def encode_cursor(published_at: datetime, article_id: int) -> str:
+    raw = f"{published_at.isoformat()}|{article_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
-class NewsRepository:
-    def list_articles(self, db: Session, page: int, size: int, category_id: int | None = None):
-        where = []
-        if category_id is not None:
-            where.append(NewsArticleORM.category_id == category_id)
 
-        total_stmt = select(func.count()).select_from(NewsArticleORM)
-        if where:
-            total_stmt = total_stmt.where(*where)
-        total = db.execute(total_stmt).scalar_one()
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published_at, article_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+        return datetime.fromisoformat(published_at), int(article_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
+
+def encode_score_cursor(score: float, article_id: int) -> str:
+    """검색 결과용 커서 (score는 repr로 넣어 float 그대로 복원)"""
+    raw = f"{score!r}|{article_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_score_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, article_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+        return float(score), int(article_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class NewsRepository:
+    def _article_list_stmt(self, category_id: int | None):
         stmt = (
             select(
                 NewsArticleORM.article_id,
@@ -36,34 +97,94 @@ class NewsRepository:
             .select_from(NewsArticleORM)
             .join(NewsCategoryORM, NewsCategoryORM.category_id == NewsArticleORM.category_id)
             .outerjoin(PublisherORM, PublisherORM.publisher_id == NewsArticleORM.publisher_id)
-            .order_by(desc(NewsArticleORM.published_at))
-            .offset((page - 1) * size)
-            .limit(size)
+            # article_id로 동순위를 고정해야 페이지/커서 경계가 흔들리지 않음
+            .order_by(desc(NewsArticleORM.published_at), desc(NewsArticleORM.article_id))
         )
-        if where:
-            stmt = stmt.where(*where)
-
-        rows = db.execute(stmt).all()
+        if category_id is not None:
+            stmt = stmt.where(NewsArticleORM.category_id == category_id)
+        return stmt
+
+    @staticmethod
+    def _list_item(r) -> dict:
+        return {
+            "article_id": r.article_id,
+            "category_id": r.category_id,
+            "title": r.title,
+            "category_name": r.category_name,
+            "publisher_name": r.publisher_name,
+            "image_url": r.image_url,
+            "url": r.url,
+            "published_at": r.published_at.isoformat(),
+            "latest_summary_text": r.summary,
+        }
+
+    async def list_articles(
+        self,
+        db: AsyncSession,
+        page: int,
+        size: int,
+        category_id: int | None = None,
+        total_mode: str = "estimate",
+    ):
+        async def _count() -> int:
+            total_stmt = select(func.count()).select_from(NewsArticleORM)
+            if category_id is not None:
+                total_stmt = total_stmt.where(NewsArticleORM.category_id == category_id)
+            return (await db.execute(total_stmt)).scalar_one()
+
+        total = await get_count_cache().get_or_count(
+            article_count_key(category_id), _count, mode=total_mode
+        )
+
+        # total이 없으면 한 건 더 읽어서 다음 페이지 존재 여부 판단
+        limit = size if total is not None else size + 1
+        stmt = self._article_list_stmt(category_id).offset((page - 1) * size).limit(limit)
+        rows = (await db.execute(stmt)).all()
+
+        has_more = page * size < total if total is not None else len(rows) > size
+        rows = rows[:size]
+        items = [self._list_item(r) for r in rows]
+        next_cursor = None
+        if rows and has_more:
+            next_cursor = encode_cursor(rows[-1].published_at, rows[-1].article_id)
+
+        return {"page": page, "size": size, "total": total, "items": items, "next_cursor": next_cursor}
+
+    async def list_articles_after(
+        self, db: AsyncSession, size: int, cursor: str | None = None, category_id: int | None = None
+    ):
+        """keyset 페이지네이션: (published_at, article_id)가 cursor보다 뒤인 기사 size개
+
+        OFFSET/COUNT 없이 ix_news_article_category_published_id 인덱스를 바로 따라가므로
+        몇 번째 페이지든 비용이 같다.
+        """
+        stmt = self._article_list_stmt(category_id)
+        if cursor:
+            published_at, article_id = decode_cursor(cursor)
+            # 앞의 <= 조건이 인덱스 range scan 경계가 되고, OR는 같은 시각 안에서만 걸러낸다
+            # (OR 하나로만 쓰면 옵티마이저가 range를 못 잡고 스캔하는 경우가 있음)
+            stmt = stmt.where(
+                NewsArticleORM.published_at <= published_at,
+                or_(NewsArticleORM.published_at < published_at, NewsArticleORM.article_id < article_id),
+            )
+        # 한 건 더 읽어서 다음 페이지 존재 여부 판단
+        rows = (await db.execute(stmt.limit(size + 1))).all()
+
+        has_more = len(rows) > size
+        rows = rows[:size]
+        next_cursor = encode_cursor(rows[-1].published_at, rows[-1].article_id) if has_more else None
+        return {"size": size, "items": [self._list_item(r) for r in rows], "next_cursor": next_cursor}
 
-        items = []
-        for r in rows:
-            items.append({
-                "article_id": r.article_id,
-                "category_id": r.category_id,
-                "title": r.title,
-                "category_name": r.category_name,
-                "publisher_name": r.publisher_name,
-                "image_url": r.image_url,
-                "url": r.url,
-                "published_at": r.published_at.isoformat(),
-                "latest_summary_text": r.summary,
-            })
-
-        return {"page": page, "size": size, "total": total, "items": items}
-
-    def get_article_detail(self, db: Session, article_id: int):
-        # 1) 기사 본문
-        article_stmt = (
+    async def get_list_items(self, db: AsyncSession, article_ids: list[int]) -> dict[int, dict]:
+        """목록 형식(_list_item) 기사들을 id로 한 번에 조회"""
+        if not article_ids:
+            return {}
+        stmt = self._article_list_stmt(None).where(NewsArticleORM.article_id.in_(article_ids))
+        return {r.article_id: self._list_item(r) for r in (await db.execute(stmt)).all()}
+
+    async def get_article_detail(self, db: AsyncSession, article_id: int):
+        # 기사 본문 + 최신 요약(SummaryHistory)을 한 번에 조회
+        stmt = (
             select(
                 NewsArticleORM.article_id,
                 NewsArticleORM.category_id,
@@ -75,28 +196,28 @@ class NewsRepository:
                 NewsArticleORM.image_url,
                 NewsArticleORM.published_at,
                 NewsArticleORM.crawled_at,
-                NewsCategoryORM.category_name,
-                PublisherORM.publisher_name,
-            )
-            .select_from(NewsArticleORM)
-            .join(NewsCategoryORM, NewsCategoryORM.category_id == NewsArticleORM.category_id)
+                NewsCategoryORM.category_name,
+                PublisherORM.publisher_name,
+                SummaryHistoryORM.summary_id.label("latest_summary_id"),
+                SummaryHistoryORM.summary_text.label("latest_summary_text"),
+                SummaryHistoryORM.created_at.label("latest_summary_created_at"),
+            )
+            .select_from(NewsArticleORM)
+            .join(NewsCategoryORM, NewsCategoryORM.category_id == NewsArticleORM.category_id)
             .outerjoin(PublisherORM, PublisherORM.publisher_id == NewsArticleORM.publisher_id)
+            .outerjoin(SummaryHistoryORM, SummaryHistoryORM.summary_id == latest_summary_id_subquery())
             .where(NewsArticleORM.article_id == article_id)
         )
-        article = db.execute(article_stmt).first()
+        article = (await db.execute(stmt)).first()
         if not article:
             return None
 
-        # 2) 같은 article_id의 최신 요약(SummaryHistory)
-        summary_stmt = (
-            select(SummaryHistoryORM.summary_text, SummaryHistoryORM.created_at)
-            .where(SummaryHistoryORM.article_id == article_id)
-            .order_by(desc(SummaryHistoryORM.created_at))
-            .limit(1)
-        )
-        summary_row = db.execute(summary_stmt).first()
-        summary_text = summary_row.summary_text if summary_row else article.summary
-        summary_created_at = summary_row.created_at if summary_row else article.published_at or article.crawled_at
+        if article.latest_summary_created_at is not None:
+            summary_text = article.latest_summary_text
+            summary_created_at = article.latest_summary_created_at
+        else:
+            summary_text = article.summary
+            summary_created_at = article.published_at or article.crawled_at
 
         return {
             "article_id": article.article_id,
@@ -112,9 +233,40 @@ class NewsRepository:
             "crawled_at": article.crawled_at,
             "summary_text": summary_text,
             "summary_created_at": summary_created_at,
+            "version": article_version(
+                article.article_id, article.crawled_at, article.latest_summary_id, article.latest_summary_created_at
+            ),
         }
 
-    def get_latest_summary(self, db: Session, article_id: int):
+    async def get_article_version(self, db: AsyncSession, article_id: int) -> str | None:
+        """본문/요약 텍스트 없이 버전 컬럼만 조회 (PK + 요약 인덱스 seek, 조건부 GET용)"""
+        stmt = (
+            select(
+                NewsArticleORM.article_id,
+                NewsArticleORM.crawled_at,
+                SummaryHistoryORM.summary_id,
+                SummaryHistoryORM.created_at,
+            )
+            .select_from(NewsArticleORM)
+            .outerjoin(SummaryHistoryORM, SummaryHistoryORM.summary_id == latest_summary_id_subquery())
+            .where(NewsArticleORM.article_id == article_id)
+        )
+        r = (await db.execute(stmt)).first()
+        if not r:
+            return None
+        return article_version(r.article_id, r.crawled_at, r.summary_id, r.created_at)
+
+    async def get_latest_summary_version(self, db: AsyncSession, article_id: int) -> str | None:
+        stmt = (
+            select(SummaryHistoryORM.summary_id, SummaryHistoryORM.created_at)
+            .where(SummaryHistoryORM.article_id == article_id)
+            .order_by(desc(SummaryHistoryORM.created_at), desc(SummaryHistoryORM.summary_id))
+            .limit(1)
+        )
+        r = (await db.execute(stmt)).first()
+        return summary_version(article_id, r.summary_id, r.created_at) if r else None
+
+    async def get_latest_summary(self, db: AsyncSession, article_id: int):
         summary_stmt = (
             select(
                 SummaryHistoryORM.summary_id,
@@ -122,10 +274,10 @@ class NewsRepository:
                 SummaryHistoryORM.created_at,
             )
             .where(SummaryHistoryORM.article_id == article_id)
-            .order_by(desc(SummaryHistoryORM.created_at))
+            .order_by(desc(SummaryHistoryORM.created_at), desc(SummaryHistoryORM.summary_id))
             .limit(1)
         )
-        summary = db.execute(summary_stmt).first()
+        summary = (await db.execute(summary_stmt)).first()
         if not summary:
             return None
         return {
@@ -133,15 +285,42 @@ class NewsRepository:
             "article_id": article_id,
             "summary_text": summary.summary_text,
             "created_at": summary.created_at.isoformat() if summary.created_at else None,
+            "version": summary_version(article_id, summary.summary_id, summary.created_at),
+        }
+
+    async def get_latest_summaries(self, db: AsyncSession, article_ids: list[int]) -> dict[int, dict]:
+        """여러 기사의 최신 요약을 쿼리 한 번으로 조회 (요약이 없는 기사는 결과에서 빠짐)"""
+        ids = list(dict.fromkeys(article_ids))
+        if not ids:
+            return {}
+
+        stmt = (
+            select(
+                NewsArticleORM.article_id,
+                SummaryHistoryORM.summary_id,
+                SummaryHistoryORM.summary_text,
+                SummaryHistoryORM.created_at,
+            )
+            .select_from(NewsArticleORM)
+            .join(SummaryHistoryORM, SummaryHistoryORM.summary_id == latest_summary_id_subquery())
+            .where(NewsArticleORM.article_id.in_(ids))
+        )
+        rows = (await db.execute(stmt)).all()
+        return {
+            r.article_id: {
+                "summary_id": r.summary_id,
+                "article_id": r.article_id,
+                "summary_text": r.summary_text,
+                "created_at": r.created_at.isoformat() if r.created_at else None,
+            }
+            for r in rows
         }
 
-    def list_categories(self, db: Session):
-        stmt = select(NewsCategoryORM.category_id, NewsCategoryORM.category_name).order_by(NewsCategoryORM.category_id)
-        rows = db.execute(stmt).all()
-        return [{"category_id": r.category_id, "category_name": r.category_name} for r in rows]
+    async def list_categories(self, db: AsyncSession):
+        return await get_category_registry().all(db=db)
 
-    def save_article_summary(self, db: Session, article_id: int, summary_text: str):
-        article = db.get(NewsArticleORM, article_id)
+    async def save_article_summary(self, db: AsyncSession, article_id: int, summary_text: str):
+        article = await db.get(NewsArticleORM, article_id)
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
 
@@ -157,6 +336,71 @@ class NewsRepository:
             pdf_path=article.pdf_path,
         )
         db.add(record)
-        db.commit()
-        db.refresh(record)
+        await db.commit()
+        # 목록의 latest_summary_text가 바뀌므로 기사 목록 캐시 무효화
+        await get_query_cache().invalidate(NS_ARTICLES)
+        await db.refresh(record)
         return record
+
+    # ---------- sync (backfill 등 스크립트용, 동기 세션) ----------
+    def find_unsummarized_articles(self, db: Session, after_id: int, limit: int,
+                                   article_ids: list[int] | None = None):
+        """summary가 비어있는 기사를 article_id 순으로 한 페이지씩 조회 (backfill용)
+
+        article_ids를 주면 그 기사들 중에서만 찾는다 (실패한 기사 재시도용).
+        """
+        stmt = (
+            select(NewsArticleORM.article_id, NewsArticleORM.title, NewsArticleORM.content)
+            .where(NewsArticleORM.summary.is_(None))
+            .where(NewsArticleORM.article_id > after_id)
+        )
+        if article_ids is not None:
+            stmt = stmt.where(NewsArticleORM.article_id.in_(article_ids))
+        stmt = stmt.order_by(NewsArticleORM.article_id).limit(limit)
+        return db.execute(stmt).all()
+
+    def save_article_summaries_bulk(self, db: Session, summaries: dict[int, str]) -> list[int]:
+        """save_article_summary와 같은 규칙으로 여러 기사 요약을 한 번에 저장
+
+        이미 summary가 채워진 기사는 건너뛰므로 같은 결과를 다시 써도 안전하다.
+        """
+        if not summaries:
+            return []
+
+        rows = db.execute(
+            select(
+                NewsArticleORM.article_id,
+                NewsArticleORM.category_id,
+                NewsArticleORM.published_at,
+                NewsArticleORM.crawled_at,
+                NewsArticleORM.pdf_path,
+            )
+            .where(NewsArticleORM.article_id.in_(list(summaries.keys())))
+            .where(NewsArticleORM.summary.is_(None))
+        ).all()
+        if not rows:
+            return []
+
+        now = datetime.utcnow()
+        db.execute(
+            update(NewsArticleORM),
+            [{"article_id": r.article_id, "summary": summaries[r.article_id]} for r in rows],
+        )
+        db.execute(
+            insert(SummaryHistoryORM),
+            [
+                {
+                    "article_id": r.article_id,
+                    "target_type": "article",
+                    "target_date": (r.published_at or r.crawled_at or now).date(),
+                    "category_id": r.category_id,
+                    "summary_text": summaries[r.article_id],
+                    "pdf_path": r.pdf_path,
+                    "created_at": now,
+                }
+                for r in rows
+            ],
+        )
+        db.commit()
+        get_query_cache().invalidate_sync(NS_ARTICLES)
+        return [r.article_id for r in rows]
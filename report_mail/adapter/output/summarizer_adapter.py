@@ -1,23 +1,25 @@
-from openai import OpenAI
+from config.openai.llm_gateway import get_llm_gateway
 from report_mail.application.port.summarizer_port import SummarizerPort
-import os
 
 class OpenAISummarizerAdapter(SummarizerPort):
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.llm = get_llm_gateway()
 
     def summarize(self, text: str) -> str:
+        messages = [
+            {"role": "system", "content": "You are a helpful news summarizer."},
+            {"role": "user", "content": f"Summarize the following news article in 3-5 sentences in Korean:\n\n{text}"}
+        ]
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o", # Using a capable model
-                messages=[
-                    {"role": "system", "content": "You are a helpful news summarizer."},
-                    {"role": "user", "content": f"Summarize the following news article in 3-5 sentences in Korean:\n\n{text}"}
-                ],
+            # 같은 기사가 다음 리포트에 다시 올라와도 요약을 재사용
+            return self.llm.chat_sync(
+                "gpt-4o", # Using a capable model
+                messages,
+                cache=True,
                 max_tokens=300,
-                temperature=0.5
+                temperature=0.5,
+                use_case="report_mail",
             )
-            return response.choices[0].message.content.strip()
         except Exception as e:
             print(f"[ERROR] Summarization failed: {e}")
             return "요약 실패"
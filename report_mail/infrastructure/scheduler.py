@@ -6,6 +6,8 @@ from report_mail.adapter.output.news_provider_from_naver_adapter import NewsProv
 from report_mail.adapter.output.summarizer_adapter import OpenAISummarizerAdapter
 from report_mail.adapter.output.mail_sender_adapter import MailSenderAdapter
 from report_mail.application.usecase.send_daily_report_mail_usecase import SendDailyReportMailUseCase
+from config.database.session import get_db_session
+from weather.application.usecase.summary_retention_usecase import SUMMARY_RETENTION_DAYS, SummaryRetentionUseCase
 
 def job_send_daily_mail():
     # Dependency Injection
@@ -19,6 +21,11 @@ def job_send_daily_mail():
     target_email = os.getenv("REPORT_RECEIVE_EMAIL", "admin@example.com")
     usecase.execute(target_email)
 
+def job_archive_summary_history():
+    # 보존 기간이 지난 SummaryHistory를 아카이브 테이블로 이동
+    result = SummaryRetentionUseCase(db_factory=get_db_session).run()
+    print(f"[INFO] summary retention: {result}")
+
 def start_scheduler():
     scheduler = BackgroundScheduler()
     
@@ -33,5 +40,14 @@ def start_scheduler():
         replace_existing=True
     )
     
+    if SUMMARY_RETENTION_DAYS > 0:
+        scheduler.add_job(
+            job_archive_summary_history,
+            trigger=CronTrigger(hour=3, minute=30),
+            id="summary_history_retention",
+            name="Archive expired SummaryHistory rows",
+            replace_existing=True
+        )
+    
     scheduler.start()
     print("[INFO] Scheduler started. Daily report scheduled for 08:00 AM.")
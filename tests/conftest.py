@@ -0,0 +1,63 @@
+"""테스트 공통 설정: MySQL/Redis 없이 SQLite(aiosqlite)로 실행
+
+config.database.session 은 import 시점에 MySQL 접속 정보를 읽으므로 그 전에 기본값을 넣는다.
+"""
+import os
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault("MYSQL_USER", "test")
+os.environ.setdefault("MYSQL_PASSWORD", "test")
+os.environ.setdefault("MYSQL_HOST", "localhost")
+os.environ.setdefault("MYSQL_PORT", "3306")
+os.environ.setdefault("MYSQL_DATABASE", "test")
+os.environ.setdefault("DB_ECHO", "false")
+for _flag in ("LLM_CACHE_USE_REDIS", "COUNT_CACHE_USE_REDIS", "QUERY_CACHE_USE_REDIS",
+              "WEATHER_FORECAST_CACHE_USE_REDIS"):
+    os.environ.setdefault(_flag, "0")
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+
+from config.database.session import Base  # noqa: E402
+import news.infrastructure.orm.news_article_orm  # noqa: E402,F401 (테이블 등록)
+import news.infrastructure.orm.news_article_search_orm  # noqa: E402,F401
+import news.infrastructure.orm.publisher_orm  # noqa: E402,F401
+import weather.infrastructure.orm  # noqa: E402,F401
+from news.infrastructure.orm.news_article_orm import NewsArticleORM  # noqa: E402
+from weather.infrastructure.orm.news_category_orm import NewsCategoryORM  # noqa: E402
+
+
+def create_sqlite_db(path, articles: list[dict], categories=(1, 2)) -> tuple[str, str]:
+    """테이블 생성 + 카테고리/기사 입력 후 (sync URL, async URL) 반환
+
+    articles: article_id, title, content 필수 / category_id 기본 1.
+    """
+    sync_url = f"sqlite:///{path}"
+    engine = create_engine(sync_url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(NewsCategoryORM),
+            [{"category_id": c, "category_name": f"category-{c}"} for c in categories],
+        )
+        if articles:
+            conn.execute(insert(NewsArticleORM), [
+                {
+                    "category_id": 1,
+                    "url": f"https://example.com/{a['article_id']}",
+                    "published_at": datetime(2024, 1, 1),
+                    "crawled_at": datetime(2024, 1, 1),
+                    **a,
+                }
+                for a in articles
+            ])
+    engine.dispose()
+    return sync_url, f"sqlite+aiosqlite:///{path}"
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    def _make(articles: list[dict], name: str = "test.db", categories=(1, 2)) -> tuple[str, str]:
+        return create_sqlite_db(tmp_path / name, articles, categories)
+    return _make
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from news.infrastructure.repository.article_search_repository import NgramArticleIndex
+
+FILLER = "오늘 오후 서울 도심에서 열린 행사에는 많은 시민이 참석했다"
+
+
+def build_index(async_url: str) -> NgramArticleIndex:
+    async def _build():
+        engine = create_async_engine(async_url)
+        index = NgramArticleIndex(batch_size=7)  # 배치 경계를 여러 번 넘도록 작게
+        await index.refresh(async_sessionmaker(bind=engine, expire_on_commit=False))
+        await engine.dispose()
+        return index
+    return asyncio.run(_build())
+
+
+def search(index: NgramArticleIndex, query: str, limit: int = 100, category_id=None, after=None):
+    return asyncio.run(index.search(None, query, limit, category_id=category_id, after=after))
+
+
+def test_bm25_ranking_order(sqlite_db):
+    _, async_url = sqlite_db([
+        {"article_id": 1, "title": "시장 동향", "content": f"반도체 {FILLER}"},
+        {"article_id": 2, "title": "시장 동향", "content": f"반도체 반도체 반도체 {FILLER}"},
+        {"article_id": 3, "title": "반도체 업황", "content": FILLER},
+        {"article_id": 4, "title": "시장 동향", "content": f"반도체 {FILLER} {FILLER} {FILLER}"},
+        {"article_id": 5, "title": "날씨", "content": FILLER},
+    ])
+    index = build_index(async_url)
+    assert len(index) == 5 and index.ready
+
+    ranked = [h.article_id for h in search(index, "반도체")]
+    # 제목 일치(가중치) > 본문 tf 3 > tf 1(짧은 본문) > tf 1(긴 본문), 일치 없는 기사는 제외
+    assert ranked == [3, 2, 1, 4]
+    scores = [h.score for h in search(index, "반도체")]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_category_filter(sqlite_db):
+    _, async_url = sqlite_db([
+        {"article_id": i, "category_id": 1 if i % 3 else 2, "title": f"기준금리 전망 {i}", "content": FILLER}
+        for i in range(1, 13)
+    ])
+    index = build_index(async_url)
+
+    hits = search(index, "기준금리", category_id=2)
+    assert sorted(h.article_id for h in hits) == [3, 6, 9, 12]
+    assert len(search(index, "기준금리")) == 12
+    assert search(index, "기준금리", category_id=99) == []
+
+
+def test_score_cursor_pagination_has_no_duplicates_or_gaps(sqlite_db):
+    articles = []
+    for i in range(1, 31):
+        # 같은 본문을 여러 기사에 넣어 동점(score 같음)이 페이지 경계에 걸리게 함
+        repeat = 1 + i % 3
+        articles.append({"article_id": i, "title": "경제 소식", "content": f"{'수출 ' * repeat}{FILLER}"})
+    _, async_url = sqlite_db(articles)
+    index = build_index(async_url)
+
+    full = search(index, "수출")
+    assert len(full) == 30
+
+    pages, after = [], None
+    while True:
+        page = search(index, "수출", limit=4, after=after)
+        if not page:
+            break
+        pages.extend(page)
+        after = (page[-1].score, page[-1].article_id)
+
+    assert [(h.score, h.article_id) for h in pages] == [(h.score, h.article_id) for h in full]
+    assert len({h.article_id for h in pages}) == 30
+
+
+def test_search_before_first_build_returns_503():
+    async def _search():
+        index = NgramArticleIndex()
+        index.refresh = lambda *args, **kwargs: asyncio.sleep(3600)  # 색인이 오래 걸리는 상황
+        try:
+            with pytest.raises(HTTPException) as exc:
+                await index.search(None, "반도체", 10)
+            assert exc.value.status_code == 503
+            assert index._task is not None  # 요청 밖에서 색인을 시작
+        finally:
+            await index.stop_background_refresh()
+    asyncio.run(_search())
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import config.database.replicas as replicas_module
+import config.database.session as session_module
+from config.database.replicas import ReplicaSet
+from config.database.session import db_read_session, db_session, request_db_scope
+from news.infrastructure.orm.news_article_orm import NewsArticleORM
+
+BROKEN_URL = "sqlite+aiosqlite:////nonexistent-dir/replica.db"
+
+
+@pytest.fixture
+def databases(sqlite_db, monkeypatch):
+    """primary / 정상 복제본은 서로 다른 SQLite 파일 (어디서 읽었는지 title로 구분), 복제본 하나는 열 수 없는 경로"""
+    _, primary_url = sqlite_db([{"article_id": 1, "title": "primary", "content": "x"}], name="primary.db")
+    _, replica_url = sqlite_db([{"article_id": 1, "title": "replica", "content": "x"}], name="replica.db")
+    monkeypatch.setattr(replicas_module, "Gauge", None)  # prometheus registry는 프로세스 전역
+    return primary_url, replica_url
+
+
+def run_with_replicas(databases, monkeypatch, scenario):
+    primary_url, replica_url = databases
+
+    async def _run():
+        primary = create_async_engine(primary_url)
+        replica_set = ReplicaSet({
+            "replica-0": create_async_engine(replica_url),
+            "replica-1": create_async_engine(BROKEN_URL),
+        })
+        monkeypatch.setattr(session_module, "_async_engine", primary)
+        monkeypatch.setattr(session_module, "_AsyncSessionLocal", None)
+        monkeypatch.setattr(session_module, "_replica_set", replica_set)
+        try:
+            await scenario(replica_set)
+        finally:
+            await primary.dispose()
+            for state in replica_set._replicas:
+                await state.engine.dispose()
+    asyncio.run(_run())
+
+
+async def read_title(open_session) -> str:
+    async with open_session() as db:
+        return (await db.execute(select(NewsArticleORM.title).where(NewsArticleORM.article_id == 1))).scalar_one()
+
+
+def replica_state(replica_set: ReplicaSet, name: str):
+    return next(r for r in replica_set._replicas if r.name == name)
+
+
+def test_check_marks_broken_replica_unhealthy(databases, monkeypatch):
+    async def scenario(replica_set):
+        await replica_set.check_all()
+        assert replica_state(replica_set, "replica-0").healthy
+        broken = replica_state(replica_set, "replica-1")
+        assert not broken.healthy
+        assert broken.last_error and broken.checked_at is not None
+    run_with_replicas(databases, monkeypatch, scenario)
+
+
+def test_read_session_routes_to_healthy_replica(databases, monkeypatch):
+    async def scenario(replica_set):
+        await replica_set.check_all()
+        # round-robin이어도 비정상 복제본은 고르지 않음
+        for _ in range(4):
+            async with request_db_scope():
+                assert await read_title(db_read_session) == "replica"
+        assert await read_title(db_read_session) == "replica"  # 요청 범위 밖(스케줄러 등)
+    run_with_replicas(databases, monkeypatch, scenario)
+
+
+def test_read_your_writes_after_primary_session(databases, monkeypatch):
+    async def scenario(replica_set):
+        await replica_set.check_all()
+        async with request_db_scope():
+            async with db_session() as db:
+                await db.execute(
+                    update(NewsArticleORM).where(NewsArticleORM.article_id == 1).values(title="written")
+                )
+                await db.commit()
+            # 같은 요청에서 primary를 썼으면 읽기도 primary (복제 지연으로 옛 값을 보지 않게)
+            assert await read_title(db_read_session) == "written"
+
+        async with request_db_scope():
+            assert await read_title(db_read_session) == "replica"
+    run_with_replicas(databases, monkeypatch, scenario)
+
+
+def test_falls_back_to_primary_without_healthy_replica(databases, monkeypatch):
+    async def scenario(replica_set):
+        await replica_set.check_all()
+        replica_state(replica_set, "replica-0").healthy = False  # 예: 복제 지연 초과
+        assert replica_set.pick() is None
+
+        async with request_db_scope():
+            assert await read_title(db_read_session) == "primary"
+        assert await read_title(db_read_session) == "primary"
+    run_with_replicas(databases, monkeypatch, scenario)
+
+
+def test_request_scope_outlives_streaming_body_and_background_tasks(databases, monkeypatch):
+    from fastapi import BackgroundTasks, FastAPI
+    from fastapi.responses import StreamingResponse
+    from fastapi.testclient import TestClient
+
+    primary_url, _ = databases
+    seen = []
+
+    async def read_in_scope(label):
+        assert session_module._request_scope.get() is not None
+        async with db_session() as db:
+            title = (await db.execute(select(NewsArticleORM.title).where(NewsArticleORM.article_id == 1))).scalar_one()
+        seen.append((label, title, db.is_active))
+
+    app = FastAPI()
+    app.add_middleware(session_module.RequestDBScopeMiddleware)
+
+    @app.get("/stream")
+    async def stream(tasks: BackgroundTasks):
+        tasks.add_task(read_in_scope, "background")
+
+        async def body():
+            await read_in_scope("body")
+            yield b"ok"
+        return StreamingResponse(body())
+
+    monkeypatch.setattr(session_module, "_async_engine", create_async_engine(primary_url))
+    monkeypatch.setattr(session_module, "_AsyncSessionLocal", None)
+    with TestClient(app) as client:
+        assert client.get("/stream").text == "ok"
+    # 응답 본문과 백그라운드 작업이 끝날 때까지 요청 범위 세션이 열려 있어야 함
+    assert seen == [("body", "primary", True), ("background", "primary", True)]
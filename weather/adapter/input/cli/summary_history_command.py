@@ -0,0 +1,61 @@
+"""SummaryHistory 파티션 전환 / 보존 기간 아카이브
+
+1) (MySQL, 한 번만) target_date 월 파티션으로 전환. 테이블을 다시 쓰므로 점검 시간에 실행:
+    python -m weather.adapter.input.cli.summary_history_command partition
+2) 보존 기간이 지난 행을 SummaryHistoryArchive로 이동 (서버 스케줄러가 매일 실행):
+    python -m weather.adapter.input.cli.summary_history_command retain --days 180
+"""
+import argparse
+
+from dotenv import load_dotenv
+
+from config.database.session import Base, engine, get_db_session
+from weather.application.usecase.summary_retention_usecase import (
+    SUMMARY_PARTITION_MONTHS_AHEAD,
+    SUMMARY_RETENTION_BATCH_SIZE,
+    SUMMARY_RETENTION_DAYS,
+    SummaryRetentionUseCase,
+)
+from weather.infrastructure.orm.summary_history_archive_orm import SummaryHistoryArchiveORM
+from weather.infrastructure.repository import summary_history_partitions as partitions
+
+
+def main():
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Partition and archive SummaryHistory by target_date")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_partition = sub.add_parser("partition", help="SummaryHistory를 월 파티션 테이블로 전환 (MySQL)")
+    p_partition.add_argument("--months-ahead", type=int, default=SUMMARY_PARTITION_MONTHS_AHEAD)
+
+    p_retain = sub.add_parser("retain", help="보존 기간이 지난 행을 아카이브로 이동")
+    p_retain.add_argument("--days", type=int, default=SUMMARY_RETENTION_DAYS, help="보존 일수 (target_date 기준)")
+    p_retain.add_argument("--batch-size", type=int, default=SUMMARY_RETENTION_BATCH_SIZE)
+    p_retain.add_argument("--max-batches", type=int, default=None, help="이번 실행에서 처리할 최대 배치 수")
+    args = parser.parse_args()
+
+    if args.command == "partition":
+        if engine.dialect.name != "mysql":
+            raise SystemExit("partitioning is only supported on MySQL")
+        with engine.begin() as conn:
+            created = partitions.partition_table(conn, months_ahead=args.months_ahead)
+        if created:
+            print(f"[INFO] created partitions: {', '.join(created)}")
+        else:
+            print("[INFO] SummaryHistory is already partitioned")
+        return
+
+    if args.days <= 0:
+        raise SystemExit("--days must be positive")
+    Base.metadata.create_all(bind=engine, tables=[SummaryHistoryArchiveORM.__table__])
+    usecase = SummaryRetentionUseCase(
+        db_factory=get_db_session,
+        retention_days=args.days,
+        batch_size=args.batch_size,
+    )
+    print(f"[INFO] summary retention done: {usecase.run(max_batches=args.max_batches)}")
+
+
+if __name__ == "__main__":
+    main()
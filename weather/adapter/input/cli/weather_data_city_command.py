@@ -0,0 +1,33 @@
+"""WeatherData.city 컬럼 + (city, date, created_at) 인덱스 추가
+
+컬럼이 생기기 전 행은 어느 도시 예보인지 알 수 없어 NULL로 남기며, 조회에서 제외된다.
+
+실행 예:
+    python -m weather.adapter.input.cli.weather_data_city_command
+"""
+from dotenv import load_dotenv
+from sqlalchemy import inspect, text
+
+from config.database.session import engine
+from weather.infrastructure.orm.weather_data_orm import WeatherDataORM
+
+
+def ensure_city_column(bind) -> None:
+    table = WeatherDataORM.__tablename__
+    columns = {c["name"] for c in inspect(bind).get_columns(table)}
+    if "city" not in columns:
+        print(f"[INFO] ALTER {table} ADD city")
+        with bind.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN city VARCHAR(100) NULL"))
+    for index in WeatherDataORM.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
+
+
+def main():
+    load_dotenv()
+    ensure_city_column(engine)
+    print("[INFO] WeatherData.city ready")
+
+
+if __name__ == "__main__":
+    main()
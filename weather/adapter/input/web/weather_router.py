@@ -1,7 +1,5 @@
-import io
-
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Header, Response
+from fastapi.responses import FileResponse, JSONResponse
 
 from weather.adapter.input.web.request.weather_by_date_request import WeatherByDateRequest
 from weather.adapter.input.web.response.weather_summary_response import WeatherSummaryResponse
@@ -18,11 +16,19 @@ async def weather_by_date(request: WeatherByDateRequest):
 
 
 @weather_router.get("/summary/tts")
-async def weather_summary_tts(city: str, date: str):
-    audio = await weather_usecase.get_summary_tts(city, date)
+async def weather_summary_tts(city: str, date: str, if_none_match: str | None = Header(None)):
+    # 캐시 파일 이름이 hash(model, voice, 요약문)이므로 그대로 ETag로 씀
+    path = await weather_usecase.get_summary_tts(city, date)
+    etag = f'"{path.stem}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=300"}
+    if if_none_match and etag in [t.strip().removeprefix("W/") for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
     filename = f"weather-summary-{city}-{date}.mp3"
-    return StreamingResponse(
-        io.BytesIO(audio),
+    # FileResponse: Range/If-Range 처리, 서버가 지원하면 pathsend로 파일을 바로 전송
+    return FileResponse(
+        path,
         media_type="audio/mpeg",
-        headers={"Content-Disposition": f'attachment; filename=\"{filename}\"'},
-    )
\ No newline at end of file
+        filename=filename,
+        headers=headers,
+    )
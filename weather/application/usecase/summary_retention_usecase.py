@@ -0,0 +1,98 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from weather.infrastructure.orm.summary_history_archive_orm import SummaryHistoryArchiveORM
+from weather.infrastructure.orm.summary_history_orm import SummaryHistoryORM
+from weather.infrastructure.repository import summary_history_partitions as partitions
+
+# target_date가 이 일수보다 오래된 요약은 SummaryHistoryArchive로 옮김 (0이면 보존 작업 끔)
+SUMMARY_RETENTION_DAYS = int(os.getenv("SUMMARY_RETENTION_DAYS", "180"))
+SUMMARY_RETENTION_BATCH_SIZE = int(os.getenv("SUMMARY_RETENTION_BATCH_SIZE", "1000"))
+# 미리 만들어 둘 미래 월 파티션 수 (MySQL 파티션 테이블일 때만)
+SUMMARY_PARTITION_MONTHS_AHEAD = int(os.getenv("SUMMARY_PARTITION_MONTHS_AHEAD", "3"))
+
+_ARCHIVE_COLUMNS = (
+    "summary_id", "article_id", "target_type", "target_date",
+    "category_id", "summary_text", "pdf_path", "created_at",
+)
+
+
+class SummaryRetentionUseCase:
+    """보존 기간이 지난 SummaryHistory 행을 아카이브 테이블로 옮기고 원본에서 삭제
+
+    summary_id 오름차순 배치마다 archive INSERT + 원본 DELETE를 한 트랜잭션으로 커밋하므로
+    중간에 멈춰도 다시 실행하면 남은 행부터 이어서 처리된다.
+    MySQL 파티션 테이블이면 끝난 뒤 미래 파티션을 추가하고 비워진 오래된 파티션을 지운다.
+    """
+
+    def __init__(
+        self,
+        db_factory: Callable[[], Session],
+        retention_days: int = SUMMARY_RETENTION_DAYS,
+        batch_size: int = SUMMARY_RETENTION_BATCH_SIZE,
+        months_ahead: int = SUMMARY_PARTITION_MONTHS_AHEAD,
+    ):
+        self.db_factory = db_factory
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.months_ahead = months_ahead
+
+    def horizon(self, today: Optional[date] = None) -> date:
+        return (today or date.today()) - timedelta(days=self.retention_days)
+
+    def run(self, today: Optional[date] = None, max_batches: Optional[int] = None) -> dict:
+        horizon = self.horizon(today)
+        result = {"horizon": horizon.isoformat(), "archived": 0, "partitions_added": [], "partitions_dropped": []}
+
+        db = self.db_factory()
+        try:
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                moved = self._archive_batch(db, horizon)
+                if not moved:
+                    break
+                result["archived"] += moved
+                batches += 1
+                print(f"[INFO] summary retention: archived {result['archived']} rows older than {horizon}")
+
+            if db.bind.dialect.name == "mysql":
+                conn = db.connection()
+                result["partitions_added"] = partitions.add_future_partitions(conn, self.months_ahead, today)
+                result["partitions_dropped"] = partitions.drop_empty_partitions_before(conn, horizon)
+                db.commit()
+        finally:
+            db.close()
+        return result
+
+    def _archive_batch(self, db: Session, horizon: date) -> int:
+        src = SummaryHistoryORM.__table__
+        ids = db.execute(
+            select(src.c.summary_id)
+            .where(src.c.target_date < horizon)
+            .order_by(src.c.summary_id)
+            .limit(self.batch_size)
+        ).scalars().all()
+        if not ids:
+            return 0
+
+        # summary_text는 CompressedText라 ORM 타입을 거쳐 읽어야 평문으로 풀리고,
+        # archive 쪽 CompressedText(always=True)가 다시 압축해 저장한다
+        rows = db.execute(
+            select(*(src.c[name] for name in _ARCHIVE_COLUMNS)).where(src.c.summary_id.in_(ids))
+        ).mappings().all()
+        archived_at = datetime.utcnow()
+        try:
+            db.execute(
+                insert(SummaryHistoryArchiveORM.__table__),
+                [{**row, "archived_at": archived_at} for row in rows],
+            )
+            db.execute(delete(src).where(src.c.summary_id.in_(ids)))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(ids)
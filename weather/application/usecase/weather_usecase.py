@@ -1,12 +1,15 @@
 import os
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional, Tuple
 
 import httpx
 from fastapi import HTTPException
-from openai import OpenAI
 
+from config.openai.llm_gateway import LLMGateway, get_llm_gateway
+from config.openai.tts_audio_cache import TTSAudioCache, get_tts_audio_cache
 from weather.adapter.input.web.response.weather_summary_response import WeatherDataPoint
+from weather.infrastructure.repository.forecast_cache import ForecastCache, get_forecast_cache, normalize_city
 from weather.infrastructure.repository.weather_repository import WeatherRepository
 
 DEFAULT_FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
@@ -18,13 +21,17 @@ class WeatherUseCase:
         self,
         api_key: Optional[str] = None,
         forecast_url: Optional[str] = None,
-        openai_client: Optional[OpenAI] = None,
+        llm_gateway: Optional[LLMGateway] = None,
         repository: Optional[WeatherRepository] = None,
+        forecast_cache: Optional[ForecastCache] = None,
+        tts_cache: Optional[TTSAudioCache] = None,
     ):
         self.api_key = api_key or os.getenv("OPENWEATHER_API_KEY")
         self.forecast_url = forecast_url or os.getenv("OPENWEATHER_FORECAST_URL") or DEFAULT_FORECAST_URL
-        self.openai_client = openai_client
+        self.llm_gateway = llm_gateway
         self.repository = repository or WeatherRepository.getInstance()
+        self.forecast_cache = forecast_cache or get_forecast_cache()
+        self.tts_cache = tts_cache or get_tts_audio_cache()
         self.summary_category_id: Optional[int] = None
 
     async def fetch_weather_by_date(self, city: str, date_str: str) -> dict:
@@ -32,17 +39,24 @@ class WeatherUseCase:
         if not self.api_key:
             raise HTTPException(status_code=500, detail="OPENWEATHER_API_KEY is not configured.")
 
+        city_key = normalize_city(city)
         target_type = self._target_type(city)
-        category_id = self._get_summary_category_id()
+        category_id = await self._get_summary_category_id()
 
-        cached_summary = self.repository.get_latest_summary(
+        cached_summary = await self.repository.get_latest_summary(
             target_type=target_type,
             target_date=target_date,
             category_id=category_id,
         )
         if cached_summary:
-            cached_weather = self.repository.get_latest_weather_data(target_date)
-            raw_points = cached_weather.raw_json if cached_weather and cached_weather.raw_json else []
+            # 요약과 함께 저장한 같은 도시의 WeatherData를 돌려줘야 요약과 수치가 맞는다.
+            # 그 행이 없을 때만(예전 데이터 등) 예보 캐시에 남은 값을 쓴다
+            cached_weather = await self.repository.get_latest_weather_data(target_date, city=city_key)
+            if cached_weather and cached_weather.raw_json:
+                raw_points = cached_weather.raw_json
+            else:
+                cached_forecast = await self.forecast_cache.peek(city_key)
+                raw_points = (cached_forecast or {"days": {}})["days"].get(date_str, [])
             data_points = self._raw_to_data_points(raw_points)
             return {
                 "city": city,
@@ -51,16 +65,16 @@ class WeatherUseCase:
                 "summary": cached_summary.summary_text,
             }
 
-        forecast = await self._get_forecast(city)
-        matched_points = self._filter_by_date(forecast, target_date)
-        if not matched_points:
+        # 5일치를 한 번 받아 도시별로 캐시해 두고 날짜만 골라 씀
+        forecast = await self.forecast_cache.get_or_fetch(city_key, lambda: self._fetch_forecast_days(city))
+        cleaned = self._raw_to_data_points(forecast["days"].get(target_date.isoformat(), []))
+        if not cleaned:
             raise HTTPException(status_code=404, detail="No data for that date (OpenWeatherMap provides ~5 days).")
 
-        cleaned = [self._clean_point(m) for m in matched_points]
         summary = await self._summarize(city, date_str, cleaned)
 
         try:
-            self._persist(target_type, target_date, cleaned, summary, category_id)
+            await self._persist(target_type, target_date, cleaned, summary, category_id, city=city_key)
         except Exception as exc:
             raise HTTPException(status_code=500, detail="Failed to store weather summary.") from exc
 
@@ -97,8 +111,10 @@ class WeatherUseCase:
 
         return res.json()
 
-    def _filter_by_date(self, forecast: dict, target_date) -> List[dict]:
-        matched = []
+    async def _fetch_forecast_days(self, city: str) -> dict:
+        """외부 예보를 받아 날짜별 data point로 묶음 (ForecastCache에 저장되는 값)"""
+        forecast = await self._get_forecast(city)
+        days: dict[str, List[dict]] = {}
         for item in forecast.get("list", []):
             dt_txt = item.get("dt_txt")
             if not dt_txt:
@@ -107,9 +123,8 @@ class WeatherUseCase:
                 item_date = datetime.strptime(dt_txt, "%Y-%m-%d %H:%M:%S").date()
             except ValueError:
                 continue
-            if item_date == target_date:
-                matched.append(item)
-        return matched
+            days.setdefault(item_date.isoformat(), []).append(self._clean_point(item).dict())
+        return {"fetched_at": datetime.utcnow().isoformat(), "days": days}
 
     def _clean_point(self, item: dict) -> WeatherDataPoint:
         return WeatherDataPoint(
@@ -130,20 +145,22 @@ class WeatherUseCase:
                 continue
         return data_points
 
-    def _persist(
+    async def _persist(
         self,
         target_type: str,
         target_date,
         data_points: List[WeatherDataPoint],
         summary: Optional[str],
         category_id: int,
+        city: Optional[str] = None,
     ):
         avg_temp, avg_humidity, avg_wind = self._aggregate_metrics(data_points)
         description = data_points[0].weather if data_points else None
         raw_json = [p.dict() for p in data_points]
 
-        self.repository.save_weather_data(
+        await self.repository.save_weather_data(
             target_date=target_date,
+            city=city,
             temperature=avg_temp,
             humidity=avg_humidity,
             wind_speed=avg_wind,
@@ -152,7 +169,7 @@ class WeatherUseCase:
         )
 
         if summary:
-            self.repository.save_summary(
+            await self.repository.save_summary(
                 target_type=target_type,
                 target_date=target_date,
                 summary_text=summary,
@@ -176,8 +193,8 @@ class WeatherUseCase:
         return avg_temp, avg_hum, avg_wind
 
     async def _summarize(self, city: str, date_str: str, data_points: List[WeatherDataPoint]) -> Optional[str]:
-        client = self._get_openai_client()
-        if client is None:
+        llm = self._get_llm_gateway()
+        if llm is None:
             return None
 
         prompt = f"""
@@ -191,61 +208,54 @@ class WeatherUseCase:
 {[p.dict() for p in data_points]}
 """
         try:
-            ai_response = client.chat.completions.create(
+            # 같은 예보 데이터면 요약도 같으므로 캐시 사용
+            return await llm.chat(
                 model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
                 messages=[{"role": "user", "content": prompt}],
+                cache=True,
+                use_case="weather",
             )
         except Exception:
             return None
 
-        choice = ai_response.choices[0].message
-        if isinstance(choice, dict):
-            return choice.get("content")
-        return getattr(choice, "content", None)
-
-    async def get_summary_tts(self, city: str, date_str: str) -> bytes:
+    async def get_summary_tts(self, city: str, date_str: str) -> Path:
+        """요약 음성 mp3 파일 경로 (같은 model/voice/요약문이면 디스크 캐시 파일을 그대로 사용)"""
         result = await self.fetch_weather_by_date(city, date_str)
         summary_text = result.get("summary")
         if not summary_text:
             raise HTTPException(status_code=404, detail="Summary not available for that date.")
 
-        client = self._get_openai_client()
-        if client is None:
-            raise HTTPException(status_code=500, detail="OpenAI client not configured.")
-
         model = os.getenv("OPENAI_TTS_MODEL", "gpt-4o-mini-tts")
         voice = os.getenv("OPENAI_TTS_VOICE", "alloy")
 
-        try:
-            with client.audio.speech.with_streaming_response.create(
-                model=model,
-                voice=voice,
-                input=summary_text,
-            ) as response:
-                audio_bytes = b"".join(response.iter_bytes())
-        except Exception as exc:
-            raise HTTPException(status_code=502, detail="TTS generation failed.") from exc
+        async def _generate() -> bytes:
+            llm = self._get_llm_gateway()
+            if llm is None:
+                raise HTTPException(status_code=500, detail="OpenAI client not configured.")
+            try:
+                return await llm.speech(model=model, voice=voice, text=summary_text, use_case="weather")
+            except Exception as exc:
+                raise HTTPException(status_code=502, detail="TTS generation failed.") from exc
 
-        return audio_bytes
+        return await self.tts_cache.get_or_create(model, voice, summary_text, _generate)
 
-    def _get_openai_client(self) -> Optional[OpenAI]:
-        if self.openai_client:
-            return self.openai_client
+    def _get_llm_gateway(self) -> Optional[LLMGateway]:
+        if self.llm_gateway:
+            return self.llm_gateway
         try:
-            self.openai_client = OpenAI()
+            self.llm_gateway = get_llm_gateway()
         except Exception:
-            self.openai_client = None
-        return self.openai_client
+            self.llm_gateway = None
+        return self.llm_gateway
 
     def _target_type(self, city: str) -> str:
-        normalized = city.strip().lower()
-        return f"weather:{normalized}"
+        return f"weather:{normalize_city(city)}"
 
-    def _get_summary_category_id(self) -> int:
+    async def _get_summary_category_id(self) -> int:
         if self.summary_category_id is not None:
             return self.summary_category_id
 
-        category_id = self.repository.get_category_id_by_name(WEATHER_CATEGORY_NAME)
+        category_id = await self.repository.get_category_id_by_name(WEATHER_CATEGORY_NAME)
         if category_id is None:
             raise HTTPException(status_code=500, detail="Weather category not found in NewsCategory.")
 
@@ -1,9 +1,11 @@
 from weather.infrastructure.orm.news_category_orm import NewsCategoryORM
+from weather.infrastructure.orm.summary_history_archive_orm import SummaryHistoryArchiveORM
 from weather.infrastructure.orm.summary_history_orm import SummaryHistoryORM
 from weather.infrastructure.orm.weather_data_orm import WeatherDataORM
 
 __all__ = [
     "NewsCategoryORM",
+    "SummaryHistoryArchiveORM",
     "SummaryHistoryORM",
     "WeatherDataORM",
 ]
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, String
+
+from config.database.compressed_text import CompressedText
+from config.database.session import Base
+
+
+class SummaryHistoryArchiveORM(Base):
+    """보존 기간이 지난 SummaryHistory 행 (summary_id 그대로 유지, 본문은 항상 zstd 압축)"""
+
+    __tablename__ = "SummaryHistoryArchive"
+    __table_args__ = (
+        Index("ix_summary_history_archive_type_date", "target_type", "target_date"),
+    )
+
+    summary_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    article_id = Column(BigInteger, index=True)
+    target_type = Column(String(50), nullable=False)
+    target_date = Column(Date, nullable=False)
+    category_id = Column(BigInteger)
+    summary_text = Column(CompressedText(always=True), nullable=False)
+    pdf_path = Column(String(500))
+    created_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,19 +1,27 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Column, Date, DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, Column, Date, DateTime, ForeignKey, Index, String
 
+from config.database.compressed_text import CompressedText
 from config.database.session import Base
 
 
 class SummaryHistoryORM(Base):
     __tablename__ = "SummaryHistory"
+    __table_args__ = (
+        # 기사별 최신 요약: article_id = ? ORDER BY created_at DESC LIMIT 1
+        Index("ix_summary_history_article_created", "article_id", "created_at"),
+        # 날씨 등 대상별 최신 요약: target_type = ? AND target_date = ? [AND category_id = ?] ORDER BY created_at DESC
+        Index("ix_summary_history_type_date_category_created", "target_type", "target_date", "category_id", "created_at"),
+    )
 
     summary_id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
     # 뉴스 기사 연동 시 사용할 수 있도록 optional FK 추가
-    article_id = Column(BigInteger, ForeignKey("NewsArticle.article_id"), nullable=True, index=True)
+    # 단일 인덱스 대신 ix_summary_history_article_created 의 선두 컬럼으로 FK 인덱스를 겸함
+    article_id = Column(BigInteger, ForeignKey("NewsArticle.article_id"), nullable=True)
     target_type = Column(String(50), nullable=False)
     target_date = Column(Date, nullable=False)
     category_id = Column(BigInteger)
-    summary_text = Column(Text, nullable=False)
+    summary_text = Column(CompressedText, nullable=False)
     pdf_path = Column(String(500))
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
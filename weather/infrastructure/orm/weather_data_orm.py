@@ -1,14 +1,19 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Column, Date, DateTime, Integer, JSON, Numeric, String
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, Integer, JSON, Numeric, String
 
 from config.database.session import Base
 
 
 class WeatherDataORM(Base):
     __tablename__ = "WeatherData"
+    __table_args__ = (
+        Index("ix_weather_data_city_date_created", "city", "date", "created_at"),
+    )
 
     weather_id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
+    # normalize_city 값 (컬럼 추가 전 행은 NULL)
+    city = Column(String(100))
     date = Column(Date, nullable=False)
     temperature = Column(Numeric(5, 2))
     humidity = Column(Integer)
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database.session import db_read_session
+from weather.infrastructure.orm.news_category_orm import NewsCategoryORM
+
+# 전체를 다시 읽는 주기 (카테고리는 거의 바뀌지 않음)
+CATEGORY_REGISTRY_TTL_SECONDS = float(os.getenv("CATEGORY_REGISTRY_TTL_SECONDS", "600"))
+# 모르는 이름/id가 들어왔을 때 새로 추가된 카테고리인지 다시 읽어볼 최소 간격
+CATEGORY_REGISTRY_MISS_RELOAD_SECONDS = float(os.getenv("CATEGORY_REGISTRY_MISS_RELOAD_SECONDS", "30"))
+
+
+class CategoryRegistry:
+    """NewsCategory 전체를 메모리에 올려 두고 name <-> id 를 조회 없이 찾는다
+
+    TTL이 지나거나 invalidate()가 불리면 다음 조회 때 한 번 다시 읽는다.
+    모르는 값은 바로 None을 주지 않고, 최근에 다시 읽은 적이 없으면 한 번 더 읽어 본다
+    (다른 프로세스가 카테고리를 추가한 경우).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = CATEGORY_REGISTRY_TTL_SECONDS,
+        miss_reload_seconds: float = CATEGORY_REGISTRY_MISS_RELOAD_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.miss_reload_seconds = miss_reload_seconds
+        self._by_name: dict[str, int] = {}
+        self._by_id: dict[int, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._reload_lock: Optional[asyncio.Lock] = None
+        self.loads = 0
+
+    def _fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    async def _load(self, db: Optional[AsyncSession] = None) -> None:
+        stmt = select(NewsCategoryORM.category_id, NewsCategoryORM.category_name)
+        if db is not None:
+            rows = (await db.execute(stmt)).all()
+        else:
+            async with db_read_session() as session:
+                rows = (await session.execute(stmt)).all()
+        # dict를 통째로 바꿔 끼우므로 읽는 쪽은 lock 없이 봐도 된다
+        self._by_name = {r.category_name: r.category_id for r in rows}
+        self._by_id = {r.category_id: r.category_name for r in rows}
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+
+    async def _reload(self, db: Optional[AsyncSession], if_loaded_before: Optional[float]) -> None:
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+        async with self._reload_lock:
+            # 기다리는 동안 다른 요청이 이미 다시 읽었으면 건너뜀
+            if self._loaded_at != if_loaded_before:
+                return
+            await self._load(db)
+
+    async def _ensure_loaded(self, db: Optional[AsyncSession] = None) -> None:
+        if not self._fresh():
+            await self._reload(db, self._loaded_at)
+
+    async def _reload_on_miss(self, db: Optional[AsyncSession] = None) -> bool:
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.miss_reload_seconds:
+            return False
+        await self._reload(db, loaded_at)
+        return True
+
+    async def id_by_name(self, name: str, db: Optional[AsyncSession] = None) -> Optional[int]:
+        await self._ensure_loaded(db)
+        category_id = self._by_name.get(name)
+        if category_id is None and await self._reload_on_miss(db):
+            category_id = self._by_name.get(name)
+        return category_id
+
+    async def name_by_id(self, category_id: int, db: Optional[AsyncSession] = None) -> Optional[str]:
+        await self._ensure_loaded(db)
+        name = self._by_id.get(category_id)
+        if name is None and await self._reload_on_miss(db):
+            name = self._by_id.get(category_id)
+        return name
+
+    async def all(self, db: Optional[AsyncSession] = None) -> list[dict]:
+        await self._ensure_loaded(db)
+        return [{"category_id": i, "category_name": n} for i, n in sorted(self._by_id.items())]
+
+    def invalidate(self) -> None:
+        """카테고리를 추가/수정한 뒤 호출하면 다음 조회 때 다시 읽는다"""
+        self._loaded_at = None
+
+    def stats(self) -> dict:
+        return {
+            "categories": len(self._by_id),
+            "loads": self.loads,
+            "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at is not None else None,
+        }
+
+
+_category_registry_instance: Optional[CategoryRegistry] = None
+_category_registry_lock = threading.Lock()
+
+
+def get_category_registry() -> CategoryRegistry:
+    global _category_registry_instance
+    with _category_registry_lock:
+        if _category_registry_instance is None:
+            _category_registry_instance = CategoryRegistry()
+        return _category_registry_instance
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from config.redis.redis_tier import RedisTier
+
+load_dotenv()
+
+WEATHER_FORECAST_CACHE_USE_REDIS = os.getenv("WEATHER_FORECAST_CACHE_USE_REDIS", "1") == "1"
+# OpenWeather 5-day/3-hour 예보는 UTC 기준 3시간 단위로 갱신되고 반영까지 약간 걸림
+FORECAST_UPDATE_HOURS = 3
+WEATHER_FORECAST_UPDATE_GRACE_SECONDS = int(os.getenv("WEATHER_FORECAST_UPDATE_GRACE_SECONDS", "600"))
+FORECAST_MIN_TTL_SECONDS = 60
+WEATHER_FORECAST_CACHE_PREFIX = "weather:forecast:"
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_city(city: str) -> str:
+    """캐시 key / SummaryHistory.target_type 용 도시 이름 (앞뒤 공백 제거, 공백 하나로, 소문자)"""
+    return _SPACES.sub(" ", (city or "").strip()).casefold()
+
+
+def forecast_ttl_seconds(now: Optional[datetime] = None, grace_seconds: int = WEATHER_FORECAST_UPDATE_GRACE_SECONDS) -> int:
+    """다음 예보 갱신 시각(UTC 3시간 경계 + grace)까지 남은 초
+
+    갱신 직후 grace 구간에 받은 응답은 아직 이전 회차일 수 있으므로 grace 끝까지만 둔다.
+    """
+    now = now or datetime.now(timezone.utc)
+    slot_start = now.replace(hour=now.hour - now.hour % FORECAST_UPDATE_HOURS, minute=0, second=0, microsecond=0)
+    grace = timedelta(seconds=grace_seconds)
+    expires_at = slot_start + grace
+    if now >= expires_at:
+        expires_at += timedelta(hours=FORECAST_UPDATE_HOURS)
+    return max(int((expires_at - now).total_seconds()), FORECAST_MIN_TTL_SECONDS)
+
+
+class ForecastCache:
+    """도시별 5일 예보 캐시 (Redis, 실패하면 프로세스 로컬)
+
+    값은 {"fetched_at": ..., "days": {"YYYY-MM-DD": [data point, ...]}} 형태라
+    한 번 받아 온 예보로 창 안의 모든 날짜를 응답한다. 같은 도시를 동시에 요청하면
+    외부 API는 한 번만 호출한다. Redis 호출은 RedisTier를 거친다.
+    """
+
+    def __init__(self, use_redis: bool = WEATHER_FORECAST_CACHE_USE_REDIS):
+        self.redis = RedisTier("forecast cache", enabled=use_redis)
+        self._local: dict[str, tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(city_key: str) -> str:
+        return WEATHER_FORECAST_CACHE_PREFIX + city_key
+
+    async def peek(self, city_key: str) -> Optional[dict]:
+        """캐시에 있는 예보만 반환 (없어도 외부 API를 부르지 않음)"""
+        key = self._key(city_key)
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                if entry[0] >= time.monotonic():
+                    return entry[1]
+                del self._local[key]
+
+        # 값과 남은 TTL을 한 번의 왕복(pipeline)으로
+        result = await self.redis.call("get", lambda r: r.pipeline(transaction=False).get(key).ttl(key).execute())
+        if result is None or result[0] is None:
+            return None
+        raw, ttl = result
+        value = json.loads(raw)
+        if ttl > 0:
+            # 로컬 사본도 Redis에 남은 시간까지만
+            with self._lock:
+                self._local[key] = (time.monotonic() + ttl, value)
+        return value
+
+    async def _store(self, city_key: str, value: dict) -> None:
+        key = self._key(city_key)
+        ttl = forecast_ttl_seconds()
+        with self._lock:
+            self._local[key] = (time.monotonic() + ttl, value)
+        raw = json.dumps(value, ensure_ascii=False)
+        await self.redis.call("set", lambda r: r.set(key, raw, ex=ttl))
+
+    async def get_or_fetch(self, city_key: str, fetch: Callable[[], Awaitable[dict]]) -> dict:
+        cached = await self.peek(city_key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(city_key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[city_key] = future
+        try:
+            value = await fetch()
+            await self._store(city_key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없을 때 "never retrieved" 경고 방지
+            raise
+        finally:
+            self._inflight.pop(city_key, None)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "local_entries": len(self._local),
+            **self.redis.stats(),
+        }
+
+
+_forecast_cache_instance: Optional[ForecastCache] = None
+_forecast_cache_lock = threading.Lock()
+
+
+def get_forecast_cache() -> ForecastCache:
+    global _forecast_cache_instance
+    with _forecast_cache_lock:
+        if _forecast_cache_instance is None:
+            _forecast_cache_instance = ForecastCache()
+        return _forecast_cache_instance
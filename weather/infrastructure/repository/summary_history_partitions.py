@@ -0,0 +1,106 @@
+"""SummaryHistory 월 단위 RANGE COLUMNS(target_date) 파티션 관리 (MySQL 전용)
+
+MySQL 파티션 테이블은 외래키를 가질 수 없고 모든 unique 키(PK 포함)에 파티션 컬럼이
+들어가야 하므로, 전환 시 article_id FK를 지우고 PK를 (summary_id, target_date)로 바꾼다.
+ORM은 summary_id만 PK로 알고 있어도 그대로 동작한다.
+"""
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+TABLE = "SummaryHistory"
+MAX_PARTITION = "pmax"
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    y, m = divmod(d.month - 1 + months, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def _partition_defs(months: List[date]) -> str:
+    defs = [
+        f"PARTITION {partition_name(m)} VALUES LESS THAN ('{add_months(m, 1).isoformat()}')"
+        for m in months
+    ]
+    defs.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return ", ".join(defs)
+
+
+def list_partitions(conn: Connection) -> List[str]:
+    return list(conn.execute(
+        text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ),
+        {"t": TABLE},
+    ).scalars())
+
+
+def partition_table(conn: Connection, months_ahead: int = 3, today: Optional[date] = None) -> List[str]:
+    """파티션이 없는 SummaryHistory를 월 파티션 테이블로 전환 (테이블 재작성이므로 점검 시간에 실행)"""
+    if list_partitions(conn):
+        return []
+    today = today or date.today()
+
+    fks = conn.execute(
+        text(
+            "SELECT CONSTRAINT_NAME FROM information_schema.KEY_COLUMN_USAGE "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND REFERENCED_TABLE_NAME IS NOT NULL"
+        ),
+        {"t": TABLE},
+    ).scalars().all()
+    for fk in fks:
+        print(f"[INFO] dropping foreign key {fk} (not allowed on partitioned tables)")
+        conn.execute(text(f"ALTER TABLE `{TABLE}` DROP FOREIGN KEY `{fk}`"))
+
+    conn.execute(text(f"ALTER TABLE `{TABLE}` DROP PRIMARY KEY, ADD PRIMARY KEY (summary_id, target_date)"))
+
+    oldest = conn.execute(text(f"SELECT MIN(target_date) FROM `{TABLE}`")).scalar() or today
+    months, m = [], month_start(oldest)
+    while m <= add_months(month_start(today), months_ahead):
+        months.append(m)
+        m = add_months(m, 1)
+    print(f"[INFO] partitioning {TABLE} into {len(months)} monthly partitions")
+    conn.execute(text(f"ALTER TABLE `{TABLE}` PARTITION BY RANGE COLUMNS(target_date) ({_partition_defs(months)})"))
+    return [partition_name(m) for m in months]
+
+
+def add_future_partitions(conn: Connection, months_ahead: int = 3, today: Optional[date] = None) -> List[str]:
+    """앞으로 months_ahead 개월치 파티션이 없으면 pmax를 쪼개서 추가"""
+    existing = list_partitions(conn)
+    if not existing:
+        return []
+    today = today or date.today()
+    months = [add_months(month_start(today), i) for i in range(months_ahead + 1)]
+    missing = [m for m in months if partition_name(m) not in existing]
+    # pmax 앞쪽(이미 있는 가장 늦은 달 이후)만 추가할 수 있음
+    latest = max((p for p in existing if p != MAX_PARTITION), default=None)
+    missing = [m for m in missing if latest is None or partition_name(m) > latest]
+    if missing:
+        conn.execute(text(
+            f"ALTER TABLE `{TABLE}` REORGANIZE PARTITION {MAX_PARTITION} INTO ({_partition_defs(missing)})"
+        ))
+    return [partition_name(m) for m in missing]
+
+
+def drop_empty_partitions_before(conn: Connection, horizon: date) -> List[str]:
+    """horizon 이전 달의 파티션 중 비어 있는 것만 삭제 (아카이브 후 호출)"""
+    dropped = []
+    for name in list_partitions(conn):
+        if name == MAX_PARTITION or name >= partition_name(month_start(horizon)):
+            continue
+        if conn.execute(text(f"SELECT 1 FROM `{TABLE}` PARTITION ({name}) LIMIT 1")).first() is None:
+            conn.execute(text(f"ALTER TABLE `{TABLE}` DROP PARTITION {name}"))
+            dropped.append(name)
+    return dropped
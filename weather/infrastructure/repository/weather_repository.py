@@ -1,15 +1,17 @@
 from datetime import date
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 
-from config.database.session import get_db_session
-from weather.infrastructure.orm.news_category_orm import NewsCategoryORM
+from config.database.session import db_session
 from weather.infrastructure.orm.summary_history_orm import SummaryHistoryORM
 from weather.infrastructure.orm.weather_data_orm import WeatherDataORM
+from weather.infrastructure.repository.category_registry import get_category_registry
 
 
 class WeatherRepository:
+    """요청 범위 AsyncSession(db_session)을 사용한다 (요청 밖에서는 호출마다 짧은 세션)"""
+
     __instance = None
 
     def __new__(cls, *args, **kwargs):
@@ -17,17 +19,13 @@ class WeatherRepository:
             cls.__instance = super().__new__(cls)
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, "db"):
-            self.db: Session = get_db_session()
-
     @classmethod
     def getInstance(cls):
         if cls.__instance is None:
             cls.__instance = cls()
         return cls.__instance
 
-    def save_weather_data(
+    async def save_weather_data(
         self,
         target_date: date,
         temperature: Optional[float],
@@ -35,21 +33,24 @@ class WeatherRepository:
         wind_speed: Optional[float],
         description: Optional[str],
         raw_json,
+        city: Optional[str] = None,
     ) -> WeatherDataORM:
         record = WeatherDataORM(
             date=target_date,
+            city=city,
             temperature=temperature,
             humidity=humidity,
             wind_speed=wind_speed,
             description=description,
             raw_json=raw_json,
         )
-        self.db.add(record)
-        self.db.commit()
-        self.db.refresh(record)
+        async with db_session() as db:
+            db.add(record)
+            await db.commit()
+            await db.refresh(record)
         return record
 
-    def save_summary(
+    async def save_summary(
         self,
         target_type: str,
         target_date: date,
@@ -64,37 +65,38 @@ class WeatherRepository:
             summary_text=summary_text,
             pdf_path=pdf_path,
         )
-        self.db.add(record)
-        self.db.commit()
-        self.db.refresh(record)
+        async with db_session() as db:
+            db.add(record)
+            await db.commit()
+            await db.refresh(record)
         return record
 
-    def get_latest_summary(
+    async def get_latest_summary(
         self,
         target_type: str,
         target_date: date,
         category_id: Optional[int] = None,
     ) -> Optional[SummaryHistoryORM]:
-        query = self.db.query(SummaryHistoryORM).filter(
+        stmt = select(SummaryHistoryORM).where(
             SummaryHistoryORM.target_type == target_type,
             SummaryHistoryORM.target_date == target_date,
         )
         if category_id is not None:
-            query = query.filter(SummaryHistoryORM.category_id == category_id)
-        return query.order_by(SummaryHistoryORM.created_at.desc()).first()
+            stmt = stmt.where(SummaryHistoryORM.category_id == category_id)
+        stmt = stmt.order_by(SummaryHistoryORM.created_at.desc()).limit(1)
+        async with db_session() as db:
+            return (await db.execute(stmt)).scalars().first()
 
-    def get_latest_weather_data(self, target_date: date) -> Optional[WeatherDataORM]:
-        return (
-            self.db.query(WeatherDataORM)
-            .filter(WeatherDataORM.date == target_date)
+    async def get_latest_weather_data(self, target_date: date, city: str) -> Optional[WeatherDataORM]:
+        # city가 없던 예전 행은 어느 도시 것인지 몰라 돌려주지 않는다
+        stmt = (
+            select(WeatherDataORM)
+            .where(WeatherDataORM.city == city, WeatherDataORM.date == target_date)
             .order_by(WeatherDataORM.created_at.desc())
-            .first()
+            .limit(1)
         )
+        async with db_session() as db:
+            return (await db.execute(stmt)).scalars().first()
 
-    def get_category_id_by_name(self, name: str) -> Optional[int]:
-        category = (
-            self.db.query(NewsCategoryORM)
-            .filter(NewsCategoryORM.category_name == name)
-            .first()
-        )
-        return category.category_id if category else None
+    async def get_category_id_by_name(self, name: str) -> Optional[int]:
+        return await get_category_registry().id_by_name(name)